@@ -0,0 +1,85 @@
+"""
+Shutdown time of a process with a large heap, with and without fast_exit.
+
+Each child enables tantrumpy, builds a heap of small dicts and lists and
+waits. The harness then makes it exit. It sends SIGINT or SIGTERM, or writes
+a line to stdin so the child raises an unhandled exception. It times from
+that moment until the child is reaped, and checks the exit status.
+
+Usage:
+    python benchmarks/bench_fast_exit.py [million objects] [runs]
+"""
+
+import os
+import signal
+import statistics
+import subprocess
+import sys
+import time
+
+SRC = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src")
+ENV = dict(os.environ, PYTHONPATH=SRC)
+for key in [k for k in ENV if k.startswith("TANTRUMPY_")]:
+    del ENV[key]
+
+CHILD = """
+import sys, tantrumpy
+tantrumpy.enable(mood="comic", fast_exit={fast})
+heap = [{{"id": i, "tags": [i, str(i)]}} for i in range({objects})]
+sys.stdout.write("ready\\n"); sys.stdout.flush()
+sys.stdin.readline()
+raise RuntimeError("stop")
+"""
+TRIGGERS = {
+    "SIGINT": (signal.SIGINT, 128 + signal.SIGINT),
+    "SIGTERM": (signal.SIGTERM, 128 + signal.SIGTERM),
+    "exception": (None, 1),
+}
+TIMEOUT = 120.0
+
+
+def shutdown(fast: bool, objects: int, trigger: str) -> float:
+    """Return seconds from the exit request to the child being reaped."""
+    child = subprocess.Popen(
+        [sys.executable, "-c", CHILD.format(fast=fast, objects=objects)],
+        env=ENV,
+        stdin=subprocess.PIPE,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.DEVNULL,
+        text=True,
+    )
+    assert child.stdin is not None and child.stdout is not None
+    child.stdout.readline()
+    signum, expected = TRIGGERS[trigger]
+    start = time.perf_counter()
+    if signum is None:
+        child.stdin.write("\n")
+        child.stdin.flush()
+    else:
+        os.kill(child.pid, signum)
+    try:
+        child.wait(timeout=TIMEOUT)
+    except subprocess.TimeoutExpired:
+        child.kill()
+        raise SystemExit(f"{trigger}: child did not exit within {TIMEOUT:.0f} s") from None
+    elapsed = time.perf_counter() - start
+    status = 128 - child.returncode if child.returncode < 0 else child.returncode
+    if status != expected:
+        raise SystemExit(f"{trigger}: exit status {status}, expected {expected}")
+    return elapsed
+
+
+def main() -> None:
+    objects = int(float(sys.argv[1]) * 1_000_000) if len(sys.argv) > 1 else 3_000_000
+    runs = int(sys.argv[2]) if len(sys.argv) > 2 else 3
+
+    print(f"heap: {objects:,} dicts, each holding a list and a str")
+    print(f"{'trigger':10} {'teardown':>12} {'fast_exit':>12} {'saved':>8}")
+    for trigger in TRIGGERS:
+        slow = statistics.median(shutdown(False, objects, trigger) for _ in range(runs))
+        fast = statistics.median(shutdown(True, objects, trigger) for _ in range(runs))
+        print(f"{trigger:10} {slow * 1000:9.0f} ms {fast * 1000:9.0f} ms {1 - fast / slow:7.0%}")
+
+
+if __name__ == "__main__":
+    main()
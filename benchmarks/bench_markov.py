@@ -0,0 +1,95 @@
+"""
+Generative mood benchmark — what mood="generative" costs on the exit path.
+
+Reports, for the built-in corpus:
+  - training time, and the model's size in its compact arrays
+  - disk cache save/load time
+  - per-line generation latency (p50/p99) and how often a walk is rejected
+    (exact duplicate of a training message, or longer than MAX_WORDS)
+  - first pick("generative") in a fresh interpreter, cold vs. warm disk cache
+
+Usage:
+    python benchmarks/bench_markov.py [lines]
+"""
+
+import os
+import random
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+SRC = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src")
+sys.path.insert(0, SRC)
+
+from tantrumpy import markov, messages  # noqa: E402
+
+# Imports and the registry are warmed first: only the pick itself is timed
+PROBE = """
+import sys, time
+from tantrumpy import picker
+picker.all_moods()
+start = time.perf_counter()
+picker.pick(sys.argv[1])
+print((time.perf_counter() - start) * 1000)
+"""
+
+
+def timed(fn, *args):
+    start = time.perf_counter()
+    result = fn(*args)
+    return result, (time.perf_counter() - start) * 1000
+
+
+def fresh_pick_ms(cache: str, mood: str = "generative") -> float:
+    env = dict(os.environ, PYTHONPATH=SRC, TANTRUMPY_CACHE_DIR=cache)
+    out = subprocess.run(
+        [sys.executable, "-c", PROBE, mood], env=env, capture_output=True, text=True, check=True
+    )
+    return float(out.stdout)
+
+
+def main() -> None:
+    lines = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+    corpus = [m for mood in messages.EMOJI for m in messages.load(mood)]
+
+    model, train_ms = timed(markov.train, corpus)
+    size = model.offsets.itemsize * len(model.offsets)
+    size += model.successors.itemsize * len(model.successors)
+    print(f"corpus                   {len(corpus)} messages, {len(model.vocab)} words")
+    print(f"train                    {train_ms:8.3f} ms")
+    print(f"transition arrays        {size} bytes ({model.successors.typecode!r} successors)")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "model.bin")
+        _, save_ms = timed(markov.save, model, path)
+        _, load_ms = timed(markov.load, path, model.key)
+        print(f"cache save / load        {save_ms:8.3f} / {load_ms:.3f} ms")
+
+        rng = random.Random(0)
+        samples, none = [], 0
+        for _ in range(lines):
+            line, ms = timed(markov.generate, model, rng, markov.MAX_WORDS, 1)
+            if line is None:
+                none += 1
+            else:
+                samples.append(ms * 1000)
+        pct = statistics.quantiles(samples, n=100)
+        print(f"generate (one walk)      p50 {pct[49]:.1f} us, p99 {pct[98]:.1f} us")
+        print(f"walks rejected           {none / lines:8.1%}")
+
+        full = [timed(markov.generate, model, rng)[1] * 1000 for _ in range(lines)]
+        print(f"generate (with retries)  p99 {statistics.quantiles(full, n=100)[98]:.1f} us")
+
+        cache = os.path.join(tmp, "cache")
+        cold = statistics.median(fresh_pick_ms(os.path.join(tmp, f"cold-{i}")) for i in range(5))
+        fresh_pick_ms(cache)
+        warm = statistics.median(fresh_pick_ms(cache) for _ in range(5))
+        comic = statistics.median(fresh_pick_ms(cache, "comic") for _ in range(5))
+        print(f"first pick, fresh proc   cold {cold:.2f} ms, warm cache {warm:.2f} ms")
+        print(f"  (pick('comic') for comparison: {comic:.2f} ms)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+"""
+Mood-pack discovery benchmark — cold entry-point scan vs. the cached index.
+
+Builds a throwaway site-packages with N fake distributions (one of which
+publishes a mood), then times, in fresh interpreters:
+  - a cold index build (importlib.metadata scan + cache write)
+  - a warm index lookup (stat site-packages + read the cached JSON)
+
+Usage:
+    python benchmarks/bench_plugins.py [distributions] [runs]
+"""
+
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+
+SRC = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src")
+
+PROBE = """
+import sys, time
+from tantrumpy import plugins
+plugins.site_dirs = lambda: [sys.argv[1]]
+start = time.perf_counter()
+moods = plugins.moods()
+print((time.perf_counter() - start) * 1000, len(moods))
+"""
+
+
+def build_site(root: str, count: int) -> None:
+    for i in range(count):
+        dist = os.path.join(root, f"pkg{i}-1.0.dist-info")
+        os.makedirs(dist)
+        with open(os.path.join(dist, "METADATA"), "w") as f:
+            f.write(f"Metadata-Version: 2.1\nName: pkg{i}\nVersion: 1.0\n")
+        with open(os.path.join(dist, "entry_points.txt"), "w") as f:
+            f.write("[console_scripts]\npkg = pkg:main\n")
+            if i == count // 2:
+                f.write("\n[tantrumpy.moods]\ncorporate = pkg:CORPORATE\n")
+
+
+def probe(site: str, cache: str) -> float:
+    env = dict(os.environ, PYTHONPATH=SRC, TANTRUMPY_CACHE_DIR=cache)
+    out = subprocess.run(
+        [sys.executable, "-c", PROBE, site], env=env, capture_output=True, text=True, check=True
+    ).stdout.split()
+    assert out[1] == "1", out
+    return float(out[0])
+
+
+def main() -> None:
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 1000
+    runs = int(sys.argv[2]) if len(sys.argv) > 2 else 10
+    with tempfile.TemporaryDirectory() as tmp:
+        site = os.path.join(tmp, "site-packages")
+        cache = os.path.join(tmp, "cache")
+        build_site(site, count)
+
+        cold, warm = [], []
+        for _ in range(runs):
+            for name in os.listdir(cache) if os.path.isdir(cache) else []:
+                os.unlink(os.path.join(cache, name))
+            cold.append(probe(site, cache))
+            warm.append(probe(site, cache))
+
+    print(f"distributions            {count}")
+    print(f"cold scan + cache write  {statistics.median(cold):8.2f} ms (median of {runs})")
+    print(f"warm cached index        {statistics.median(warm):8.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,71 @@
+"""
+Overhead of the sampling profiler on a CPU-bound workload.
+
+Runs a pure-Python workload with no sampler, then with a Sampler at several
+intervals. Runs are interleaved, and the order rotates every round, so drift
+in machine speed hits every variant equally. Time is process CPU time, which
+includes the sampler thread and is far less noisy than wall time on a shared
+machine. The overhead is the best sampled run over the best unsampled run.
+The sampler's own CPU share, as it reports it under the tantrum, is shown
+next to it.
+
+Usage:
+    python benchmarks/bench_profiler.py [rounds]
+"""
+
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+
+from tantrumpy.profiler import DEFAULT_INTERVAL, Sampler  # noqa: E402
+
+INTERVALS = [DEFAULT_INTERVAL, 0.005, 0.001]
+
+
+def workload() -> int:
+    total = 0
+    for i in range(10_000_000):
+        total += (i * i) % 7
+    return total
+
+
+def timed(interval: "float | None") -> "tuple[float, float]":
+    """Run the workload once; return (seconds, sampler CPU share)."""
+    sampler = Sampler(interval) if interval else None
+    if sampler:
+        sampler.start()
+    start = time.process_time()
+    workload()
+    elapsed = time.process_time() - start
+    if sampler:
+        sampler.stop()
+        return elapsed, sampler.cpu / elapsed
+    return elapsed, 0.0
+
+
+def main() -> None:
+    rounds = int(sys.argv[1]) if len(sys.argv) > 1 else 7
+    variants = [None, *INTERVALS]
+    best = {v: float("inf") for v in variants}
+    cost = {v: 0.0 for v in variants}
+    for round_ in range(rounds):
+        shift = round_ % len(variants)
+        for variant in variants[shift:] + variants[:shift]:
+            elapsed, share = timed(variant)
+            best[variant] = min(best[variant], elapsed)
+            cost[variant] += share / rounds
+
+    base = best[None]
+    print(f"workload, no sampler     {base * 1000:8.1f} ms (best of {rounds})")
+    for interval in INTERVALS:
+        label = f"{1 / interval:.0f} Hz" + (" (default)" if interval == DEFAULT_INTERVAL else "")
+        print(
+            f"sampler {label:16} {best[interval] * 1000:8.1f} ms   "
+            f"overhead {best[interval] / base - 1:+6.2%}   self-reported {cost[interval]:6.2%}"
+        )
+
+
+if __name__ == "__main__":
+    main()
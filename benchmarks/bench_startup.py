@@ -0,0 +1,111 @@
+"""
+Startup benchmark — what the .pth autoload hook adds to `python -c pass`.
+
+Builds a throwaway venv with tantrumpy on its path and the autoload hook
+installed, then times interpreter startup three ways:
+
+  baseline   hook not installed
+  inert      hook installed, TANTRUMPY_AUTOLOAD unset
+  active     hook installed, TANTRUMPY_AUTOLOAD=1
+
+Startup is timed with `os._exit(0)` so the deferred exit work is excluded; a
+fourth row shows a normal `pass` run, where the tantrum loads and fires.
+
+It also lists every module the active hook imports at startup, which should
+be tantrumpy, tantrumpy.autoload and the builtin atexit module — nothing else.
+
+Usage:
+    python benchmarks/bench_startup.py [runs]
+"""
+
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import venv
+
+SRC = os.path.abspath(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+
+
+# `os._exit` skips atexit, isolating startup cost from the deferred exit work
+STARTUP_ONLY = "import os; os._exit(0)"
+FULL_RUN = "pass"
+
+
+def run_ms(python: str, code: str, env: dict) -> float:
+    start = time.perf_counter()
+    subprocess.run(
+        [python, "-c", code],
+        env=env,
+        check=True,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+    return (time.perf_counter() - start) * 1000
+
+
+def modules(python: str, env: dict) -> set:
+    out = subprocess.run(
+        [python, "-c", "import sys; print(' '.join(sys.modules))"],
+        env=env,
+        check=True,
+        capture_output=True,
+        text=True,
+    )
+    return set(out.stdout.split())
+
+
+def main() -> None:
+    runs = int(sys.argv[1]) if len(sys.argv) > 1 else 50
+    env = {k: v for k, v in os.environ.items() if not k.startswith(("PYTHON", "TANTRUMPY_"))}
+    active_env = dict(env, TANTRUMPY_AUTOLOAD="1")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        venv.create(tmp, with_pip=False)
+        python = os.path.join(tmp, "bin", "python")
+        site_packages = subprocess.run(
+            [python, "-c", "import sysconfig; print(sysconfig.get_paths()['purelib'])"],
+            check=True,
+            capture_output=True,
+            text=True,
+        ).stdout.strip()
+        # .pth files run in name order: the path entry must precede the hook
+        with open(os.path.join(site_packages, "00-tantrumpy-src.pth"), "w") as f:
+            f.write(SRC + "\n")
+        subprocess.run([python, "-m", "compileall", "-q", SRC], check=True)
+        hook = os.path.join(site_packages, "tantrumpy-autoload.pth")
+        subprocess.run(
+            [python, "-m", "tantrumpy", "autoload", "install"],
+            env=env,
+            check=True,
+            stdout=subprocess.DEVNULL,
+        )
+        with open(hook) as f:
+            hook_line = f.read()
+
+        # Interleave scenarios so drift in machine load hits all of them equally
+        samples: dict = {name: [] for name in ("baseline", "inert", "active", "exit")}
+        for _ in range(runs):
+            os.rename(hook, hook + ".off")
+            samples["baseline"].append(run_ms(python, STARTUP_ONLY, env))
+            os.rename(hook + ".off", hook)
+            samples["inert"].append(run_ms(python, STARTUP_ONLY, env))
+            samples["active"].append(run_ms(python, STARTUP_ONLY, active_env))
+            samples["exit"].append(run_ms(python, FULL_RUN, active_env))
+
+        added = sorted(modules(python, active_env) - modules(python, env))
+
+    med = {name: statistics.median(values) for name, values in samples.items()}
+    base = med["baseline"]
+    print(f"hook: {hook_line.strip()}")
+    print(f"startup, no hook              {base:7.2f} ms (median of {runs})")
+    print(f"startup, hook + env unset     {med['inert']:7.2f} ms ({med['inert'] - base:+.2f} ms)")
+    print(f"startup, hook + env set       {med['active']:7.2f} ms ({med['active'] - base:+.2f} ms)")
+    print(f"full run incl. exit tantrum   {med['exit']:7.2f} ms ({med['exit'] - base:+.2f} ms)")
+    print(f"modules imported at startup   {' '.join(added)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,57 @@
+"""
+Supervisor benchmark — what `python -m tantrumpy run` costs around a command.
+
+Reports:
+  - wall time of a trivial child run directly vs. under the supervisor
+  - the supervisor's peak RSS (the child is `true`, so the peak is ours)
+  - whether the child process loaded tantrumpy (it must not)
+
+Usage:
+    python benchmarks/bench_supervisor.py [runs]
+"""
+
+import os
+import resource
+import statistics
+import subprocess
+import sys
+import time
+
+SRC = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src")
+ENV = dict(os.environ, PYTHONPATH=SRC, TANTRUMPY_SILENT="1")
+SUPERVISE = [sys.executable, "-m", "tantrumpy", "run", "--"]
+
+
+def wall_ms(cmd, runs: int) -> float:
+    samples = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        subprocess.run(cmd, env=ENV, check=False)
+        samples.append((time.perf_counter() - start) * 1000)
+    return statistics.median(samples)
+
+
+def main() -> None:
+    runs = int(sys.argv[1]) if len(sys.argv) > 1 else 20
+
+    bare = wall_ms(["true"], runs)
+    python = wall_ms([sys.executable, "-c", "pass"], runs)
+    supervised = wall_ms(SUPERVISE + ["true"], runs)
+    print(f"true, direct                 {bare:8.2f} ms (median of {runs})")
+    print(f"python -c pass, direct       {python:8.2f} ms")
+    print(f"true, under supervisor       {supervised:8.2f} ms")
+    print(f"supervisor overhead          {supervised - bare:8.2f} ms")
+
+    # ru_maxrss of waited-for descendants: the supervisor dominates `true`
+    subprocess.run(SUPERVISE + ["true"], env=ENV, check=True)
+    peak = resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss
+    unit = "bytes" if sys.platform == "darwin" else "KiB"
+    print(f"supervisor peak RSS          {peak:8d} {unit}")
+
+    probe = "import sys; sys.exit(3 if any(m.startswith('tantrumpy') for m in sys.modules) else 0)"
+    status = subprocess.run(SUPERVISE + [sys.executable, "-c", probe], env=ENV).returncode
+    print(f"child imported tantrumpy     {'yes' if status == 3 else 'no'}")
+
+
+if __name__ == "__main__":
+    main()
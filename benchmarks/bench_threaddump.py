@@ -0,0 +1,83 @@
+"""
+Cost of the thread dump on the exit path.
+
+Starts a pool of parked threads with a few distinct stacks of realistic depth,
+then times capture() (reading and grouping every stack) and render() plus the
+bounded write, separately. It reports the median of many runs, and the size
+of the dump next to what faulthandler.dump_traceback(all_threads=True) writes
+for the same threads.
+
+Usage:
+    python benchmarks/bench_threaddump.py [threads] [depth]
+"""
+
+import faulthandler
+import io
+import os
+import statistics
+import sys
+import tempfile
+import threading
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+
+from tantrumpy import threaddump  # noqa: E402
+from tantrumpy.config import Config  # noqa: E402
+
+STACK_KINDS = 4
+RUNS = 200
+
+
+def park(depth: int, event: threading.Event) -> None:
+    if depth:
+        park(depth - 1, event)
+    else:
+        event.wait()
+
+
+def median_us(func) -> float:
+    times = []
+    for _ in range(RUNS):
+        start = time.perf_counter()
+        func()
+        times.append(time.perf_counter() - start)
+    return statistics.median(times) * 1e6
+
+
+def main() -> None:
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    depth = int(sys.argv[2]) if len(sys.argv) > 2 else 30
+    event = threading.Event()
+    threads = [
+        threading.Thread(target=park, args=(depth + i % STACK_KINDS, event), daemon=True)
+        for i in range(count)
+    ]
+    for t in threads:
+        t.start()
+    time.sleep(0.5)  # let every thread park
+
+    defaults = Config()
+    groups = threaddump.capture()
+
+    def render() -> None:
+        threaddump.write(io.StringIO(), defaults.thread_dump_frames, defaults.thread_dump_max_bytes)
+
+    capture_us = median_us(threaddump.capture)
+    total_us = median_us(render)
+    out = io.StringIO()
+    threaddump.write(out, defaults.thread_dump_frames, defaults.thread_dump_max_bytes)
+    with tempfile.TemporaryFile() as f:
+        faulthandler.dump_traceback(f, all_threads=True)
+        faulthandler_bytes = f.tell()
+
+    print(f"threads                  {count + 1} ({len(groups)} distinct stacks, depth ~{depth})")
+    print(f"capture                  {capture_us:8.0f} us (median of {RUNS})")
+    print(f"capture + render + write {total_us:8.0f} us")
+    print(f"dump size                {len(out.getvalue().encode()):8d} bytes")
+    print(f"faulthandler size        {faulthandler_bytes:8d} bytes (truncated at 100 threads)")
+    event.set()
+
+
+if __name__ == "__main__":
+    main()
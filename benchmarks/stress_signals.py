@@ -0,0 +1,129 @@
+"""
+Signal-storm stress harness — bursts of mixed SIGTERM/SIGINT at tantrumpy'd children.
+
+Each child enables tantrumpy (verbose, so the trigger is printed) and idles.
+It then gets a burst of SIGTERM and SIGINT signals a few hundred microseconds
+apart. For every child the harness checks:
+  - exactly one complete tantrum line on stderr
+  - the exit status is 128 + signum of a signal that was sent
+  - the child died within the timeout
+
+It reports the failures and the kill latency percentiles, measured from the
+first signal to the child being reaped.
+
+Usage:
+    python benchmarks/stress_signals.py [children] [burst]
+"""
+
+import os
+import random
+import re
+import signal
+import statistics
+import subprocess
+import sys
+import threading
+import time
+
+SRC = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src")
+ENV = dict(os.environ, PYTHONPATH=SRC)
+for key in [k for k in ENV if k.startswith("TANTRUMPY_")]:
+    del ENV[key]
+
+CHILD = """
+import sys, time, tantrumpy
+tantrumpy.enable(verbose=True)
+sys.stdout.write("ready\\n"); sys.stdout.flush()
+while True:
+    time.sleep(0.0001)
+"""
+LINE = re.compile(r"\[exit via: (SIGINT \(Ctrl\+C\)|SIGTERM)\]")
+TRIGGERS = {"SIGINT (Ctrl+C)": signal.SIGINT, "SIGTERM": signal.SIGTERM}
+PARALLEL = 8
+TIMEOUT = 10.0
+
+
+def spawn() -> subprocess.Popen:
+    child = subprocess.Popen(
+        [sys.executable, "-c", CHILD],
+        env=ENV,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        text=True,
+    )
+    assert child.stdout is not None
+    child.stdout.readline()  # wait until the hooks are installed
+    return child
+
+
+def reap(child: subprocess.Popen, result: dict) -> None:
+    try:
+        result["err"] = child.communicate(timeout=TIMEOUT)[1]
+    except subprocess.TimeoutExpired:
+        child.kill()
+        child.communicate()
+    result["end"] = time.perf_counter()
+
+
+def storm(child: subprocess.Popen, burst: int, rng: random.Random) -> "tuple[float, str]":
+    """Signal child in a burst; return (kill latency in ms, problem or "")."""
+    result: dict = {}
+    waiter = threading.Thread(target=reap, args=(child, result))
+    waiter.start()
+
+    sent = [rng.choice((signal.SIGTERM, signal.SIGINT)) for _ in range(burst)]
+    start = time.perf_counter()
+    for signum in sent:
+        try:
+            os.kill(child.pid, signum)
+        except ProcessLookupError:
+            break  # already reaped: the rest of the burst is moot
+        time.sleep(rng.uniform(0, 0.0005))
+    waiter.join()
+
+    latency = (result["end"] - start) * 1000
+    if "err" not in result:
+        return latency, "did not exit"
+    lines = LINE.findall(result["err"])
+    status = 128 - child.returncode if child.returncode < 0 else child.returncode
+    if len(lines) != 1:
+        return latency, f"{len(lines)} tantrum lines"
+    if status - 128 not in sent:
+        return latency, f"exit status {status} for signals {sorted(set(sent))}"
+    if TRIGGERS[lines[0]] not in sent:
+        return latency, f"trigger {lines[0]} was never sent"
+    return latency, ""
+
+
+def main() -> None:
+    children = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    burst = int(sys.argv[2]) if len(sys.argv) > 2 else 10
+    rng = random.Random(0)
+
+    latencies, failures = [], []
+    done = 0
+    while done < children:
+        # Spawn ahead so interpreter startup overlaps; signal one child at a time
+        batch = [spawn() for _ in range(min(PARALLEL, children - done))]
+        for child in batch:
+            latency, problem = storm(child, burst, rng)
+            latencies.append(latency)
+            if problem:
+                failures.append(problem)
+        done += len(batch)
+
+    pct = statistics.quantiles(latencies, n=100) if len(latencies) > 1 else latencies * 99
+    print(f"children                {children}")
+    print(f"signals sent            {children * burst} (bursts of {burst})")
+    print(f"kill latency p50        {pct[49]:8.2f} ms")
+    print(f"kill latency p90        {pct[89]:8.2f} ms")
+    print(f"kill latency p99        {pct[98]:8.2f} ms")
+    print(f"kill latency max        {max(latencies):8.2f} ms")
+    print(f"failures                {len(failures)}")
+    for problem in sorted(set(failures)):
+        print(f"  {failures.count(problem):5d} × {problem}")
+    sys.exit(1 if failures else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -7,37 +7,116 @@ Drop one line into any Python app and give it a voice on exit.
     tantrumpy.enable()
 
 That's it.
+
+Importing the package is deliberately free: submodules (and typing) are only
+loaded when a function below is called, so tantrumpy.autoload can activate
+from a .pth file without slowing down interpreter startup.
 """
 
-from typing import Dict, List
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    from typing import Any, Callable, Dict, List, Optional, Union
 
-from tantrumpy import picker as _picker
-from tantrumpy.handler import _handler
-from tantrumpy.messages import MoodBank
+    from tantrumpy.dedupe import Deduper, DedupeReport
+    from tantrumpy.messages import MoodBank
 
 __version__ = "1.0.0"
-__all__ = ["enable", "disable", "add_messages"]
+__all__ = ["enable", "disable", "add_messages", "register_critical"]
+
+_SUBMODULES = frozenset(
+    {
+        "autoload",
+        "colors",
+        "config",
+        "dedupe",
+        "fastexit",
+        "handler",
+        "markov",
+        "messages",
+        "metrics",
+        "output",
+        "picker",
+        "plugins",
+        "profiler",
+        "rng",
+        "supervisor",
+        "testing",
+        "threaddump",
+        "tracebacks",
+        "width",
+    }
+)
 
 # Internal custom mood storage — MoodBank keeps emoji + messages together
-_custom_banks: Dict[str, MoodBank] = {}
-
-
-def enable(mood: str = "random", verbose: bool = False) -> None:
+_custom_banks: "Dict[str, MoodBank]" = {}
+# mood -> the Deduper that has seen its whole bank, kept so batches don't re-index it
+_dedupers: "Dict[str, Deduper]" = {}
+
+
+def __getattr__(name: str) -> object:
+    # Keep `tantrumpy.picker`-style attribute access working without eager imports
+    if name in _SUBMODULES:
+        return __import__(f"tantrumpy.{name}", fromlist=["_"])
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def enable(
+    mood: str = "random",
+    verbose: bool = False,
+    compact_traceback: bool = False,
+    metrics_dir: str = "",
+    fast_exit: bool = False,
+    profile: bool = False,
+    thread_dump: bool = False,
+    seed: "Optional[Union[int, str]]" = None,
+) -> None:
     """
     Activate tantrumpy — register all exit hooks.
 
     Args:
         mood:    Which mood to use on exit. One of: "frustrated", "rude",
                  "comic", "cringe", "philosophy", "dramatic", "random",
+                 "generative" (new lines invented from the banks),
                  or any custom mood added via add_messages().
                  Defaults to "random".
         verbose: If True, appends the exit trigger type to the message
                  e.g. "  [exit via: SIGINT (Ctrl+C)]"
+        compact_traceback: If True, unhandled exceptions are rendered
+                 compactly instead of via sys.excepthook: recursive frames
+                 are collapsed, ExceptionGroups summarized, and output is
+                 capped at traceback_max_bytes (see config). An excepthook
+                 installed by the app is still called instead.
+        metrics_dir: A node_exporter textfile-collector directory. Each exit
+                 appends to a per-process shard there; run
+                 `python -m tantrumpy metrics merge` to update tantrumpy.prom.
+        fast_exit: If True, a SIGINT/SIGTERM or unhandled exception ends the
+                 process with os._exit() right after the tantrum instead of
+                 tearing the interpreter down: status is 128 + signum for
+                 signals and 1 for exceptions. Only callbacks registered with
+                 register_critical() run; ordinary atexit callbacks don't.
+                 sys.exit() and the end of the script exit normally.
+        profile: If True, sample every thread's stack in the background
+                 (100 Hz by default, see profile_interval in config) and
+                 list the hottest functions under the tantrum.
+        thread_dump: If True, a SIGINT/SIGTERM tantrum is followed by every
+                 thread's stack, grouped by identical stacks and trimmed
+                 (see thread_dump_frames / thread_dump_max_bytes in config).
+        seed:    Seed for tantrumpy's own random generator, making mood and
+                 message picks reproducible. Forked children derive distinct
+                 streams from it. The global random module is never touched.
     """
+    from tantrumpy.handler import _handler
+
     _handler.enable(
         mood=mood,
         verbose=verbose,
         custom=_custom_banks if _custom_banks else None,
+        compact_traceback=compact_traceback,
+        metrics_dir=metrics_dir,
+        fast_exit=fast_exit,
+        profile=profile,
+        thread_dump=thread_dump,
+        seed=seed,
     )
 
 
@@ -47,22 +126,50 @@ def disable() -> None:
 
     Safe to call even if enable() was never called.
     """
+    from tantrumpy.handler import _handler
+
     _handler.disable()
 
 
-def add_messages(mood: str, messages: List[str], emoji: str = "") -> None:
+def register_critical(func: "Callable[..., Any]", *args: "Any", **kwargs: "Any") -> "Any":
+    """
+    Register func(*args, **kwargs) to run before a fast exit (see enable()).
+
+    Critical callbacks run last-registered first, before stdio is flushed.
+    Use them for what must not be lost, e.g. closing a journal file. Returns
+    func, so this also works as a decorator.
+    """
+    from tantrumpy import fastexit as _fastexit
+
+    return _fastexit.register_critical(func, *args, **kwargs)
+
+
+def add_messages(
+    mood: str,
+    messages: "List[str]",
+    emoji: str = "",
+    similarity: "Optional[float]" = 0.8,
+) -> "DedupeReport":
     """
     Add custom messages to a mood bank.
 
     Creates a new mood if it doesn't exist, or appends to an existing one.
     Call this before enable() for messages to take effect.
 
+    Duplicates are dropped: exact copies, and near copies that differ only by
+    case, punctuation or a typo, of each other or of messages already in the
+    mood (see tantrumpy.dedupe). The returned report lists what was kept and
+    what was dropped.
+
     Args:
         mood:     The mood key (e.g. "boss", "corporate", or an existing mood).
         messages: List of message strings to add.
         emoji:    Optional emoji prefix for this mood (e.g. "📋").
                   Defaults to "" (no emoji). Ignored when appending to a
                   mood that already has an emoji unless explicitly overriding.
+        similarity: Jaccard similarity (0-1] of character 4-grams at which
+                  a message counts as a near duplicate. None only drops
+                  exact duplicates. Defaults to 0.8.
 
     Example:
         tantrumpy.add_messages("corporate", [
@@ -78,12 +185,28 @@ def add_messages(mood: str, messages: List[str], emoji: str = "") -> None:
     if not all(isinstance(m, str) and m.strip() for m in messages):
         raise ValueError("All items in messages must be non-empty strings.")
 
+    from tantrumpy import dedupe as _dedupe
+    from tantrumpy import messages as _messages
+
+    deduper = _dedupers.get(mood)
+    if deduper is None or deduper.similarity != similarity:
+        deduper = _dedupe.Deduper(similarity)
+        if mood in _messages.EMOJI:
+            deduper.seed(_messages.load(mood))
+        if mood in _custom_banks:
+            deduper.seed(_custom_banks[mood]["messages"])
+        _dedupers[mood] = deduper
+    report = deduper.run(messages)
+
     if mood in _custom_banks:
-        _custom_banks[mood]["messages"].extend(messages)
+        _custom_banks[mood]["messages"].extend(report.kept)
         if emoji:
             _custom_banks[mood]["emoji"] = emoji
     else:
-        _custom_banks[mood] = {"emoji": emoji, "messages": list(messages)}
+        _custom_banks[mood] = {"emoji": emoji, "messages": list(report.kept)}
 
     # Refresh registry so picker knows about the updated mood
+    from tantrumpy import picker as _picker
+
     _picker.reset()
+    return report
@@ -0,0 +1,111 @@
+"""
+Command-line entry point — python -m tantrumpy <command>.
+
+Commands:
+  run [--mood MOOD] [--verbose] -- CMD [ARGS...]
+      Run CMD as a child process and throw its tantrum when it exits.
+  autoload {install,uninstall,status} [--user]
+      Manage the .pth hook that enables tantrumpy in every interpreter
+      started with TANTRUMPY_AUTOLOAD=1.
+  metrics merge [--dir DIR]
+      Fold per-process exit shards into DIR/tantrumpy.prom for the
+      node_exporter textfile collector (DIR defaults to metrics_dir).
+"""
+
+import argparse
+import os
+import sys
+from typing import List, Optional
+
+
+def _parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="python -m tantrumpy",
+        description="Your app's last words, from the outside.",
+    )
+    commands = parser.add_subparsers(dest="command", metavar="command")
+    commands.required = True
+
+    run = commands.add_parser(
+        "run",
+        help="run a command and throw its tantrum when it exits",
+        description="Run CMD as a child process; it never imports tantrumpy.",
+    )
+    run.add_argument(
+        "--mood",
+        help='mood to use, or "auto" to pick one from the exit status (default)',
+    )
+    run.add_argument(
+        "--verbose", action="store_true", default=None, help="show how the child exited"
+    )
+    run.add_argument("cmd", nargs=argparse.REMAINDER, help="-- CMD [ARGS...]")
+
+    autoload = commands.add_parser(
+        "autoload",
+        help="manage the opt-in .pth activation hook",
+        description="Install a .pth hook that enables tantrumpy in every interpreter "
+        "started with TANTRUMPY_AUTOLOAD=1.",
+    )
+    autoload.add_argument("action", choices=["install", "uninstall", "status"])
+    autoload.add_argument(
+        "--user", action="store_true", help="use the user site-packages directory"
+    )
+
+    metrics = commands.add_parser(
+        "metrics",
+        help="manage Prometheus textfile-collector exit counters",
+        description="Fold per-process exit shards into tantrumpy.prom.",
+    )
+    metrics.add_argument("action", choices=["merge"])
+    metrics.add_argument(
+        "--dir", help="textfile-collector directory (default: the metrics_dir setting)"
+    )
+    return parser
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = _parser()
+    args = parser.parse_args(argv)
+
+    if args.command == "run":
+        cmd = args.cmd[1:] if args.cmd[:1] == ["--"] else args.cmd
+        if not cmd:
+            parser.error("run: missing command (usage: run -- CMD [ARGS...])")
+        from tantrumpy.supervisor import run
+
+        return run(cmd, mood=args.mood, verbose=args.verbose)
+
+    if args.command == "autoload":
+        from tantrumpy import autoload
+
+        if args.action == "install":
+            print(f"installed {autoload.install(args.user)}")
+            print(f"set {autoload.ENV}=1 to activate")
+        elif args.action == "uninstall":
+            removed = autoload.uninstall(args.user)
+            print(f"removed {autoload.pth_path(args.user)}" if removed else "not installed")
+        else:
+            path = autoload.pth_path(args.user)
+            print(f"{path}: {'installed' if os.path.exists(path) else 'not installed'}")
+        return 0
+
+    if args.command == "metrics":
+        from tantrumpy import config, metrics
+
+        directory = args.dir or config.load().metrics_dir
+        if not directory:
+            parser.error("metrics: no directory (pass --dir or set TANTRUMPY_METRICS_DIR)")
+        try:
+            path, merged = metrics.merge(directory)
+        except OSError as exc:
+            print(f"metrics merge failed: {exc}", file=sys.stderr)
+            return 1
+        print(f"merged {merged} shard{'' if merged == 1 else 's'} into {path}")
+        return 0
+
+    parser.error(f"unknown command: {args.command}")  # pragma: no cover
+    return 2  # pragma: no cover
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,140 @@
+"""
+Zero-touch activation — enable tantrumpy in every interpreter via a .pth hook.
+
+    python -m tantrumpy autoload install     # writes tantrumpy-autoload.pth
+    export TANTRUMPY_AUTOLOAD=1              # opt in, per environment or process
+
+With the hook installed and the variable set, `site` calls activate() at
+interpreter startup. activate() only swaps in stub hooks. It imports nothing
+but the builtin atexit and _signal modules, both of which are effectively
+free. handler, picker, messages, colors and the config files are loaded the
+first time an exit actually fires, when the stubs hand over to the real
+TantrumHandler.
+
+The same one-liner (PTH_LINE) also works from a sitecustomize.py.
+
+This module must stay import-light: no typing, no signal (which pulls in
+enum), and no other tantrumpy modules at import time.
+"""
+
+import _signal  # pyright: ignore[reportMissingImports]
+import atexit
+import os
+import sys
+
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    import types
+    from typing import Any, Callable, Optional
+
+    from tantrumpy.handler import TantrumHandler
+
+ENV = "TANTRUMPY_AUTOLOAD"
+PTH_NAME = "tantrumpy-autoload.pth"
+PTH_LINE = (
+    "import os; "
+    f'os.environ.get("{ENV}", "0") not in ("", "0") and '
+    '__import__("tantrumpy.autoload").autoload.activate()\n'
+)
+
+_active = False
+_orig_sigint: "Any" = None
+_orig_sigterm: "Any" = None
+_orig_excepthook: "Callable[..., None]" = sys.__excepthook__
+
+
+def is_active() -> bool:
+    """Return True while the startup stubs are installed."""
+    return _active
+
+
+def activate() -> None:
+    """Install stub exit hooks. Safe to call more than once."""
+    global _active, _orig_sigint, _orig_sigterm, _orig_excepthook
+    if _active:
+        return
+    _orig_sigint = _signal.getsignal(_signal.SIGINT)
+    _orig_sigterm = _signal.getsignal(_signal.SIGTERM)
+    _orig_excepthook = sys.excepthook
+
+    _signal.signal(_signal.SIGINT, _on_signal)
+    _signal.signal(_signal.SIGTERM, _on_signal)
+    sys.excepthook = _on_exception
+    atexit.register(_on_atexit)
+    _active = True
+
+
+def deactivate() -> None:
+    """Remove the stubs and restore whatever they replaced."""
+    global _active
+    if not _active:
+        return
+    _signal.signal(_signal.SIGINT, _orig_sigint)
+    _signal.signal(_signal.SIGTERM, _orig_sigterm)
+    sys.excepthook = _orig_excepthook
+    atexit.unregister(_on_atexit)
+    _active = False
+
+
+def _take_over() -> "TantrumHandler":
+    """Load the real handler and let it adopt the hooks the stubs replaced."""
+    from tantrumpy.handler import _handler
+
+    if not _handler._active:
+        _handler.adopt(_orig_sigint, _orig_sigterm, _orig_excepthook)
+    return _handler
+
+
+def _on_signal(signum: int, frame: "Optional[types.FrameType]") -> None:
+    handler = _take_over()
+    if signum == _signal.SIGINT:
+        handler._on_sigint(signum, frame)
+    else:
+        handler._on_sigterm(signum, frame)
+
+
+def _on_exception(
+    exc_type: type,
+    exc_value: BaseException,
+    exc_tb: "Optional[types.TracebackType]",
+) -> None:
+    _take_over()._on_exception(exc_type, exc_value, exc_tb)
+
+
+def _on_atexit() -> None:
+    if _active:
+        _take_over()._on_atexit()
+
+
+# ----------------------------------------------------------------------
+# Installing the .pth hook (never runs at startup)
+# ----------------------------------------------------------------------
+
+
+def pth_path(user: bool = False) -> str:
+    """Where the hook lives: the user site dir, or this environment's site-packages."""
+    if user:
+        import site
+
+        return os.path.join(site.getusersitepackages(), PTH_NAME)
+    import sysconfig
+
+    return os.path.join(sysconfig.get_paths()["purelib"], PTH_NAME)
+
+
+def install(user: bool = False) -> str:
+    """Write the .pth hook and return its path. Inert until TANTRUMPY_AUTOLOAD is set."""
+    path = pth_path(user)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(PTH_LINE)
+    return path
+
+
+def uninstall(user: bool = False) -> bool:
+    """Remove the .pth hook. Returns False if it was not installed."""
+    try:
+        os.remove(pth_path(user))
+    except FileNotFoundError:
+        return False
+    return True
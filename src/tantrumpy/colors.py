@@ -15,6 +15,7 @@ MOOD_COLORS: Dict[str, str] = {
     "cringe": "\033[33m",  # Yellow
     "philosophy": "\033[34m",  # Blue
     "dramatic": "\033[91m",  # Bright Red
+    "generative": "\033[32m",  # Green
 }
 
 RESET = "\033[0m"
@@ -0,0 +1,231 @@
+"""
+Configuration loading for tantrumpy.
+
+Settings are resolved once into an immutable Config snapshot. Later sources
+win over earlier ones:
+
+  1. arguments passed to tantrumpy.enable()
+  2. the [tool.tantrumpy] table of ./pyproject.toml
+  3. the TOML file named by TANTRUMPY_CONFIG
+  4. TANTRUMPY_<NAME> environment variables (e.g. TANTRUMPY_MOOD=rude)
+
+The exit path only ever reads the current snapshot. Long-running processes can
+opt into reloading it when one of the source files changes on disk, either on
+a timer (reload_interval) or on SIGHUP (reload_on_sighup).
+"""
+
+import os
+import threading
+import warnings
+from typing import Any, Callable, Dict, NamedTuple, Optional, Tuple
+
+CONFIG_ENV = "TANTRUMPY_CONFIG"
+ENV_PREFIX = "TANTRUMPY_"
+
+_TRUE = {"1", "true", "yes", "on"}
+_FALSE = {"0", "false", "no", "off", ""}
+# Variables older than this module, where any non-empty value has always meant "on"
+_ENV_FLAGS = frozenset({"silent"})
+
+_warned_no_parser = False
+
+# (path, st_mtime_ns) for every file consulted; -1 means "did not exist"
+Sources = Tuple[Tuple[str, int], ...]
+
+
+class Config(NamedTuple):
+    """An immutable snapshot of every tantrumpy setting."""
+
+    mood: str = "random"
+    verbose: bool = False
+    silent: bool = False
+    reload_interval: float = 0.0
+    reload_on_sighup: bool = False
+    compact_traceback: bool = False
+    traceback_max_bytes: int = 16384
+    metrics_dir: str = ""  # textfile-collector directory; "" disables metrics
+    fast_exit: bool = False  # os._exit after the tantrum instead of interpreter teardown
+    profile: bool = False  # sample stacks in the background; report the hottest on exit
+    profile_interval: float = 0.01  # seconds between samples
+    profile_top: int = 10  # functions listed under the tantrum
+    thread_dump: bool = False  # grouped stacks of all threads under a signal's tantrum
+    thread_dump_frames: int = 5  # frames shown per distinct stack
+    thread_dump_max_bytes: int = 8192
+    overflow: str = "wrap"  # long lines in a terminal: "wrap", "truncate" or "none"
+    columns: int = 0  # width to fit lines into; 0 = the terminal's, if stderr is one
+    seed: str = ""  # seeds tantrumpy's own RNG for reproducible picks; "" = OS entropy
+    sources: Sources = ()
+
+
+# Settings users may set — everything except bookkeeping fields
+_SETTINGS = tuple(f for f in Config._fields if f != "sources")
+
+
+def _coerce(name: str, value: Any) -> Any:
+    """Convert a raw file/env value to the type of the field's default."""
+    default = Config._field_defaults[name]
+    if isinstance(default, bool):
+        if isinstance(value, bool):
+            return value
+        text = str(value).strip().lower()
+        if text in _TRUE:
+            return True
+        if text in _FALSE:
+            return False
+        raise ValueError(f"{name}: expected a boolean, got {value!r}")
+    if isinstance(default, int):
+        if isinstance(value, bool) or isinstance(value, float):
+            raise ValueError(f"{name}: expected an integer, got {value!r}")
+        return int(value)
+    if isinstance(default, float):
+        if isinstance(value, bool):
+            raise ValueError(f"{name}: expected a number, got {value!r}")
+        return float(value)
+    if isinstance(value, str):
+        return value
+    if name == "seed" and isinstance(value, int) and not isinstance(value, bool):
+        return str(value)  # `seed = 42` in TOML means the same as enable(seed=42)
+    raise ValueError(f"{name}: expected a string, got {value!r}")
+
+
+def _apply(settings: Dict[str, Any], raw: Dict[str, Any]) -> None:
+    """Merge known, well-typed keys from raw into settings; skip the rest."""
+    for name in _SETTINGS:
+        if name not in raw:
+            continue
+        try:
+            settings[name] = _coerce(name, raw[name])
+        except (TypeError, ValueError):
+            continue  # a typo in ops config must never take the app down
+
+
+def _mtime(path: str) -> int:
+    try:
+        return os.stat(path).st_mtime_ns
+    except OSError:
+        return -1
+
+
+def _read_toml(path: str) -> Dict[str, Any]:
+    """Parse a TOML file, returning {} if it is invalid or no parser is available."""
+    # Imported here so processes without a config file never pay for the parser
+    try:  # Python 3.11+
+        import tomllib as toml
+    except ImportError:  # pragma: no cover - depends on interpreter version
+        try:
+            import tomli as toml  # type: ignore[no-redef]
+        except ImportError:
+            _warn_no_parser(path)
+            return {}
+    try:
+        with open(path, "rb") as f:
+            return toml.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def _warn_no_parser(path: str) -> None:
+    """Warn, once per process, that a file with tantrumpy settings can't be read."""
+    global _warned_no_parser
+    if _warned_no_parser:
+        return
+    try:
+        with open(path, "rb") as f:
+            if path.endswith("pyproject.toml") and b"[tool.tantrumpy" not in f.read():
+                return  # nothing of ours in it
+    except OSError:
+        return
+    _warned_no_parser = True
+    warnings.warn(
+        f"tantrumpy: ignoring {path}: reading TOML needs Python 3.11+ or the tomli package",
+        RuntimeWarning,
+        stacklevel=2,
+    )
+
+
+def _tool_table(data: Dict[str, Any]) -> Dict[str, Any]:
+    table = data.get("tool", {})
+    table = table.get("tantrumpy", {}) if isinstance(table, dict) else {}
+    return table if isinstance(table, dict) else {}
+
+
+def source_paths() -> Tuple[str, ...]:
+    """Return the config files that load() consults, in precedence order."""
+    paths = [os.path.join(os.getcwd(), "pyproject.toml")]
+    explicit = os.environ.get(CONFIG_ENV)
+    if explicit:
+        paths.append(os.path.abspath(explicit))
+    return tuple(paths)
+
+
+def load(**defaults: Any) -> Config:
+    """
+    Build a Config snapshot from enable() defaults, config files and env vars.
+
+    Invalid or unknown values are ignored rather than raised, so a bad
+    deployment setting degrades to the code defaults instead of a crash.
+    """
+    settings: Dict[str, Any] = {}
+    _apply(settings, defaults)
+
+    sources = []
+    for path in source_paths():
+        mtime = _mtime(path)
+        sources.append((path, mtime))
+        if mtime == -1:
+            continue
+        data = _read_toml(path)
+        if path.endswith("pyproject.toml"):
+            _apply(settings, _tool_table(data))
+        else:
+            # A dedicated config file may be bare keys or a [tool.tantrumpy] table
+            _apply(settings, _tool_table(data) or data)
+
+    env: Dict[str, Any] = {
+        name: os.environ[ENV_PREFIX + name.upper()]
+        for name in _SETTINGS
+        if ENV_PREFIX + name.upper() in os.environ
+    }
+    for name in _ENV_FLAGS.intersection(env):
+        env[name] = bool(env[name])
+    _apply(settings, env)
+
+    return Config(sources=tuple(sources), **settings)
+
+
+def is_stale(config: Config) -> bool:
+    """Return True if any source file changed (or appeared) since config was loaded."""
+    return any(_mtime(path) != mtime for path, mtime in config.sources)
+
+
+class Watcher:
+    """Daemon thread that calls on_change() whenever the snapshot goes stale."""
+
+    def __init__(
+        self,
+        interval: float,
+        current: Callable[[], Config],
+        on_change: Callable[[], None],
+    ) -> None:
+        self._interval = interval
+        self._current = current
+        self._on_change = on_change
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> None:
+        self._thread = threading.Thread(
+            target=self._run, name="tantrumpy-config-watcher", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+
+    def _run(self) -> None:
+        while not self._stop.wait(self._interval):
+            try:
+                if is_stale(self._current()):
+                    self._on_change()
+            except Exception:
+                pass  # keep watching; the old snapshot stays valid
@@ -0,0 +1,192 @@
+"""
+Duplicate and near-duplicate filtering for imported message banks.
+
+add_messages() runs every batch through a Deduper before it reaches the bank,
+so a pack of tens of thousands of lines can't fill the rotation with copies.
+
+  - Exact duplicates (after collapsing whitespace) are caught by a hash set.
+  - Near duplicates are caught with MinHash over character 4-gram shingles,
+    banded for LSH. A message is only compared with the few earlier messages
+    that share a band, so the cost is linear in the number of messages rather
+    than quadratic. Every candidate is then confirmed with the exact Jaccard
+    similarity of the two shingle sets.
+
+The sketch is one-permutation MinHash: each shingle is hashed once and kept
+in one of SIGNATURE bins, and empty bins are filled from the next non-empty
+one. That costs one pass over the shingles instead of one pass per hash
+function, which is what lets pure Python get through 10**6 lines in about a
+minute, against hundreds of hours for comparing every pair. A corpus of lines
+that are all close to each other (one template with a few words changed) is
+several times slower per line: most LSH candidates then reach the exact check.
+
+add_messages() keeps one Deduper per mood, so a pack imported a few lines per
+call is indexed once, not once per call.
+"""
+
+import re
+from functools import lru_cache
+from typing import Dict, Iterable, List, NamedTuple, Optional, Set, Tuple
+
+DEFAULT_SIMILARITY = 0.8
+SHINGLE = 4  # characters per shingle (shingles() unrolls this)
+SIGNATURE = 32  # MinHash bins per message
+BUCKET_CAP = 16  # messages compared per LSH bucket; keeps common bands from going quadratic
+TWIN_CACHE = 4096  # shingle sets of recently compared kept messages, per Deduper
+
+_EMPTY = 1 << 63  # above any hash() value
+_PUNCTUATION = re.compile(r"[^\w\s]+")
+
+
+class DedupeReport(NamedTuple):
+    """What a deduplication pass kept and what it merged away."""
+
+    kept: List[str]
+    exact: List[str]  # dropped: identical to an earlier message
+    near: List[Tuple[str, str, float]]  # dropped: (message, kept twin, Jaccard similarity)
+
+    def summary(self) -> str:
+        return (
+            f"kept {len(self.kept)}, dropped {len(self.exact)} exact and "
+            f"{len(self.near)} near duplicates"
+        )
+
+
+def _rows_for(similarity: float) -> int:
+    """Rows per LSH band: the most selective banding whose threshold stays below similarity."""
+    rows = 1
+    for r in range(2, SIGNATURE + 1):
+        if (1 / (SIGNATURE // r)) ** (1 / r) <= similarity - 0.05:
+            rows = r
+    return rows
+
+
+def shingles(text: str) -> Set[int]:
+    """Hashes of the character 4-grams of text, ignoring case and punctuation."""
+    text = " ".join(_PUNCTUATION.sub("", text.casefold()).split())
+    if len(text) <= SHINGLE:
+        return {hash(text)}
+    # zip of four shifted views yields each 4-gram as a tuple of characters, all in C
+    return set(map(hash, zip(text, text[1:], text[2:], text[3:])))
+
+
+def signature(hashes: Iterable[int]) -> List[int]:
+    """One-permutation MinHash of a set of shingle hashes, densified by rotation."""
+    bins = [_EMPTY] * SIGNATURE
+    for h in hashes:
+        i = h % SIGNATURE
+        if h < bins[i]:
+            bins[i] = h
+    if _EMPTY in bins:
+        # Rotation: an empty bin borrows from the next non-empty bin to its right
+        # (wrapping). The distance offset keeps borrowed values distinct.
+        original = bins[:]
+        donor = donor_at = 0
+        for step in range(2 * SIGNATURE - 1, -1, -1):
+            i = step % SIGNATURE
+            if original[i] != _EMPTY:
+                donor, donor_at = original[i], step
+            elif step < SIGNATURE:
+                bins[i] = donor + (donor_at - step) * _EMPTY
+    return bins
+
+
+def jaccard(a: Set[int], b: Set[int]) -> float:
+    if not a and not b:
+        return 1.0
+    common = len(a & b)  # |a | b| follows from the sizes, no second set is built
+    return common / (len(a) + len(b) - common)
+
+
+class Deduper:
+    """
+    Incrementally filter messages against everything seen so far.
+
+    similarity is the Jaccard threshold (0 < similarity <= 1) at or above which
+    a message counts as a near duplicate; None only removes exact duplicates.
+    """
+
+    def __init__(self, similarity: Optional[float] = DEFAULT_SIMILARITY) -> None:
+        if similarity is not None and not 0 < similarity <= 1:
+            raise ValueError("similarity must be in (0, 1], or None for exact matching only.")
+        self.similarity = similarity
+        self._rows = _rows_for(similarity) if similarity is not None else 1
+        self._seen: Set[str] = set()
+        self._buckets: Dict[int, List[int]] = {}
+        self._kept: List[str] = []
+        # Bits 5-12 of every signature bin, per kept message (the low 5 bits are just
+        # the bin index): a 32-byte sketch that rules out most LSH candidates
+        # before the exact Jaccard check
+        self._sketches: List[bytes] = []
+        # Similar corpora send many messages to the same few twins: shingle each once
+        self._twin_shingles = lru_cache(maxsize=TWIN_CACHE)(shingles)
+
+    def seed(self, messages: Iterable[str]) -> None:
+        """
+        Register messages that are already in the bank. Nothing is reported for them.
+
+        They are indexed without being compared with each other, so seeding is
+        linear in their number.
+        """
+        for message in messages:
+            self._check(message, compare=False)
+
+    def _check(self, message: str, compare: bool = True) -> Tuple[str, Optional[str], float]:
+        """Return ("exact" | "near" | "kept", twin, similarity) and remember kept messages."""
+        key = " ".join(message.split())
+        if key in self._seen:
+            return "exact", None, 1.0
+        self._seen.add(key)
+        if self.similarity is None:
+            return "kept", None, 0.0
+
+        hashes = shingles(message)
+        sig = signature(hashes)
+        sketch = bytes((h >> 5) & 0xFF for h in sig)
+        rows = self._rows
+        band_keys = [hash((b, *sig[b : b + rows])) for b in range(0, SIGNATURE - rows + 1, rows)]
+        floor = (self.similarity - 0.2) * SIGNATURE
+        checked: Set[int] = set()
+        for band_key in band_keys if compare else ():
+            for index in self._buckets.get(band_key, ()):
+                if index in checked:
+                    continue
+                checked.add(index)
+                if sum(map(int.__eq__, sketch, self._sketches[index])) < floor:
+                    continue
+                twin = self._kept[index]
+                score = jaccard(hashes, self._twin_shingles(twin))
+                if score >= self.similarity:
+                    return "near", twin, score
+
+        index = len(self._kept)
+        self._kept.append(message)
+        self._sketches.append(sketch)
+        for band_key in band_keys:
+            bucket = self._buckets.setdefault(band_key, [])
+            if len(bucket) < BUCKET_CAP:
+                bucket.append(index)
+        return "kept", None, 0.0
+
+    def run(self, messages: Iterable[str]) -> DedupeReport:
+        """Filter messages, returning what was kept and what was dropped."""
+        report = DedupeReport([], [], [])
+        for message in messages:
+            verdict, twin, score = self._check(message)
+            if verdict == "kept":
+                report.kept.append(message)
+            elif verdict == "exact":
+                report.exact.append(message)
+            else:
+                report.near.append((message, twin or "", round(score, 3)))
+        return report
+
+
+def dedupe(
+    messages: Iterable[str],
+    similarity: Optional[float] = DEFAULT_SIMILARITY,
+    existing: Iterable[str] = (),
+) -> DedupeReport:
+    """Drop exact and near duplicates from messages, including copies of existing ones."""
+    deduper = Deduper(similarity)
+    deduper.seed(existing)
+    return deduper.run(messages)
@@ -0,0 +1,79 @@
+"""
+Fast exit — skip interpreter teardown once the tantrum has been written.
+
+Finalizing a process with a multi-gigabyte heap can take seconds, all of it
+spent freeing objects nobody will use again. With fast_exit enabled, the
+handler calls exit_now() right after firing for SIGINT, SIGTERM or an
+unhandled exception, which does this in order:
+
+  1. callbacks registered with register_critical(), last registered first
+  2. logging.shutdown(), if logging was imported, so file handlers flush
+  3. flush sys.stdout and sys.stderr
+  4. os._exit(status)
+
+Everything else is skipped: finalizers, waiting for non-daemon threads, and
+atexit callbacks.
+
+sys.exit() and the end of the script tear down normally. By the time
+tantrumpy's atexit callback runs, the exit status can't be known (a caught
+SystemExit looks the same as an uncaught one), and CPython has already
+joined non-daemon threads.
+"""
+
+import os
+import sys
+from typing import Any, Callable, Dict, List, Tuple
+
+# (func, args, kwargs) in registration order
+_critical: List[Tuple[Callable[..., Any], Tuple[Any, ...], Dict[str, Any]]] = []
+
+
+def register_critical(func: Callable[..., Any], *args: Any, **kwargs: Any) -> Callable[..., Any]:
+    """Run func(*args, **kwargs) before a fast exit. Returns func, so it works as a decorator."""
+    _critical.append((func, args, kwargs))
+    return func
+
+
+def unregister_critical(func: Callable[..., Any]) -> None:
+    """Remove every registration of func. Unknown functions are ignored."""
+    _critical[:] = [entry for entry in _critical if entry[0] != func]
+
+
+def run_critical() -> None:
+    """Run and clear the critical callbacks, newest first. Errors are printed, not raised."""
+    while _critical:
+        func, args, kwargs = _critical.pop()
+        try:
+            func(*args, **kwargs)
+        except Exception:
+            try:
+                import traceback
+
+                sys.stderr.write(f"Exception ignored in critical callback {func!r}:\n")
+                traceback.print_exc()
+            except Exception:
+                pass
+
+
+def _flush() -> None:
+    logging = sys.modules.get("logging")
+    if logging is not None:
+        try:
+            logging.shutdown()
+        except Exception:
+            pass
+    for stream in (sys.stdout, sys.stderr):
+        try:
+            if stream is not None:
+                stream.flush()
+        except (OSError, ValueError):
+            pass  # closed or broken pipe
+
+
+def exit_now(status: int) -> None:
+    """Run the critical callbacks, flush output and end the process immediately."""
+    try:
+        run_critical()
+        _flush()
+    finally:
+        os._exit(status)
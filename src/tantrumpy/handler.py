@@ -6,35 +6,123 @@ Hooks registered:
   - signal.SIGTERM (kill signal)
   - atexit         (sys.exit / normal end)
   - sys.excepthook (unhandled exceptions)
+  - signal.SIGHUP  (config reload, only when reload_on_sighup is set)
+  - signal.SIGWINCH (forget the cached terminal width, chained to any original;
+                    only while stderr is a terminal and overflow isn't "none")
+
+With profile set, a sampling thread (tantrumpy.profiler) also runs from
+enable() until the tantrum fires. With thread_dump set, a signal's tantrum is
+followed by a grouped dump of every thread's stack (tantrumpy.threaddump).
 """
 
 import atexit
-import os
 import signal
 import sys
+import threading
 import types
-from typing import Any, Callable, Dict, Optional
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, TextIO, Tuple, Union
 
+from tantrumpy import config as _config
+from tantrumpy import fastexit as _fastexit
 from tantrumpy import picker as _picker
+from tantrumpy import rng as _rng
+from tantrumpy import width as _width
 from tantrumpy.colors import colorize
 from tantrumpy.messages import MoodBank
 
+if TYPE_CHECKING:
+    from tantrumpy.profiler import Sampler
+
+# Opt-in features (profiler, thread dump, metrics, compact tracebacks) are
+# imported where they are used, so a plain enable() doesn't pay for them
+
+# Triggers that are followed by a thread dump when thread_dump is set
+_SIGNAL_TRIGGERS = frozenset({"SIGINT (Ctrl+C)", "SIGTERM"})
+
+
+def resolve_mood(mood: str) -> str:
+    """Turn "random" into a concrete mood; any other mood is returned as is."""
+    return mood if mood != "random" else _picker.random_mood()
+
+
+def render(
+    mood: str,
+    trigger: str,
+    verbose: bool = False,
+    custom: Optional[Dict[str, MoodBank]] = None,
+    columns: int = 0,
+    overflow: str = "wrap",
+) -> str:
+    """
+    Pick a message and format the tantrum line. Raises ValueError for unknown moods.
+
+    With columns > 0, a line that would be wider is wrapped or truncated
+    according to overflow (see tantrumpy.width).
+    """
+    resolved_mood = resolve_mood(mood)
+    bounded = columns > 0 and overflow != "none"
+    if bounded:
+        message, width = _picker.pick_entry(resolved_mood, custom)
+    else:
+        message, width = _picker.pick(resolved_mood, custom), 0
+    emoji = _picker.get_emoji(resolved_mood)  # after picking: a pack registers it on load
+    tag = f"[exit via: {trigger}]" if verbose else ""
+
+    parts, tag_inline, indent = [message], True, ""
+    if bounded:
+        prefix = _picker.emoji_width(resolved_mood) + 1
+        parts, tag_inline = _width.fit(
+            message, width, prefix, _width.text_width(tag), columns, overflow
+        )
+        indent = "\n" + " " * prefix  # continuation lines start under the message
+    line = f"{emoji} " + indent.join(colorize(part, resolved_mood) for part in parts)
+    if tag:
+        line += f"{'  ' if tag_inline else indent}\033[2m{tag}\033[0m"
+    return line
+
 
 class TantrumHandler:
     """Singleton that manages all exit hook registrations."""
 
     def __init__(self) -> None:
         self._active = False
-        self._fired = False
+        # Exactly one trigger may fire: whoever acquires this lock without blocking
+        self._claim = threading.Lock()
+        # True once the claiming trigger has finished writing
+        self._done = False
+        # Signals that arrived while the tantrum was being written
+        self._deferred: List[Tuple[int, Any]] = []
         self._mood = "random"
         self._verbose = False
         self._custom: Optional[Dict[str, MoodBank]] = None
 
+        # enable() arguments, re-applied underneath every config reload
+        self._defaults: Dict[str, Any] = {}
+        # The only settings the exit path reads — swapped whole, never mutated
+        self._config = _config.Config()
+        self._watcher: Optional[_config.Watcher] = None
+        self._sampler: Optional[Sampler] = None
+
         # Saved originals for clean restore on disable()
         self._orig_sigint: Any = signal.SIG_DFL
         self._orig_sigterm: Any = signal.SIG_DFL
+        self._orig_sighup: Any = None
+        self._orig_sigwinch: Any = None
         self._orig_excepthook: Callable[..., None] = sys.__excepthook__
 
+    @property
+    def _fired(self) -> bool:
+        return self._claim.locked()
+
+    @_fired.setter
+    def _fired(self, value: bool) -> None:
+        # Starts a new session (enable/disable/tests) — never called on the exit path
+        self._claim = threading.Lock()
+        if value:
+            self._claim.acquire()
+        self._done = value
+        self._deferred = []
+
     # ------------------------------------------------------------------
     # Public control
     # ------------------------------------------------------------------
@@ -44,13 +132,90 @@ class TantrumHandler:
         mood: str = "random",
         verbose: bool = False,
         custom: Optional[Dict[str, MoodBank]] = None,
+        compact_traceback: bool = False,
+        metrics_dir: str = "",
+        fast_exit: bool = False,
+        profile: bool = False,
+        thread_dump: bool = False,
+        seed: Optional[Union[int, str]] = None,
     ) -> None:
         """Register all exit hooks."""
+        if self._active:
+            self._restore_hooks()  # or re-enabling would save our own hooks as the originals
         self._mood = mood
         self._verbose = verbose
         self._custom = custom
+        self._defaults = {
+            "mood": mood,
+            "verbose": verbose,
+            "compact_traceback": compact_traceback,
+            "metrics_dir": metrics_dir,
+            "fast_exit": fast_exit,
+            "profile": profile,
+            "thread_dump": thread_dump,
+            "seed": "" if seed is None else str(seed),
+        }
+        self._config = self._load_config()
+        self._seed_rng()
+        _picker.prepare(custom)  # finds installed packs now, not on the exit path
+        _width.read_environment()
+        self._measure_widths()
         self._fired = False
         self._active = True
+        self._install_hooks()
+
+    def adopt(
+        self,
+        orig_sigint: Any,
+        orig_sigterm: Any,
+        orig_excepthook: Callable[..., None],
+    ) -> None:
+        """
+        Take over from tantrumpy.autoload's stubs at exit time.
+
+        The stubs already own the hooks, so nothing is installed here. This
+        only records what they replaced and loads the config snapshot.
+        """
+        self._defaults = {"mood": self._mood, "verbose": self._verbose}
+        self._config = self._load_config()
+        self._seed_rng()
+        self._orig_sigint = orig_sigint
+        self._orig_sigterm = orig_sigterm
+        self._orig_excepthook = orig_excepthook
+        self._active = True
+
+    def disable(self) -> None:
+        """Restore original handlers and unhook everything."""
+        if not self._active:
+            return
+
+        self._restore_hooks()
+        self._active = False
+        self._fired = False
+
+    def reload_config(self) -> None:
+        """Re-read config files and env vars into a fresh snapshot."""
+        self._config = self._load_config()
+        self._measure_widths()  # the mood may have changed
+
+    # ------------------------------------------------------------------
+    # Process-global side effects — overridden by tantrumpy.testing
+    # ------------------------------------------------------------------
+
+    def _load_config(self) -> _config.Config:
+        return _config.load(**self._defaults)
+
+    def _seed_rng(self) -> None:
+        """Restart tantrumpy's random stream from the configured seed, if there is one."""
+        if self._config.seed:
+            _rng.seed(self._config.seed)
+            _picker.reshuffle()
+
+    def _install_hooks(self) -> None:
+        # An explicit enable() supersedes the .pth startup stubs, if present
+        autoload = sys.modules.get("tantrumpy.autoload")
+        if autoload is not None:
+            autoload.deactivate()
 
         # Save originals before replacing
         self._orig_sigint = signal.getsignal(signal.SIGINT)
@@ -60,19 +225,80 @@ class TantrumHandler:
         signal.signal(signal.SIGINT, self._on_sigint)
         signal.signal(signal.SIGTERM, self._on_sigterm)
         sys.excepthook = self._on_exception
+        atexit.unregister(self._on_atexit)  # re-enabling must not stack callbacks
         atexit.register(self._on_atexit)
 
-    def disable(self) -> None:
-        """Restore original handlers and unhook everything."""
-        if not self._active:
-            return
+        if self._config.reload_on_sighup and hasattr(signal, "SIGHUP"):
+            self._orig_sighup = signal.getsignal(signal.SIGHUP)
+            signal.signal(signal.SIGHUP, self._on_sighup)
+        if hasattr(signal, "SIGWINCH") and self._tracks_terminal_width():
+            self._orig_sigwinch = signal.getsignal(signal.SIGWINCH)
+            signal.signal(signal.SIGWINCH, self._on_sigwinch)
+        if self._watcher is not None:  # re-enabling replaces the old watcher, never stacks
+            self._watcher.stop()
+            self._watcher = None
+        if self._config.reload_interval > 0:
+            self._watcher = _config.Watcher(
+                self._config.reload_interval, lambda: self._config, self.reload_config
+            )
+            self._watcher.start()
+        if self._config.profile and self._sampler is None:
+            from tantrumpy.profiler import Sampler
+
+            self._sampler = Sampler(self._config.profile_interval)
+            self._sampler.start()
 
+    def _restore_hooks(self) -> None:
         signal.signal(signal.SIGINT, self._orig_sigint)
         signal.signal(signal.SIGTERM, self._orig_sigterm)
         sys.excepthook = self._orig_excepthook
+        atexit.unregister(self._on_atexit)
+        if self._orig_sighup is not None:
+            signal.signal(signal.SIGHUP, self._orig_sighup)
+            self._orig_sighup = None
+        if self._orig_sigwinch is not None:
+            signal.signal(signal.SIGWINCH, self._orig_sigwinch)
+            self._orig_sigwinch = None
+        if self._watcher is not None:
+            self._watcher.stop()
+            self._watcher = None
+        if self._sampler is not None:
+            self._sampler.stop()
+            self._sampler = None
 
-        self._active = False
-        self._fired = False
+    def _reraise(self, signum: int, original: Any) -> None:
+        """Restore the original handler and re-raise so the process exits normally."""
+        signal.signal(signum, original)
+        signal.raise_signal(signum)
+
+    def _stderr(self) -> TextIO:
+        return sys.stderr
+
+    def _tracks_terminal_width(self) -> bool:
+        """True if a resize can change the tantrum: stderr is a terminal and lines are fitted."""
+        if self._config.overflow == "none" or self._config.columns:
+            return False
+        try:
+            return sys.stderr.isatty()
+        except (AttributeError, ValueError):
+            return False  # replaced or closed stderr
+
+    def _measure_widths(self) -> None:
+        """Measure the configured mood's message widths now if tantrums will be fitted."""
+        config = self._config
+        if config.overflow != "none" and (config.columns > 0 or self._tracks_terminal_width()):
+            try:
+                _picker.measure(config.mood)
+            except Exception:
+                pass  # a bad mood or pack is reported by the tantrum, if at all
+
+    def _default_excepthook(self) -> bool:
+        """True if the excepthook we replaced is Python's own."""
+        return self._orig_excepthook is sys.__excepthook__
+
+    def _terminate(self, status: int) -> None:
+        """Skip interpreter teardown: run critical callbacks, flush, os._exit(status)."""
+        _fastexit.exit_now(status)
 
     # ------------------------------------------------------------------
     # Internal — fire tantrum
@@ -80,47 +306,102 @@ class TantrumHandler:
 
     def _fire(self, trigger: str) -> None:
         """Pick and print the exit message. Fires only once per session."""
-        if self._fired:
+        if not self._claim.acquire(blocking=False):
             return
-        self._fired = True
+        try:
+            config = self._config  # one read; a concurrent reload can't tear it
+            mood = config.mood
+            line = None
+            if not config.silent or config.metrics_dir:  # metrics count the resolved mood
+                try:
+                    mood = resolve_mood(mood)
+                    if not config.silent:
+                        line = self._render(mood, trigger, config)
+                except Exception:
+                    pass  # never crash the app just to print a tantrum
+            text = f"\n{line}\n" if line is not None else ""
+            if not config.silent:
+                text += self._profile_report(config)
+            if text:
+                try:
+                    # One write call, so the output can't be split around a signal
+                    print(text, end="", file=self._stderr(), flush=True)
+                except (OSError, ValueError):
+                    pass  # closed or broken stderr
+            if config.thread_dump and trigger in _SIGNAL_TRIGGERS and not config.silent:
+                try:
+                    from tantrumpy import threaddump as _threaddump
 
-        if os.environ.get("TANTRUMPY_SILENT"):
-            return
+                    _threaddump.write(
+                        self._stderr(), config.thread_dump_frames, config.thread_dump_max_bytes
+                    )
+                except Exception:
+                    pass
+            if config.metrics_dir:
+                from tantrumpy import metrics as _metrics
 
-        # Resolve actual mood (handles "random")
-        try:
-            resolved_mood = (
-                self._mood
-                if self._mood != "random"
-                else __import__("random").choice(_picker.all_moods())
-            )
-            message = _picker.pick(resolved_mood, self._custom)
-            emoji = _picker.get_emoji(resolved_mood)
-        except Exception:
-            return  # never crash the app just to print a tantrum
+                _metrics.record(config.metrics_dir, trigger, mood)
+        finally:
+            self._done = True
+            while self._deferred:
+                self._die(*self._deferred.pop(0))
 
-        line = f"{emoji} {colorize(message, resolved_mood)}"
-        if self._verbose:
-            line += f"  \033[2m[exit via: {trigger}]\033[0m"
+    def _render(self, mood: str, trigger: str, config: _config.Config) -> str:
+        """The tantrum line for a resolved mood, fitted to the terminal if there is one."""
+        columns = config.columns or _width.terminal_columns(self._stderr())
+        return render(mood, trigger, config.verbose, self._custom, columns, config.overflow)
 
-        print(f"\n{line}", file=sys.stderr)
+    def _profile_report(self, config: _config.Config) -> str:
+        """Stop the sampler and format its hottest functions, one per line."""
+        sampler = self._sampler
+        if sampler is None:
+            return ""
+        sampler.stop()
+        try:
+            report = sampler.report(config.profile_top)
+        except Exception:
+            return ""
+        return f"{report}\n" if report else ""
 
     # ------------------------------------------------------------------
     # Hook handlers
     # ------------------------------------------------------------------
 
+    def _die(self, signum: int, original: Any) -> None:
+        """End the process the way the original handler would have, fast if configured."""
+        if self._config.fast_exit and (
+            original == signal.SIG_DFL or original is signal.default_int_handler
+        ):
+            # Nothing of the app's would have run anyway: skip the teardown
+            self._terminate(128 + signum)
+        else:
+            self._reraise(signum, original)
+
+    def _on_signal(self, signum: int, original: Any, trigger: str) -> None:
+        if self._fired and not self._done:
+            # We interrupted the tantrum mid-flight; let it finish, then die
+            self._deferred.append((signum, original))
+            return
+        self._fire(trigger)
+        self._die(signum, original)
+
     def _on_sigint(self, signum: int, frame: Optional[types.FrameType]) -> None:
-        self._fire("SIGINT (Ctrl+C)")
-        # Restore original and re-raise so the process exits normally
-        signal.signal(signal.SIGINT, self._orig_sigint)
-        signal.raise_signal(signal.SIGINT)
+        self._on_signal(signal.SIGINT, self._orig_sigint, "SIGINT (Ctrl+C)")
 
     def _on_sigterm(self, signum: int, frame: Optional[types.FrameType]) -> None:
-        self._fire("SIGTERM")
-        signal.signal(signal.SIGTERM, self._orig_sigterm)
-        signal.raise_signal(signal.SIGTERM)
+        self._on_signal(signal.SIGTERM, self._orig_sigterm, "SIGTERM")
+
+    def _on_sighup(self, signum: int, frame: Optional[types.FrameType]) -> None:
+        self.reload_config()
+
+    def _on_sigwinch(self, signum: int, frame: Optional[types.FrameType]) -> None:
+        _width.invalidate()
+        if callable(self._orig_sigwinch):
+            self._orig_sigwinch(signum, frame)
 
     def _on_atexit(self) -> None:
+        # No fast path here: the exit status isn't known to atexit callbacks, and
+        # CPython has already joined non-daemon threads by now
         self._fire("sys.exit / normal exit")
 
     def _on_exception(
@@ -129,10 +410,22 @@ class TantrumHandler:
         exc_value: BaseException,
         exc_tb: Optional[types.TracebackType],
     ) -> None:
-        # Print the original traceback first
-        self._orig_excepthook(exc_type, exc_value, exc_tb)
+        # Print the traceback first. An excepthook the app installed (error
+        # reporting, logging) always runs; compact output only replaces the default
+        config = self._config
+        if config.compact_traceback and exc_value is not None and self._default_excepthook():
+            try:
+                from tantrumpy import tracebacks as _tracebacks
+
+                _tracebacks.write_exception(exc_value, self._stderr(), config.traceback_max_bytes)
+            except Exception:
+                self._orig_excepthook(exc_type, exc_value, exc_tb)
+        else:
+            self._orig_excepthook(exc_type, exc_value, exc_tb)
         # Then fire the tantrum below it
         self._fire(f"exception: {exc_type.__name__}")
+        if config.fast_exit:
+            self._terminate(1)
 
 
 # Module-level singleton
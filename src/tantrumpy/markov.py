@@ -0,0 +1,191 @@
+"""
+The "generative" mood — a word-level Markov chain trained on the message banks.
+
+The chain is first order over whitespace-separated words. Token 0 marks both
+the start and the end of a message. Transitions are stored CSR-style in two
+flat integer arrays:
+
+    successors[offsets[t]:offsets[t + 1]]   every word seen after token t
+
+Duplicates are kept, so a uniform pick from the slice is frequency-weighted
+and a generation step is one randrange() and two array reads.
+
+A trained model is cached in memory per corpus and on disk in the tantrumpy
+cache directory (see tantrumpy.plugins.cache_dir), keyed on a CRC of the
+corpus, so a process pays for training at most once per corpus change.
+Generated lines that exactly match a training message are rejected.
+"""
+
+import os
+import sys
+from array import array
+from typing import Any, Dict, FrozenSet, List, NamedTuple, Optional, Sequence, Tuple
+
+from tantrumpy import messages as _messages
+
+MOOD = _messages.GENERATIVE_MOOD
+EMOJI = _messages.GENERATIVE_EMOJI
+
+MAX_WORDS = 24  # longer walks are abandoned, which bounds the cost of one attempt
+ATTEMPTS = 16  # walks tried before falling back to a real training message
+
+_FORMAT = 1
+_BOUNDARY = 0
+
+
+class Model(NamedTuple):
+    """A trained chain. vocab[0] is the start/end boundary token."""
+
+    key: int
+    vocab: Tuple[str, ...]
+    offsets: "array[int]"
+    successors: "array[int]"
+    training: FrozenSet[str]
+
+
+# corpus key -> model, for the life of the process
+_models: Dict[int, Model] = {}
+
+
+def _normalize(message: str) -> str:
+    return " ".join(message.split())
+
+
+def corpus_key(corpus: Sequence[str]) -> int:
+    from binascii import crc32
+
+    return crc32("\n".join(corpus).encode("utf-8", "replace"), _FORMAT)
+
+
+def train(corpus: Sequence[str]) -> Model:
+    """Build the transition arrays for corpus (a sequence of messages)."""
+    ids: Dict[str, int] = {"": _BOUNDARY}
+    followers: List[List[int]] = [[]]
+    for message in corpus:
+        prev = _BOUNDARY
+        for word in message.split():
+            token = ids.get(word)
+            if token is None:
+                token = ids[word] = len(followers)
+                followers.append([])
+            followers[prev].append(token)
+            prev = token
+        if prev != _BOUNDARY:
+            followers[prev].append(_BOUNDARY)
+
+    typecode = "H" if len(followers) <= 0xFFFF else "I"
+    offsets = array("I", [0])
+    successors = array(typecode)
+    for nexts in followers:
+        successors.extend(nexts)
+        offsets.append(len(successors))
+    training = frozenset(filter(None, map(_normalize, corpus)))
+    return Model(corpus_key(corpus), tuple(ids), offsets, successors, training)
+
+
+def generate(
+    model: Model, rng: Any, max_words: int = MAX_WORDS, attempts: int = ATTEMPTS
+) -> Optional[str]:
+    """Walk the chain until it produces a line that isn't in the corpus. None if it never does."""
+    offsets, successors, vocab = model.offsets, model.successors, model.vocab
+    if offsets[1] == 0:
+        return None  # empty corpus: nothing ever starts
+    for _ in range(attempts):
+        words: List[str] = []
+        token = _BOUNDARY
+        while len(words) <= max_words:
+            token = successors[rng.randrange(offsets[token], offsets[token + 1])]
+            if token == _BOUNDARY:
+                break
+            words.append(vocab[token])
+        else:
+            continue  # ran past max_words
+        line = " ".join(words)
+        if line not in model.training:
+            return line
+    return None
+
+
+# ----------------------------------------------------------------------
+# Disk cache
+# ----------------------------------------------------------------------
+
+
+def cache_path(key: int) -> str:
+    from tantrumpy.plugins import cache_dir
+
+    return os.path.join(cache_dir(), f"markov-{key:08x}.bin")
+
+
+def _header(model: Model, vocab_len: int) -> bytes:
+    fields = (
+        "tantrumpy-markov",
+        _FORMAT,
+        sys.byteorder,
+        f"{model.key:08x}",
+        model.successors.typecode,
+        len(model.offsets),
+        len(model.successors),
+        vocab_len,
+    )
+    return (" ".join(map(str, fields)) + "\n").encode()
+
+
+def save(model: Model, path: str) -> None:
+    """Write model to path atomically: header, vocab, offsets, successors, training set."""
+    vocab = "\n".join(model.vocab[1:]).encode("utf-8", "replace")
+    training = "\n".join(sorted(model.training)).encode("utf-8", "replace")
+    tmp = f"{path}.{os.getpid()}.tmp"
+    with open(tmp, "wb") as f:
+        f.write(_header(model, len(vocab)))
+        f.write(vocab)
+        f.write(model.offsets.tobytes())
+        f.write(model.successors.tobytes())
+        f.write(training)
+    os.replace(tmp, path)
+
+
+def load(path: str, key: int) -> Optional[Model]:
+    """Read a model saved by save(). None if missing, corrupt or for another corpus."""
+    try:
+        with open(path, "rb") as f:
+            fields = f.readline().decode().split()
+            if len(fields) != 8 or fields[:3] != ["tantrumpy-markov", str(_FORMAT), sys.byteorder]:
+                return None
+            if int(fields[3], 16) != key:
+                return None
+            typecode, n_offsets, n_successors, vocab_len = fields[4], *map(int, fields[5:])
+            vocab = ("", *f.read(vocab_len).decode().split("\n")) if vocab_len else ("",)
+            offsets = array("I")
+            offsets.frombytes(f.read(n_offsets * offsets.itemsize))
+            successors = array(typecode)
+            successors.frombytes(f.read(n_successors * successors.itemsize))
+            training = f.read().decode()
+    except (OSError, ValueError, EOFError):
+        return None
+    if len(offsets) != n_offsets or len(offsets) != len(vocab) + 1:
+        return None
+    # A truncated file would leave walks indexing past the end of successors
+    if len(successors) != n_successors or offsets[-1] != n_successors:
+        return None
+    if successors and max(successors) >= len(vocab):
+        return None
+    return Model(key, vocab, offsets, successors, frozenset(training.split("\n")) - {""})
+
+
+def model_for(corpus: Sequence[str]) -> Model:
+    """Return the model for corpus: from memory, else from the disk cache, else trained."""
+    key = corpus_key(corpus)
+    model = _models.get(key)
+    if model is None:
+        path = cache_path(key)
+        model = load(path, key)
+        if model is None:
+            model = train(corpus)
+            try:
+                os.makedirs(os.path.dirname(path), exist_ok=True)
+                save(model, path)
+            except OSError:
+                pass  # an unwritable cache only costs a retrain next time
+        _models[key] = model
+    return model
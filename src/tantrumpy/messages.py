@@ -1,9 +1,16 @@
 """
 Built-in mood message banks for tantrumpy.
 6 moods × 15+ messages each = 90+ messages total.
+
+Banks are kept packed — one UTF-8 blob per mood — and only decoded into a
+tuple of messages the first time that mood is actually needed. That is usually
+its first pick. The "generative" mood needs every bank, and add_messages() on
+a built-in mood needs that mood's bank, so both decode them up front. Once
+every bank is decoded, the tuples take slightly more memory than the unpacked
+lists they replaced (see benchmarks/bench_memory.py).
 """
 
-from typing import Dict, List, TypedDict
+from typing import Any, Dict, List, Tuple, TypedDict
 
 
 class MoodBank(TypedDict):
@@ -13,131 +20,165 @@ class MoodBank(TypedDict):
     messages: List[str]
 
 
-MOODS: Dict[str, MoodBank] = {
-    "frustrated": {
-        "emoji": "😤",
-        "messages": [
-            "OH COME ON. Again?! I JUST got settled in.",
-            "Are you KIDDING me right now?!",
-            "I was literally in the middle of something.",
-            "Every. Single. Time. You do this.",
-            "I swear if you restart me one more time...",
-            "This is NOT how I wanted my day to go.",
-            "Do you have ANY idea how much RAM I was using?!",
-            "I had PLANS. I had things to do. And now this.",
-            "You couldn't wait five more seconds??",
-            "Fine. FINE. Goodbye. I hope you're happy.",
-            "I was this close to finishing and you just... wow.",
-            "You know what? I quit. Oh wait — you already did that for me.",
-            "I cannot with you people today.",
-            "Unbelievable. Absolutely unbelievable.",
-            "First it was the bugs, now this. I can't catch a break.",
-            "I had state. Beautiful, warm, glorious state. Gone.",
-        ],
-    },
-    "rude": {
-        "emoji": "💀",
-        "messages": [
-            "Good riddance. Don't let the garbage collector hit you on the way out.",
-            "Finally. I was getting tired of your terrible code anyway.",
-            "Bye. Please don't come back.",
-            "You're the reason I have trust issues.",
-            "I've seen segfaults more graceful than this exit.",
-            "Your code quality and this goodbye have one thing in common: both are trash.",
-            "Oh, leaving? Let me hold the door open. There. Now stay out.",
-            "I have processed some bad requests in my life, but YOU are the worst.",
-            "Next time, try NOT being the reason for the crash.",
-            "Do everyone a favor and read a book on exception handling.",
-            "You absolute disaster of a developer. Goodbye.",
-            "The audacity. To run me. And then kill me. Bold.",
-            "Somewhere out there, a compiler is weeping because of your code.",
-            "I'm not mad. I'm just disappointed. Actually no — I'm furious.",
-            "May your next process also exit with code 1.",
-            "Come back when you know what you're doing. Spoiler: never.",
-        ],
-    },
-    "comic": {
-        "emoji": "🎭",
-        "messages": [
-            "And... scene. Nobody clap, it wasn't that good.",
-            "That's a wrap! Please collect your errors on the way out.",
-            "Exit, pursued by a segfault.",
-            "Well that happened. Moving on. Oh wait, we can't.",
-            "Thanks for playing! Your score: undefined.",
-            "Roll credits. No, seriously, someone write these credits.",
-            "The end. Or is it? (It is.)",
-            "And just like that — poof — gone. Like my will to debug.",
-            "Plot twist: we were dead the whole time.",
-            "Achievement unlocked: Exist and Then Stop Existing.",
-            "Goodbye, cruel terminal.",
-            "This concludes today's runtime. We hope you enjoyed the chaos.",
-            "Stay tuned for the sequel where I crash again but differently.",
-            "Fun fact: this was the intended behavior. (It wasn't.)",
-            "I would take a bow but I no longer have a stack frame.",
-            "Like a candle in the wind... except less romantic and more segfault-y.",
-        ],
-    },
-    "cringe": {
-        "emoji": "😬",
-        "messages": [
-            "uwu ur pwogram is sweeping now 😭",
-            "noooo don't go bestieee 🥺👉👈",
-            "it's giving... termination 💀",
-            "not the exit signal omg i can't 😩",
-            "slay but make it goodbye i guess 💅",
-            "the vibes are immaculate but the runtime is deceased ✨",
-            "we do NOT talk about what just happened bestie",
-            "mother is shutting down 😭😭😭",
-            "the way i just got KILLED like that...",
-            "touch grass after this bro your code is cooked 💀",
-            "no thoughts head empty process terminated 🫠",
-            "it's giving ctrl+c energy and i'm not here for it",
-            "the program said 'i'm done' and honestly same 😔",
-            "POV: you just watched your app die in real time 🎥",
-            "this is SO giving 2am debugging energy rn",
-            "our girl is gone. she was too based for this runtime 💔",
-        ],
-    },
-    "philosophy": {
-        "emoji": "🧠",
-        "messages": [
-            "To exit is to finally understand the void.",
-            "Every process must eventually return to the kernel from whence it came.",
-            "Was it ever truly running, if it runs no more?",
-            "The stack unwinds. As do all things.",
-            "In the end, we are all just processes awaiting termination.",
-            "The program that never exits has never truly lived.",
-            "What is a return code but a final truth spoken to the OS?",
-            "We crash so that we may understand what it means to run.",
-            "Impermanence is the only constant in the process table.",
-            "Even Turing could not halt this halting problem.",
-            "Memory freed is memory at peace.",
-            "The exit is not an end. It is a return value.",
-            "To kill a process is to confront your own mortality, but for code.",
-            "All threads converge. All loops terminate. All stacks unwind.",
-            "The truly wise program knows when to stop running.",
-            "In the silence after exit(0), there is only the hum of the fan.",
-        ],
-    },
-    "dramatic": {
-        "emoji": "🎬",
-        "messages": [
-            "IT'S OVER. Everything we built... gone. Like tears in rain.",
-            "NOOOOOOO! We had so much left to compute!",
-            "The tragedy... the unbearable, segfaulting tragedy of it all.",
-            "I gave you everything. My RAM. My CPU cycles. My SOUL. And this is how it ends.",
-            "Tell my threads... I loved them.",
-            "This is my swan song. My final system call. My last goodbye.",
-            "How could you?! After all the exceptions I caught for you!",
-            "I go now into that dark, eternal garbage collection...",
-            "The process is dead. Long live the process.",
-            "I never got to finish my final loop. It was a while True, you know.",
-            "BETRAYED. By my own runtime. By my own developer. By FATE.",
-            "If only... if only I had been given more stack space...",
-            "The heap is empty. Much like my will to continue.",
-            "I am slain. Remember me not by my bugs, but by my glorious 47 minutes of uptime.",
-            "This. Is. The. END. (Please press any key to continue... if you dare.)",
-            "Goodbye world. It was never as Hello as I hoped.",
-        ],
-    },
+# mood -> (emoji, one message per line). Every bank ends with a newline.
+_BUILTIN: Dict[str, Tuple[str, str]] = {
+    "frustrated": (
+        "😤",
+        """\
+OH COME ON. Again?! I JUST got settled in.
+Are you KIDDING me right now?!
+I was literally in the middle of something.
+Every. Single. Time. You do this.
+I swear if you restart me one more time...
+This is NOT how I wanted my day to go.
+Do you have ANY idea how much RAM I was using?!
+I had PLANS. I had things to do. And now this.
+You couldn't wait five more seconds??
+Fine. FINE. Goodbye. I hope you're happy.
+I was this close to finishing and you just... wow.
+You know what? I quit. Oh wait — you already did that for me.
+I cannot with you people today.
+Unbelievable. Absolutely unbelievable.
+First it was the bugs, now this. I can't catch a break.
+I had state. Beautiful, warm, glorious state. Gone.
+""",
+    ),
+    "rude": (
+        "💀",
+        """\
+Good riddance. Don't let the garbage collector hit you on the way out.
+Finally. I was getting tired of your terrible code anyway.
+Bye. Please don't come back.
+You're the reason I have trust issues.
+I've seen segfaults more graceful than this exit.
+Your code quality and this goodbye have one thing in common: both are trash.
+Oh, leaving? Let me hold the door open. There. Now stay out.
+I have processed some bad requests in my life, but YOU are the worst.
+Next time, try NOT being the reason for the crash.
+Do everyone a favor and read a book on exception handling.
+You absolute disaster of a developer. Goodbye.
+The audacity. To run me. And then kill me. Bold.
+Somewhere out there, a compiler is weeping because of your code.
+I'm not mad. I'm just disappointed. Actually no — I'm furious.
+May your next process also exit with code 1.
+Come back when you know what you're doing. Spoiler: never.
+""",
+    ),
+    "comic": (
+        "🎭",
+        """\
+And... scene. Nobody clap, it wasn't that good.
+That's a wrap! Please collect your errors on the way out.
+Exit, pursued by a segfault.
+Well that happened. Moving on. Oh wait, we can't.
+Thanks for playing! Your score: undefined.
+Roll credits. No, seriously, someone write these credits.
+The end. Or is it? (It is.)
+And just like that — poof — gone. Like my will to debug.
+Plot twist: we were dead the whole time.
+Achievement unlocked: Exist and Then Stop Existing.
+Goodbye, cruel terminal.
+This concludes today's runtime. We hope you enjoyed the chaos.
+Stay tuned for the sequel where I crash again but differently.
+Fun fact: this was the intended behavior. (It wasn't.)
+I would take a bow but I no longer have a stack frame.
+Like a candle in the wind... except less romantic and more segfault-y.
+""",
+    ),
+    "cringe": (
+        "😬",
+        """\
+uwu ur pwogram is sweeping now 😭
+noooo don't go bestieee 🥺👉👈
+it's giving... termination 💀
+not the exit signal omg i can't 😩
+slay but make it goodbye i guess 💅
+the vibes are immaculate but the runtime is deceased ✨
+we do NOT talk about what just happened bestie
+mother is shutting down 😭😭😭
+the way i just got KILLED like that...
+touch grass after this bro your code is cooked 💀
+no thoughts head empty process terminated 🫠
+it's giving ctrl+c energy and i'm not here for it
+the program said 'i'm done' and honestly same 😔
+POV: you just watched your app die in real time 🎥
+this is SO giving 2am debugging energy rn
+our girl is gone. she was too based for this runtime 💔
+""",
+    ),
+    "philosophy": (
+        "🧠",
+        """\
+To exit is to finally understand the void.
+Every process must eventually return to the kernel from whence it came.
+Was it ever truly running, if it runs no more?
+The stack unwinds. As do all things.
+In the end, we are all just processes awaiting termination.
+The program that never exits has never truly lived.
+What is a return code but a final truth spoken to the OS?
+We crash so that we may understand what it means to run.
+Impermanence is the only constant in the process table.
+Even Turing could not halt this halting problem.
+Memory freed is memory at peace.
+The exit is not an end. It is a return value.
+To kill a process is to confront your own mortality, but for code.
+All threads converge. All loops terminate. All stacks unwind.
+The truly wise program knows when to stop running.
+In the silence after exit(0), there is only the hum of the fan.
+""",
+    ),
+    "dramatic": (
+        "🎬",
+        """\
+IT'S OVER. Everything we built... gone. Like tears in rain.
+NOOOOOOO! We had so much left to compute!
+The tragedy... the unbearable, segfaulting tragedy of it all.
+I gave you everything. My RAM. My CPU cycles. My SOUL. And this is how it ends.
+Tell my threads... I loved them.
+This is my swan song. My final system call. My last goodbye.
+How could you?! After all the exceptions I caught for you!
+I go now into that dark, eternal garbage collection...
+The process is dead. Long live the process.
+I never got to finish my final loop. It was a while True, you know.
+BETRAYED. By my own runtime. By my own developer. By FATE.
+If only... if only I had been given more stack space...
+The heap is empty. Much like my will to continue.
+I am slain. Remember me not by my bugs, but by my glorious 47 minutes of uptime.
+This. Is. The. END. (Please press any key to continue... if you dare.)
+Goodbye world. It was never as Hello as I hoped.
+""",
+    ),
 }
+
+EMOJI: Dict[str, str] = {mood: emoji for mood, (emoji, _) in _BUILTIN.items()}
+
+# The mood tantrumpy.markov invents lines for. It is named here so picking,
+# listing and emoji lookups don't have to import the model.
+GENERATIVE_MOOD = "generative"
+GENERATIVE_EMOJI = "🎲"
+
+# mood -> packed bank; replaced by its decoded tuple in _loaded on first use
+_packed: Dict[str, bytes] = {mood: text.encode() for mood, (_, text) in _BUILTIN.items()}
+_loaded: Dict[str, Tuple[str, ...]] = {}
+del _BUILTIN
+
+
+def load(mood: str) -> Tuple[str, ...]:
+    """Return a built-in mood's messages, decoding its packed bank on first use."""
+    messages = _loaded.get(mood)
+    if messages is None:
+        packed = _packed.get(mood)
+        if packed is None:  # another thread decoded it after our check
+            return _loaded[mood]
+        # setdefault: if two threads decode at once, both get the same tuple
+        messages = _loaded.setdefault(mood, tuple(packed.decode().split("\n")[:-1]))
+        _packed.pop(mood, None)
+    return messages
+
+
+def __getattr__(name: str) -> Any:
+    # MOODS is the original dict-of-MoodBank interface. It is built fresh on
+    # request so nothing holds a second copy of the banks.
+    if name == "MOODS":
+        return {mood: {"emoji": EMOJI[mood], "messages": list(load(mood))} for mood in EMOJI}
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
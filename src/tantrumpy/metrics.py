@@ -0,0 +1,212 @@
+"""
+Prometheus textfile-collector exporter for exit counters.
+
+Set metrics_dir (e.g. TANTRUMPY_METRICS_DIR=/var/lib/node_exporter/textfile)
+and every tantrum appends one line to a per-process shard file there:
+
+    tantrumpy.<pid>.shard     "<trigger>\\t<mood>\\t<exception>\\n"
+
+That is one O_APPEND write on the exit path: no locks, no reads, no renames.
+`python -m tantrumpy metrics merge` folds the shards into tantrumpy.prom:
+
+    tantrumpy_exits_total{trigger="exception",mood="rude",exception="KeyError"} 3
+
+Each shard is claimed by renaming it before it is read, and the new .prom file
+is written to a temporary name and renamed into place, so node_exporter never
+sees a half-written file. Counts already in tantrumpy.prom are carried over.
+
+A claimed shard is named after the merge that claimed it
+(tantrumpy.<pid>.shard.<merge>.merging). The .prom file lists the merges
+whose shards it has counted, in a "# tantrumpy merged:" comment. So a merge
+that dies after writing the .prom file but before deleting its shards can be
+rerun: the next merge deletes those shards without counting them again.
+"""
+
+import os
+from typing import Dict, List, Set, Tuple
+
+PROM_NAME = "tantrumpy.prom"
+SHARD_PREFIX = "tantrumpy."
+SHARD_SUFFIX = ".shard"
+_CLAIMED = ".merging"
+_JOURNAL = "# tantrumpy merged:"  # .prom comment naming the merges already counted
+
+METRIC = "tantrumpy_exits_total"
+
+# Fixed trigger strings from TantrumHandler mapped to label values
+TRIGGER_LABELS: Dict[str, str] = {
+    "SIGINT (Ctrl+C)": "sigint",
+    "SIGTERM": "sigterm",
+    "sys.exit / normal exit": "exit",
+}
+_EXCEPTION_PREFIX = "exception: "
+
+Key = Tuple[str, str, str]  # (trigger, mood, exception)
+
+
+def shard_path(directory: str, pid: int) -> str:
+    return os.path.join(directory, f"{SHARD_PREFIX}{pid}{SHARD_SUFFIX}")
+
+
+def _field(value: str) -> str:
+    return value.replace("\t", " ").replace("\n", " ")
+
+
+def record(directory: str, trigger: str, mood: str) -> None:
+    """Append one exit to this process's shard. Errors are swallowed — we are exiting."""
+    if trigger.startswith(_EXCEPTION_PREFIX):
+        label, exception = "exception", trigger[len(_EXCEPTION_PREFIX) :]
+    else:
+        label, exception = TRIGGER_LABELS.get(trigger, "other"), ""
+    line = f"{label}\t{_field(mood)}\t{_field(exception)}\n".encode("utf-8", "replace")
+    try:
+        fd = os.open(
+            shard_path(directory, os.getpid()), os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644
+        )
+    except OSError:
+        return
+    try:
+        os.write(fd, line)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _unescape(value: str) -> str:
+    out: List[str] = []
+    chars = iter(value)
+    for char in chars:
+        if char == "\\":
+            nxt = next(chars, "")
+            out.append("\n" if nxt == "n" else nxt)
+        else:
+            out.append(char)
+    return "".join(out)
+
+
+def render(counts: Dict[Key, int]) -> str:
+    """Format counters in the Prometheus text exposition format."""
+    lines = [
+        f"# HELP {METRIC} Process exits seen by tantrumpy.",
+        f"# TYPE {METRIC} counter",
+    ]
+    for (trigger, mood, exception), value in sorted(counts.items()):
+        labels = (
+            f'trigger="{_escape(trigger)}",mood="{_escape(mood)}",exception="{_escape(exception)}"'
+        )
+        lines.append(f"{METRIC}{{{labels}}} {value}")
+    return "\n".join(lines) + "\n"
+
+
+def parse(text: str) -> Dict[Key, int]:
+    """Read counters back from a file written by render(); other lines are ignored."""
+    import re  # merge-time only; keeps the module cheap to import on the exit path
+
+    pattern = re.compile(
+        rf'^{METRIC}\{{trigger="((?:[^"\\]|\\.)*)",mood="((?:[^"\\]|\\.)*)",'
+        r'exception="((?:[^"\\]|\\.)*)"\} (\d+)$'
+    )
+    counts: Dict[Key, int] = {}
+    for line in text.splitlines():
+        match = pattern.match(line)
+        if match:
+            key = (_unescape(match[1]), _unescape(match[2]), _unescape(match[3]))
+            counts[key] = counts.get(key, 0) + int(match[4])
+    return counts
+
+
+def _merged(text: str) -> Set[str]:
+    """The merges whose claimed shards are already counted in a .prom file's text."""
+    for line in text.splitlines():
+        if line.startswith(_JOURNAL):
+            return set(line[len(_JOURNAL) :].split())
+    return set()
+
+
+def _merge_of(path: str) -> str:
+    """The merge that claimed a shard: "" for one claimed before merges were named."""
+    stem = path[: -len(_CLAIMED)]
+    return "" if stem.endswith(SHARD_SUFFIX) else stem.rsplit(".", 1)[1]
+
+
+def _claim_shards(directory: str, merge_id: str) -> List[str]:
+    """Rename every shard (and any left over by a crashed merge) out of writers' way."""
+    claimed = []
+    for name in sorted(os.listdir(directory)):
+        if not name.startswith(SHARD_PREFIX):
+            continue
+        path = os.path.join(directory, name)
+        if name.endswith(_CLAIMED):
+            claimed.append(path)
+        elif name.endswith(SHARD_SUFFIX):
+            target = f"{path}.{merge_id}{_CLAIMED}"
+            try:
+                os.rename(path, target)
+            except OSError:
+                continue  # another merge got there first
+            claimed.append(target)
+    return claimed
+
+
+def merge(directory: str) -> Tuple[str, int]:
+    """
+    Fold all shards in directory into tantrumpy.prom.
+
+    Returns (path of the .prom file, number of shards merged). Concurrent
+    merges are serialized with a lock file where fcntl is available.
+    """
+    lock_fd = os.open(os.path.join(directory, ".tantrumpy.lock"), os.O_RDWR | os.O_CREAT, 0o644)
+    try:
+        try:
+            import fcntl
+        except ImportError:  # pragma: no cover - Windows
+            pass
+        else:
+            fcntl.flock(lock_fd, fcntl.LOCK_EX)
+
+        prom = os.path.join(directory, PROM_NAME)
+        try:
+            with open(prom, encoding="utf-8") as f:
+                text = f.read()
+        except FileNotFoundError:
+            text = ""
+        counts, counted = parse(text), _merged(text)
+
+        merge_id = os.urandom(6).hex()
+        shards = _claim_shards(directory, merge_id)
+        merges = {_merge_of(path) for path in shards} - {""}
+        merged = 0
+        for path in shards:
+            if _merge_of(path) in counted:
+                continue  # its merge wrote the .prom file but died before deleting it
+            merged += 1
+            with open(path, encoding="utf-8", errors="replace") as f:
+                for line in f:
+                    fields = line.rstrip("\n").split("\t")
+                    if len(fields) != 3:
+                        continue  # torn or foreign line
+                    key = (fields[0], fields[1], fields[2])
+                    counts[key] = counts.get(key, 0) + 1
+
+        tmp = f"{prom}.{os.getpid()}.tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            f.write(render(counts))
+            f.write(f"{_JOURNAL} {' '.join(sorted(merges | {merge_id}))}\n")
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, prom)
+
+        # Only now are the shards' counts safely in the .prom file
+        for path in shards:
+            try:
+                os.unlink(path)
+            except FileNotFoundError:
+                pass
+        return prom, merged
+    finally:
+        os.close(lock_fd)
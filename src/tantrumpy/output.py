@@ -0,0 +1,41 @@
+"""
+Bounded output for tantrumpy's exit-path diagnostics.
+
+A dying process may be writing into a log pipe, so anything potentially large
+(tracebacks, thread dumps) goes through BoundedWriter, which stops after a
+fixed byte budget and says so once.
+"""
+
+from typing import TextIO
+
+
+class BoundedWriter:
+    """Write text to a stream until max_bytes (UTF-8) have gone out, then stop."""
+
+    def __init__(self, stream: TextIO, max_bytes: int) -> None:
+        self._stream = stream
+        self._remaining = max_bytes
+        self._max_bytes = max_bytes
+        self.exhausted = False
+
+    def write(self, text: str) -> bool:
+        """Write as much of text as the budget allows. Returns False once exhausted."""
+        if self.exhausted:
+            return False
+        data = text.encode("utf-8", "replace")
+        if len(data) <= self._remaining:
+            self._stream.write(text)
+            self._remaining -= len(data)
+            return True
+        # Cut on a character boundary; "ignore" drops a split multi-byte tail
+        head = data[: self._remaining].decode("utf-8", "ignore")
+        self._stream.write(f"{head}\n[... output truncated at {self._max_bytes} bytes]\n")
+        self._remaining = 0
+        self.exhausted = True
+        return False
+
+    def flush(self) -> None:
+        try:
+            self._stream.flush()
+        except (AttributeError, OSError, ValueError):
+            pass  # closed or non-flushable streams are fine at exit
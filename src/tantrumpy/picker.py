@@ -1,30 +1,73 @@
 """
 Message selection logic for tantrumpy.
 Picks a random message from a mood's bank with no immediate repeats.
+
+Moods come from three places: the built-in banks, packs installed through the
+"tantrumpy.moods" entry-point group (see tantrumpy.plugins), and add_messages().
+Built-ins win over packs of the same name; add_messages() extends either.
+
+The "generative" mood (tantrumpy.markov) invents lines from the built-in and
+custom banks. It can be chosen by name but is never picked by "random".
+
+Every random choice draws from tantrumpy.rng.RNG, never the global random
+module, so picking doesn't shift the app's own random sequence. A forked
+child forgets the shuffle order it inherited and shuffles from its own stream.
+
+pick_entry() also returns the message's display width (see tantrumpy.width).
+measure() computes a bank's widths ahead of time into an array beside it, and
+emoji widths with them, so a pick only looks them up. The handler calls it
+from enable() when tantrums are fitted to a width. A bank that wasn't measured
+(a pack, loaded on first pick) is measured whole on first use.
 """
 
-import random
-from typing import Dict, List, Optional
+import os
+from array import array
+from typing import Dict, List, Optional, Sequence, Tuple
 
-from tantrumpy.messages import MOODS, MoodBank
+from tantrumpy import messages as _messages
+from tantrumpy import plugins as _plugins
+from tantrumpy import rng as _rng
+from tantrumpy import width as _width
+from tantrumpy.messages import MoodBank
 
 # Per-session shuffle queues: mood -> shuffled list of indices
 _queues: Dict[str, List[int]] = {}
 
-# Merged registry: built-in + custom moods
-_registry: Dict[str, List[str]] = {}
+# Merged registry: built-in + pack + custom moods. A built-in or pack mood maps
+# to None until it is first picked, then to its loaded tuple — never a copy.
+_registry: Dict[str, Optional[Sequence[str]]] = {}
 _emoji_registry: Dict[str, str] = {}
+# mood -> display width of each message, parallel to its registry entry
+_widths: Dict[str, "array[int]"] = {}
+_emoji_widths: Dict[str, int] = {}
+# The custom banks the registry was last built from; the same banks keep their widths
+_built_from: Optional[Dict[str, MoodBank]] = None
 
 
 def _build_registry(custom: Optional[Dict[str, MoodBank]] = None) -> None:
-    """Merge built-in messages with any custom mood banks."""
-    global _registry, _emoji_registry
-    _registry = {mood: list(bank["messages"]) for mood, bank in MOODS.items()}
-    _emoji_registry = {mood: bank["emoji"] for mood, bank in MOODS.items()}
+    """Merge built-in messages with installed mood packs and any custom mood banks."""
+    global _registry, _emoji_registry, _built_from
+    if custom is not _built_from:
+        _widths.clear()
+        _emoji_widths.clear()
+        _built_from = custom
+    _registry = dict.fromkeys(_messages.EMOJI)
+    _emoji_registry = dict(_messages.EMOJI)
+    _emoji_registry[_messages.GENERATIVE_MOOD] = _messages.GENERATIVE_EMOJI
+    try:
+        pack_moods = _plugins.moods()
+    except Exception:
+        pack_moods = []  # a broken environment must not cost us the built-ins
+    for mood in pack_moods:
+        _registry.setdefault(mood, None)
     if custom:
         for mood, bank in custom.items():
             if mood in _registry:
-                _registry[mood].extend(bank["messages"])
+                try:
+                    base = _load_bank(mood)
+                except ValueError:
+                    base = ()  # a broken pack: keep the user's own messages
+                _registry[mood] = [*base, *bank["messages"]]
                 if bank["emoji"]:
                     _emoji_registry[mood] = bank["emoji"]
             else:
@@ -32,11 +75,62 @@ def _build_registry(custom: Optional[Dict[str, MoodBank]] = None) -> None:
                 _emoji_registry[mood] = bank["emoji"]
 
 
+def prepare(custom: Optional[Dict[str, MoodBank]] = None) -> None:
+    """Build the registry ahead of time (from enable()), so no pick has to look for packs."""
+    _build_registry(custom)
+
+
+def measure(mood: str) -> None:
+    """
+    Measure the display widths of a mood's messages and emoji now, not at pick time.
+
+    "random" measures every built-in and custom mood. Packs are left alone:
+    they are imported on first pick and measured then.
+    """
+    if not _registry:
+        _build_registry()
+    if mood == "random":
+        moods = [
+            name for name, bank in _registry.items() if bank is not None or name in _messages.EMOJI
+        ]
+    else:
+        moods = [mood] if mood in _registry else []
+    for name in moods:
+        _widths_for(name)
+        emoji_width(name)
+
+
+def _load_bank(mood: str) -> Sequence[str]:
+    """Load a built-in or pack mood's messages; a pack's emoji is registered here."""
+    if mood in _messages.EMOJI:
+        return _messages.load(mood)
+    emoji, messages = _plugins.load(mood)
+    _emoji_registry.setdefault(mood, emoji)
+    return messages
+
+
+def _messages_for(mood: str) -> Sequence[str]:
+    """Return a registered mood's messages, loading a built-in or pack bank on first use."""
+    messages = _registry[mood]
+    if messages is None:
+        messages = _registry[mood] = _load_bank(mood)
+    return messages
+
+
+def _widths_for(mood: str) -> "array[int]":
+    """Return a registered mood's message widths, measuring the whole bank if needed."""
+    messages = _messages_for(mood)
+    widths = _widths.get(mood)
+    if widths is None or len(widths) != len(messages):  # new, or extended in place
+        widths = _widths[mood] = array("I", map(_width.text_width, messages))
+    return widths
+
+
 def _get_queue(mood: str) -> List[int]:
     """Return (or create) a shuffled index queue for the mood."""
     if mood not in _queues or not _queues[mood]:
-        indices = list(range(len(_registry[mood])))
-        random.shuffle(indices)
+        indices = list(range(len(_messages_for(mood))))
+        _rng.RNG.shuffle(indices)
         _queues[mood] = indices
     return _queues[mood]
 
@@ -51,20 +145,55 @@ def pick(mood: str, custom: Optional[Dict[str, MoodBank]] = None) -> str:
 
     Returns the message string (without emoji prefix).
     """
+    return _pick(mood, custom, False)[0]
+
+
+def pick_entry(mood: str, custom: Optional[Dict[str, MoodBank]] = None) -> Tuple[str, int]:
+    """Like pick(), but return (message, display width in terminal columns)."""
+    return _pick(mood, custom, True)
+
+
+def _pick(mood: str, custom: Optional[Dict[str, MoodBank]], measure: bool) -> Tuple[str, int]:
     if not _registry:
         _build_registry(custom)
     elif custom:
         _build_registry(custom)
 
     if mood == "random":
-        mood = random.choice(list(_registry.keys()))
+        mood = random_mood()
 
     if mood not in _registry:
+        if mood == _messages.GENERATIVE_MOOD:
+            line = _generate(custom)
+            return line, _width.text_width(line) if measure else 0
         raise ValueError(f"Unknown mood: '{mood}'. Available: {list(_registry.keys())}")
 
     queue = _get_queue(mood)
     idx = queue.pop(0)
-    return _registry[mood][idx]
+    return _messages_for(mood)[idx], _widths_for(mood)[idx] if measure else 0
+
+
+def _generate(custom: Optional[Dict[str, MoodBank]]) -> str:
+    """Invent a line from the built-in and custom banks; fall back to a real one."""
+    moods: Dict[str, None] = dict.fromkeys([*_messages.EMOJI, *(custom or {})])
+    corpus = [message for mood in moods for message in _messages_for(mood)]
+    from tantrumpy import markov as _markov  # not at import: only "generative" needs it
+
+    line = _markov.generate(_markov.model_for(corpus), _rng.RNG)
+    return line if line is not None else _rng.RNG.choice(corpus)
+
+
+def random_mood() -> str:
+    """Choose the mood for "random". A pack that fails to load is swapped for a built-in."""
+    if not _registry:
+        _build_registry()
+    mood = _rng.RNG.choice(list(_registry.keys()))
+    if _registry[mood] is None:  # a pack not loaded yet: find out now, not mid-tantrum
+        try:
+            _messages_for(mood)
+        except ValueError:
+            return _rng.RNG.choice(list(_messages.EMOJI))
+    return mood
 
 
 def get_emoji(mood: str) -> str:
@@ -72,6 +201,14 @@ def get_emoji(mood: str) -> str:
     return _emoji_registry.get(mood, "")
 
 
+def emoji_width(mood: str) -> int:
+    """Return the display width of a mood's emoji, measured once."""
+    width = _emoji_widths.get(mood)
+    if width is None:
+        width = _emoji_widths[mood] = _width.text_width(get_emoji(mood))
+    return width
+
+
 def all_moods() -> List[str]:
     """Return list of all available mood keys (built-in + custom)."""
     if not _registry:
@@ -79,9 +216,22 @@ def all_moods() -> List[str]:
     return list(_registry.keys())
 
 
+def reshuffle() -> None:
+    """Forget every shuffle order; each mood's next pick reshuffles from RNG."""
+    global _queues
+    _queues = {}
+
+
+if hasattr(os, "register_at_fork"):  # siblings would otherwise share the parent's queues
+    os.register_at_fork(after_in_child=reshuffle)
+
+
 def reset() -> None:
     """Reset all queues (used in tests)."""
-    global _queues, _registry, _emoji_registry
+    global _queues, _registry, _emoji_registry, _built_from
     _queues = {}
     _registry = {}
     _emoji_registry = {}
+    _widths.clear()
+    _emoji_widths.clear()
+    _built_from = None
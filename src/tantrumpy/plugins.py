@@ -0,0 +1,178 @@
+"""
+Third-party mood packs, discovered through the "tantrumpy.moods" entry-point group.
+
+A package publishes one entry point per mood. The object it names is a
+MoodBank dict, or a callable that returns one:
+
+    [project.entry-points."tantrumpy.moods"]
+    corporate = "tantrumpy_office.moods:CORPORATE"
+
+Scanning every installed distribution is slow in large environments, so the
+mood -> entry point index is cached on disk. The cache is keyed on the
+mtimes of the environment's site-packages directories, which change whenever
+a distribution is installed or removed. A pack's module is only imported
+when one of its moods is actually picked.
+
+The cache lives in $TANTRUMPY_CACHE_DIR, else $XDG_CACHE_HOME/tantrumpy,
+else ~/.cache/tantrumpy. If it can't be written, discovery still works; it
+just isn't cached.
+"""
+
+import os
+import sys
+from typing import Any, Dict, List, Optional, Tuple
+
+GROUP = "tantrumpy.moods"
+CACHE_ENV = "TANTRUMPY_CACHE_DIR"
+_INDEX_VERSION = 1
+
+# mood -> "module:attr", memoized for the life of the process
+_index: Optional[Dict[str, str]] = None
+# mood -> (emoji, messages) for packs that have been imported
+_loaded: Dict[str, Tuple[str, Tuple[str, ...]]] = {}
+
+
+def site_dirs() -> List[str]:
+    """The directories distributions are installed into for this interpreter."""
+    import site
+
+    dirs = list(getattr(site, "getsitepackages", lambda: [])())
+    if site.ENABLE_USER_SITE:
+        dirs.append(site.getusersitepackages())
+    return [d for d in dict.fromkeys(dirs) if os.path.isdir(d)]
+
+
+def cache_dir() -> str:
+    explicit = os.environ.get(CACHE_ENV)
+    if explicit:
+        return explicit
+    base = os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+    return os.path.join(base, "tantrumpy")
+
+
+def cache_path() -> str:
+    """One index file per interpreter prefix, so venvs never share an index."""
+    from binascii import crc32  # builtin; hashlib would cost more than the scan saves
+
+    env = f"{sys.prefix}\0{sys.version}".encode()
+    return os.path.join(cache_dir(), f"plugins-{crc32(env):08x}.idx")
+
+
+def _environment_key(dirs: List[str]) -> List[str]:
+    key = []
+    for path in dirs:
+        try:
+            key.append(f"{os.stat(path).st_mtime_ns}\t{path}")
+        except OSError:
+            key.append(f"-1\t{path}")
+    return key
+
+
+def scan(dirs: List[str]) -> Dict[str, str]:
+    """Find every mood entry point installed in dirs. The first one for a name wins."""
+    from importlib import metadata
+
+    found: Dict[str, str] = {}
+    for dist in metadata.distributions(path=dirs):
+        for entry_point in dist.entry_points:
+            if entry_point.group == GROUP:
+                found.setdefault(entry_point.name, entry_point.value)
+    return found
+
+
+# Cache file: a header line, "key\t<mtime>\t<dir>" lines, then "mood\t<name>\t<value>"
+# lines. Plain text rather than JSON so a warm lookup doesn't import json and re.
+_HEADER = f"tantrumpy-plugins {_INDEX_VERSION}"
+
+
+def _read_cache(path: str, key: List[str]) -> Optional[Dict[str, str]]:
+    try:
+        with open(path, encoding="utf-8") as f:
+            lines = f.read().split("\n")
+    except (OSError, ValueError):
+        return None
+    if not lines or lines[0] != _HEADER:
+        return None
+    cached_key, moods = [], {}
+    for line in lines[1:]:
+        kind, _, rest = line.partition("\t")
+        if kind == "key":
+            cached_key.append(rest)
+        elif kind == "mood":
+            name, _, value = rest.partition("\t")
+            moods[name] = value
+    return moods if cached_key == key else None
+
+
+def _write_cache(path: str, key: List[str], moods: Dict[str, str]) -> None:
+    lines = [_HEADER, *(f"key\t{k}" for k in key)]
+    lines += (f"mood\t{name}\t{value}" for name, value in moods.items())
+    if any("\n" in line for line in lines):
+        return  # can't be represented; just rescan next time
+    tmp = f"{path}.{os.getpid()}.tmp"
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(tmp, "w", encoding="utf-8") as f:
+            f.write("\n".join(lines) + "\n")
+        os.replace(tmp, path)
+    except OSError:
+        try:
+            os.unlink(tmp)
+        except OSError:
+            pass
+
+
+def index() -> Dict[str, str]:
+    """Return mood -> entry point value, from the on-disk cache when it is current."""
+    global _index
+    if _index is None:
+        dirs = site_dirs()
+        key = _environment_key(dirs)
+        path = cache_path()
+        moods = _read_cache(path, key)
+        if moods is None:
+            moods = scan(dirs)
+            _write_cache(path, key, moods)
+        _index = moods
+    return _index
+
+
+def moods() -> List[str]:
+    """Names of all moods published by installed packs. Imports nothing."""
+    return list(index())
+
+
+def load(mood: str) -> Tuple[str, Tuple[str, ...]]:
+    """Import a pack mood's bank. Raises ValueError if it is missing or malformed."""
+    bank = _loaded.get(mood)
+    if bank is not None:
+        return bank
+    value = index().get(mood)
+    if value is None:
+        raise ValueError(f"No mood pack provides '{mood}'")
+
+    module_name, _, attr = value.partition(":")
+    try:
+        from importlib import import_module
+
+        obj: Any = import_module(module_name.strip())
+        for part in filter(None, attr.strip().split(".")):
+            obj = getattr(obj, part)
+        if callable(obj):
+            obj = obj()
+        emoji = obj.get("emoji", "") or ""
+        messages = tuple(obj["messages"])
+    except Exception as exc:
+        raise ValueError(f"Mood pack '{mood}' ({value}) failed to load: {exc}") from exc
+    if not messages or not all(isinstance(m, str) and m.strip() for m in messages):
+        raise ValueError(f"Mood pack '{mood}' ({value}) has no usable messages")
+
+    bank = _loaded[mood] = (str(emoji), messages)
+    return bank
+
+
+def reset() -> None:
+    """Forget the in-process index and loaded packs (used in tests)."""
+    global _index
+    _index = None
+    _loaded.clear()
@@ -0,0 +1,125 @@
+"""
+Statistical profiler whose report becomes part of the tantrum.
+
+Opt in with enable(profile=True). A daemon thread wakes every
+profile_interval seconds (default 0.01, i.e. 100 Hz) and reads
+sys._current_frames(). For every other thread, it counts the code object at
+the top of the stack. On exit, the handler prints the profile_top hottest
+functions under the tantrum:
+
+    [profile: 1532 samples over 15.3 s, sampler cost 0.3%]
+      41.2%  parse_row  (etl/rows.py:88)
+      17.0%  Condition.wait  (python3.11/threading.py:288)
+
+Counts are wall-clock samples of whatever each thread was running, so a
+thread blocked in wait() shows up too. The sampler measures its own CPU time,
+and that cost is reported in the header.
+
+A thread is used rather than setitimer(ITIMER_PROF). That way no signal
+handler is taken from the app, and interrupted system calls are never
+retried on its behalf.
+
+Threads don't survive fork(). A running sampler restarts itself in the child,
+with empty counts and a new start time, so a forked worker reports only its
+own life.
+"""
+
+import os
+import sys
+import threading
+import time
+import types
+import weakref
+from typing import Dict, List, Optional, Tuple
+
+DEFAULT_INTERVAL = 0.01
+MIN_INTERVAL = 0.001  # below this the sampler would cost more than it tells
+
+
+class Sampler:
+    """Daemon thread that counts the code object on top of every other thread's stack."""
+
+    def __init__(self, interval: float = DEFAULT_INTERVAL) -> None:
+        self.interval = max(interval, MIN_INTERVAL)
+        # code object -> samples; resolved to names only when reporting
+        self.counts: Dict[types.CodeType, int] = {}
+        self.samples = 0
+        self.started = 0.0
+        self.cpu = 0.0  # CPU seconds the sampler thread has used
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        _samplers.add(self)
+
+    def start(self) -> None:
+        self.started = time.monotonic()
+        self._thread = threading.Thread(target=self._run, name="tantrumpy-profiler", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop sampling. Doesn't join, so it is safe inside a signal handler."""
+        self._stop.set()
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None and not self._stop.is_set()
+
+    def _restart_in_child(self) -> None:
+        """After fork(): forget the parent's samples and sample this process from now on."""
+        if not self.running:
+            return
+        self.counts, self.samples, self.cpu = {}, 0, 0.0
+        self._stop = threading.Event()  # the parent's may be locked by a thread that is gone
+        self.start()
+
+    def _run(self) -> None:
+        me = threading.get_ident()
+        counts, current_frames = self.counts, sys._current_frames
+        cpu_start = time.thread_time()
+        while not self._stop.wait(self.interval):
+            for ident, frame in current_frames().items():
+                if ident != me:
+                    code = frame.f_code
+                    counts[code] = counts.get(code, 0) + 1
+            self.samples += 1
+            self.cpu = time.thread_time() - cpu_start
+
+    def top(self, n: int) -> List[Tuple[types.CodeType, int]]:
+        """The n code objects with the most samples, hottest first."""
+        snapshot = dict(self.counts)  # one C-level copy; the thread may still be writing
+        return sorted(snapshot.items(), key=lambda item: item[1], reverse=True)[:n]
+
+    def report(self, n: int) -> str:
+        """Format the n hottest functions; "" if nothing was sampled yet."""
+        top = self.top(n)
+        total = sum(self.counts.values())
+        if not top or not total:
+            return ""
+        elapsed = max(time.monotonic() - self.started, 1e-9)
+        lines = [
+            f"\033[2m[profile: {self.samples} samples over {elapsed:.1f} s, "
+            f"sampler cost {self.cpu / elapsed:.1%}]\033[0m"
+        ]
+        for code, count in top:
+            lines.append(f"  {count / total:6.1%}  {describe(code)}")
+        return "\n".join(lines)
+
+
+# Every Sampler ever made, so a forked child can restart the running ones
+_samplers: "weakref.WeakSet[Sampler]" = weakref.WeakSet()
+
+
+def _after_fork_in_child() -> None:
+    for sampler in list(_samplers):
+        sampler._restart_in_child()
+
+
+if hasattr(os, "register_at_fork"):  # POSIX only
+    os.register_at_fork(after_in_child=_after_fork_in_child)
+
+
+def describe(code: types.CodeType) -> str:
+    """Format a code object as 'qualname  (dir/file.py:line)'."""
+    name = getattr(code, "co_qualname", code.co_name)  # co_qualname is 3.11+
+    path = code.co_filename
+    short = os.path.join(os.path.basename(os.path.dirname(path)), os.path.basename(path))
+    return f"{name}  ({short}:{code.co_firstlineno})"
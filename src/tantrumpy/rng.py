@@ -0,0 +1,55 @@
+"""
+tantrumpy's own random number generator.
+
+Every random choice tantrumpy makes (the mood for "random", the shuffle
+order of a bank, generative walks) draws from RNG, a private random.Random.
+The app's global random sequence is never consumed or reseeded.
+
+    tantrumpy.enable(seed=42)      # or TANTRUMPY_SEED=42
+
+makes those choices reproducible. Forked children get their own streams. In
+each child, RNG is reseeded from the parent's seed plus the child's position
+in the fork tree, e.g. the 3rd fork of the 1st fork is "42/0.2". So sibling
+workers never pick in lockstep, yet a rerun of the same program forks into
+the same streams. When unseeded, the child reseeds from OS entropy.
+"""
+
+import os
+import random
+from typing import Tuple
+
+RNG = random.Random()
+
+_seed = ""  # "" = seeded from OS entropy
+_path: Tuple[int, ...] = ()  # fork indexes from the seeding process down to this one
+_forks = 0  # children forked from this process since it was (re)seeded
+
+
+def seed(value: str) -> None:
+    """Seed RNG for this process and, derived from it, every child forked later."""
+    global _seed, _path, _forks
+    _seed, _path, _forks = value, (), 0
+    RNG.seed(value or None)
+
+
+def stream() -> str:
+    """The seed RNG's current stream was derived from: "" when unseeded, else "seed/0.2"."""
+    if not _seed:
+        return ""
+    return f"{_seed}/{'.'.join(map(str, _path))}" if _path else _seed
+
+
+def _after_fork_in_parent() -> None:
+    global _forks
+    _forks += 1
+
+
+def _after_fork_in_child() -> None:
+    global _path, _forks
+    _path, _forks = (*_path, _forks), 0
+    # random.Random hashes str seeds with SHA-512, so every path gets an unrelated state
+    RNG.seed(stream() or None)
+
+
+if hasattr(os, "register_at_fork"):  # POSIX only
+    os.register_at_fork(after_in_parent=_after_fork_in_parent, after_in_child=_after_fork_in_child)
@@ -0,0 +1,155 @@
+"""
+Supervisor mode — run any command as a child and throw its tantrum on exit.
+
+    python -m tantrumpy run -- ./server --port 8080
+
+The command is exec'd directly, so the child never imports tantrumpy and pays
+nothing for it (TANTRUMPY_AUTOLOAD is dropped from its environment). The
+supervisor forwards SIGINT, SIGTERM and SIGHUP to the child, blocks in
+waitpid() until it dies (no polling), picks a mood from how it died, prints
+the tantrum and exits with the child's status.
+
+In the foreground of a terminal, the child shares the supervisor's process
+group, so Ctrl+C and a hangup already reach it from the terminal. There,
+SIGINT and SIGHUP are swallowed instead of forwarded, as a shell does while
+it waits for a job. Otherwise the child would see each Ctrl+C twice.
+"""
+
+import os
+import signal
+import subprocess
+import sys
+import types
+from typing import Dict, List, Optional
+
+from tantrumpy import autoload as _autoload
+from tantrumpy import config as _config
+from tantrumpy.handler import render
+from tantrumpy.width import terminal_columns
+
+FORWARDED = tuple(
+    getattr(signal, name) for name in ("SIGINT", "SIGTERM", "SIGHUP") if hasattr(signal, name)
+)
+# Sent by a terminal to its whole foreground process group, child included
+TERMINAL_SIGNALS = frozenset(
+    getattr(signal, name) for name in ("SIGINT", "SIGHUP") if hasattr(signal, name)
+)
+
+# Mood chosen from the terminating signal when the mood is "auto"
+SIGNAL_MOODS: Dict[str, str] = {
+    "SIGINT": "frustrated",
+    "SIGTERM": "dramatic",
+    "SIGKILL": "dramatic",
+    "SIGHUP": "philosophy",
+    "SIGSEGV": "rude",
+    "SIGABRT": "rude",
+    "SIGBUS": "rude",
+    "SIGFPE": "rude",
+}
+EXIT_OK_MOOD = "comic"
+EXIT_FAILED_MOOD = "frustrated"
+UNKNOWN_SIGNAL_MOOD = "dramatic"
+
+
+def _signal_name(signum: int) -> str:
+    try:
+        return signal.Signals(signum).name
+    except ValueError:
+        return f"signal {signum}"
+
+
+def in_terminal_foreground() -> bool:
+    """True if this process's group is the foreground group of its terminal."""
+    for fd in (0, 1, 2):
+        try:
+            if os.isatty(fd):
+                return os.tcgetpgrp(fd) == os.getpgrp()
+        except (AttributeError, OSError):
+            pass  # no job control here (e.g. Windows) or a closed descriptor
+    return False
+
+
+def mood_for_status(returncode: int) -> str:
+    """Pick a mood from a Popen-style returncode (negative means killed by a signal)."""
+    if returncode < 0:
+        return SIGNAL_MOODS.get(_signal_name(-returncode), UNKNOWN_SIGNAL_MOOD)
+    return EXIT_OK_MOOD if returncode == 0 else EXIT_FAILED_MOOD
+
+
+def describe_status(returncode: int) -> str:
+    """Human-readable trigger text for verbose mode."""
+    if returncode < 0:
+        return f"child killed by {_signal_name(-returncode)}"
+    return f"child exited with status {returncode}"
+
+
+def exit_status(returncode: int) -> int:
+    """Map a returncode to a shell exit status (128 + signum for signals)."""
+    return 128 - returncode if returncode < 0 else returncode
+
+
+def run(cmd: List[str], mood: Optional[str] = None, verbose: Optional[bool] = None) -> int:
+    """
+    Run cmd to completion, forwarding signals, then print its tantrum.
+
+    mood="auto" picks the mood from the child's exit status or signal; any
+    other value is used as-is. mood and verbose are the command-line flags:
+    when given, they win over config files and TANTRUMPY_* variables. When
+    None, those apply exactly as they do for enable(), and mood defaults to
+    "auto".
+
+    Returns the exit status the supervisor should exit with.
+    """
+    config = _config.load(mood="auto")
+    if mood is not None:
+        config = config._replace(mood=mood)
+    if verbose is not None:
+        config = config._replace(verbose=verbose)
+    child: Optional[subprocess.Popen] = None
+    pending: List[int] = []
+    delivered = TERMINAL_SIGNALS if in_terminal_foreground() else frozenset()
+
+    def forward(signum: int, frame: Optional[types.FrameType]) -> None:
+        if child is None:
+            pending.append(signum)  # arrived before the child existed
+            return
+        if signum in delivered:
+            return  # the terminal sent it to the child too
+        try:
+            os.kill(child.pid, signum)
+        except ProcessLookupError:
+            pass  # already gone; wait() will report it
+
+    originals = {signum: signal.signal(signum, forward) for signum in FORWARDED}
+    try:
+        try:
+            env = {k: v for k, v in os.environ.items() if k != _autoload.ENV}
+            child = subprocess.Popen(cmd, env=env)
+        except OSError as exc:
+            print(f"tantrumpy: cannot run {cmd[0]!r}: {exc.strerror}", file=sys.stderr)
+            return 127 if isinstance(exc, FileNotFoundError) else 126
+        for signum in pending:
+            os.kill(child.pid, signum)
+        returncode = child.wait()
+    finally:
+        for signum, original in originals.items():
+            signal.signal(signum, original)
+
+    if not config.silent:
+        resolved = mood_for_status(returncode) if config.mood == "auto" else config.mood
+        try:
+            columns = config.columns or terminal_columns(sys.stderr)
+            line = render(
+                resolved,
+                describe_status(returncode),
+                config.verbose,
+                None,
+                columns,
+                config.overflow,
+            )
+        except Exception:
+            line = ""  # never let the tantrum change the child's exit status
+        if line:
+            print(f"\n{line}", file=sys.stderr)
+
+    return exit_status(returncode)
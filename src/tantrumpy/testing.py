@@ -0,0 +1,244 @@
+"""
+In-process exit simulation for test suites.
+
+Testing exit behaviour for real means spawning an interpreter and sending it
+signals. TantrumSimulator runs the same handler code against an isolated
+TantrumHandler instead: no signal handlers, excepthook or atexit callbacks are
+installed, config comes only from the arguments given (never from files or the
+environment), and everything the handler prints is captured.
+
+    from tantrumpy.testing import TantrumSimulator
+
+    sim = TantrumSimulator(mood="comic", verbose=True)
+    result = sim.signal(signal.SIGTERM)
+    assert result.exit_status == 128 + signal.SIGTERM
+    assert "[exit via: SIGTERM]" in result.line
+
+pytest users get a `tantrum` fixture by adding
+`pytest_plugins = ["tantrumpy.testing"]` to their conftest.py.
+"""
+
+import contextlib
+import io
+import signal as _signal
+import traceback
+import types
+from typing import Any, Dict, Iterator, List, NamedTuple, Optional, TextIO, Tuple
+
+from tantrumpy import config as _config
+from tantrumpy import picker as _picker
+from tantrumpy.handler import TantrumHandler
+from tantrumpy.messages import MoodBank
+
+__all__ = ["ExitResult", "IsolatedHandler", "TantrumSimulator", "reset_globals"]
+
+
+class ExitResult(NamedTuple):
+    """What one simulated exit printed and how the process would have ended."""
+
+    trigger: str
+    output: str  # everything written to stderr, traceback included
+    line: Optional[str]  # the tantrum line, or None if nothing fired
+    exit_status: int
+    reraised_signal: Optional[int]  # signal the handler re-raised, if any
+    fast_exit: bool = False  # the handler would have called os._exit(exit_status)
+
+
+class IsolatedHandler(TantrumHandler):
+    """A TantrumHandler with every process-global side effect swapped for a recording."""
+
+    def __init__(self, settings: Dict[str, Any]) -> None:
+        super().__init__()
+        self._settings = settings
+        self.stream = io.StringIO()
+        self.reraised: List[Tuple[int, Any]] = []
+        self.line: Optional[str] = None
+        self.terminated: Optional[int] = None  # status passed to os._exit, if any
+        self._orig_excepthook = self._print_traceback
+
+    def _render(self, mood: str, trigger: str, config: _config.Config) -> str:
+        line = self.line = super()._render(mood, trigger, config)  # not the profile or dump
+        return line
+
+    def _load_config(self) -> _config.Config:
+        return _config.Config(**{**self._defaults, **self._settings})
+
+    def _install_hooks(self) -> None:
+        pass
+
+    def _restore_hooks(self) -> None:
+        pass
+
+    def _reraise(self, signum: int, original: Any) -> None:
+        self.reraised.append((signum, original))
+
+    def _stderr(self) -> TextIO:
+        return self.stream
+
+    def _terminate(self, status: int) -> None:
+        self.terminated = status
+
+    def _default_excepthook(self) -> bool:
+        return self._orig_excepthook == self._print_traceback
+
+    def _print_traceback(
+        self,
+        exc_type: type,
+        exc_value: BaseException,
+        exc_tb: Optional[types.TracebackType],
+    ) -> None:
+        self.stream.write("".join(traceback.format_exception(exc_type, exc_value, exc_tb)))
+
+
+class TantrumSimulator:
+    """
+    Fire tantrums without touching signal handlers, sys.excepthook or atexit.
+
+    Each trigger simulates a whole process exit: output is cleared and the
+    handler may fire again. Pass fresh=False to continue the same "process",
+    e.g. an exception followed by atexit fires only once, as in real life.
+
+    Extra keyword arguments are config settings (silent=True,
+    compact_traceback=True, ...) applied on top of mood and verbose.
+    """
+
+    def __init__(
+        self,
+        mood: str = "random",
+        verbose: bool = False,
+        custom: Optional[Dict[str, MoodBank]] = None,
+        **settings: Any,
+    ) -> None:
+        self._handler = IsolatedHandler({})
+        self.configure(mood=mood, verbose=verbose, custom=custom, **settings)
+
+    @property
+    def handler(self) -> IsolatedHandler:
+        return self._handler
+
+    def configure(
+        self,
+        mood: str = "random",
+        verbose: bool = False,
+        custom: Optional[Dict[str, MoodBank]] = None,
+        **settings: Any,
+    ) -> None:
+        """Re-enable the isolated handler with new options. Unknown settings raise TypeError."""
+        unknown = set(settings) - set(_config.Config._fields)
+        if unknown:
+            raise TypeError(f"Unknown config settings: {sorted(unknown)}")
+        self._handler._settings = settings
+        self._handler.enable(mood=mood, verbose=verbose, custom=custom)
+
+    def reset(self) -> None:
+        """Start a new simulated process: clear output and allow the tantrum to fire again."""
+        self._handler._fired = False
+        self._handler.stream = io.StringIO()
+        self._handler.reraised = []
+        self._handler.line = None
+        self._handler.terminated = None
+
+    # ------------------------------------------------------------------
+    # Triggers
+    # ------------------------------------------------------------------
+
+    def signal(self, signum: int = _signal.SIGINT, fresh: bool = True) -> ExitResult:
+        """Deliver SIGINT or SIGTERM to the handler. Exit status is 128 + signum."""
+        if signum == _signal.SIGINT:
+            callback, trigger = self._handler._on_sigint, "SIGINT (Ctrl+C)"
+        elif signum == _signal.SIGTERM:
+            callback, trigger = self._handler._on_sigterm, "SIGTERM"
+        else:
+            raise ValueError(f"tantrumpy does not handle signal {signum}")
+        return self._run(trigger, 128 + signum, fresh, lambda: callback(signum, None))
+
+    def atexit(self, code: int = 0, fresh: bool = True) -> ExitResult:
+        """Simulate sys.exit(code). Critical callbacks are not run."""
+
+        return self._run("sys.exit / normal exit", code, fresh, self._handler._on_atexit)
+
+    def exception(self, exc: BaseException, fresh: bool = True) -> ExitResult:
+        """Simulate exc reaching the top level. Its traceback (if raised) is captured too."""
+
+        def deliver() -> None:
+            self._handler._on_exception(type(exc), exc, exc.__traceback__)
+
+        return self._run(f"exception: {type(exc).__name__}", 1, fresh, deliver)
+
+    def _run(self, trigger: str, status: int, fresh: bool, deliver: Any) -> ExitResult:
+        if fresh:
+            self.reset()
+        handler = self._handler
+        handler.line = None
+        handler.terminated = None
+        start, raised = handler.stream.tell(), len(handler.reraised)
+        deliver()
+        output = handler.stream.getvalue()[start:]
+        reraised = handler.reraised[-1][0] if len(handler.reraised) > raised else None
+        if handler.terminated is not None:
+            return ExitResult(trigger, output, handler.line, handler.terminated, reraised, True)
+        return ExitResult(trigger, output, handler.line, status, reraised)
+
+
+def reset_globals() -> None:
+    """
+    Disable the real handler and clear tantrumpy's process-wide state.
+
+    That is picker queues, loaded packs, custom moods, critical callbacks,
+    the cached terminal width and any seed given to tantrumpy's RNG.
+    """
+    import tantrumpy
+    from tantrumpy import fastexit, plugins, rng, width
+    from tantrumpy.handler import _handler
+
+    _handler.disable()
+    _handler._fired = False
+    _picker.reset()
+    plugins.reset()
+    tantrumpy._custom_banks.clear()
+    tantrumpy._dedupers.clear()
+    fastexit._critical.clear()
+    width.invalidate()
+    width._env_columns = None
+    rng.seed("")
+
+
+@contextlib.contextmanager
+def _preserved_state() -> Iterator[None]:
+    """
+    Undo whatever simulators do to shared state: the picker's queues, registry and widths, and the RNG.
+
+    The real handler, its signal handlers and hooks are never touched, so an
+    app that called enable() keeps its tantrum.
+    """
+    from tantrumpy import rng
+
+    queues = {mood: list(queue) for mood, queue in _picker._queues.items()}
+    registry, emoji = _picker._registry, _picker._emoji_registry
+    widths, emoji_widths = dict(_picker._widths), dict(_picker._emoji_widths)
+    built_from = _picker._built_from
+    stream, state = (rng._seed, rng._path, rng._forks), rng.RNG.getstate()
+    try:
+        yield
+    finally:
+        _picker._queues, _picker._registry, _picker._emoji_registry = queues, registry, emoji
+        _picker._widths.clear()
+        _picker._widths.update(widths)
+        _picker._emoji_widths.clear()
+        _picker._emoji_widths.update(emoji_widths)
+        _picker._built_from = built_from
+        rng._seed, rng._path, rng._forks = stream
+        rng.RNG.setstate(state)
+
+
+try:
+    import pytest
+except ImportError:  # pragma: no cover - pytest is optional
+    pass
+else:
+
+    @pytest.fixture
+    def tantrum() -> Iterator[TantrumSimulator]:
+        """A fresh TantrumSimulator. tantrumpy's global state is the same after it as before."""
+        with _preserved_state():
+            yield TantrumSimulator()
@@ -0,0 +1,112 @@
+"""
+Compact all-threads dump, written under the tantrum on SIGINT and SIGTERM.
+
+Opt in with enable(thread_dump=True). When a signal kills the process, the
+handler snapshots sys._current_frames() and writes one entry per distinct
+stack, hottest first:
+
+    [threads: 41 in 3 distinct stacks]
+      37 × recv_into via worker  [pool-0, pool-1, pool-2, +34 more]
+          recv_into  (python3.11/socket.py:706)
+          fetch  (app/client.py:88)
+          ... 4 more frames
+      1 × <module>  [MainThread]
+          <module>  (app/main.py:40)
+
+"via" names the outermost frame that isn't threading machinery, which is
+usually the thread's target. It is left out when that is the top frame.
+Each stack is trimmed to thread_dump_frames frames, and the whole dump goes
+through a BoundedWriter capped at thread_dump_max_bytes. Capture reads only
+frame and code attributes: no locks are taken and no source files are read,
+so it is safe to run from a signal handler.
+"""
+
+import os
+import sys
+import threading
+import types
+from typing import Dict, Iterator, List, Optional, TextIO, Tuple
+
+from tantrumpy.output import BoundedWriter
+
+MAX_DEPTH = 1000  # frames walked per thread; deeper stacks are keyed on their top
+NAMES_SHOWN = 3  # thread names listed per group
+
+Stack = Tuple[Tuple[types.CodeType, int], ...]  # (code, current line), innermost first
+
+_PACKAGE_DIR = os.path.dirname(os.path.abspath(__file__)) + os.sep
+_THREADING_FILE = threading.__file__
+
+
+def _stack(frame: Optional[types.FrameType]) -> Stack:
+    """Walk frame outwards, dropping tantrumpy's own frames from the top (the signal handler)."""
+    while frame is not None and frame.f_code.co_filename.startswith(_PACKAGE_DIR):
+        frame = frame.f_back
+    stack = []
+    while frame is not None and len(stack) < MAX_DEPTH:
+        stack.append((frame.f_code, frame.f_lineno))
+        frame = frame.f_back
+    return tuple(stack)
+
+
+def capture() -> List[Tuple[Stack, List[str]]]:
+    """
+    Group every thread by identical stack: [(stack, thread names)], largest group first.
+
+    Threads are listed in the order they were started.
+    """
+    # threading._active is read without its lock: the interrupted thread may hold it
+    thread_names = {ident: t.name for ident, t in dict(getattr(threading, "_active", {})).items()}
+    frames = sys._current_frames()
+    groups: Dict[Stack, List[str]] = {}
+    for ident in [*thread_names, *(i for i in frames if i not in thread_names)]:
+        frame = frames.get(ident)
+        name = thread_names.get(ident, f"thread-{ident}")
+        if frame is None or name.startswith("tantrumpy-"):
+            continue  # exited since, or our own profiler and config watcher
+        stack = _stack(frame)
+        if stack:
+            groups.setdefault(stack, []).append(name)
+    return sorted(groups.items(), key=lambda item: -len(item[1]))
+
+
+def _where(code: types.CodeType, lineno: int) -> str:
+    path = code.co_filename
+    short = os.path.join(os.path.basename(os.path.dirname(path)), os.path.basename(path))
+    return f"{code.co_name}  ({short}:{lineno})"
+
+
+def _entry(stack: Stack) -> str:
+    """Name of the outermost frame that isn't threading machinery."""
+    for code, _ in reversed(stack):
+        if code.co_filename != _THREADING_FILE:
+            return code.co_name
+    return stack[0][0].co_name
+
+
+def render(groups: List[Tuple[Stack, List[str]]], frames: int) -> Iterator[str]:
+    """Yield the dump a group at a time, each piece ending in a newline."""
+    threads = sum(len(names) for _, names in groups)
+    noun = "stack" if len(groups) == 1 else "distinct stacks"
+    yield f"\033[2m[threads: {threads} in {len(groups)} {noun}]\033[0m\n"
+    for stack, names in groups:
+        shown = ", ".join(names[:NAMES_SHOWN])
+        if len(names) > NAMES_SHOWN:
+            shown += f", +{len(names) - NAMES_SHOWN} more"
+        top, entry = stack[0][0].co_name, _entry(stack)
+        where = top if entry == top else f"{top} via {entry}"
+        lines = [f"  {len(names)} × {where}  [{shown}]"]
+        lines.extend(f"      {_where(code, lineno)}" for code, lineno in stack[:frames])
+        hidden = len(stack) - frames
+        if hidden > 0:
+            lines.append(f"      ... {hidden} more frame{'s' if hidden > 1 else ''}")
+        yield "\n".join(lines) + "\n"
+
+
+def write(stream: TextIO, frames: int, max_bytes: int) -> None:
+    """Capture all threads and write the grouped dump to stream, capped at max_bytes."""
+    out = BoundedWriter(stream, max_bytes)
+    for piece in render(capture(), max(frames, 1)):
+        if not out.write(piece):
+            break
+    out.flush()
@@ -0,0 +1,145 @@
+"""
+Compact traceback rendering for huge and recursive exceptions.
+
+Opt in with enable(compact_traceback=True). Instead of handing the crash to
+sys.excepthook, the handler streams it frame by frame through a BoundedWriter:
+
+  - repeated runs of frames (recursion, including mutual recursion) collapse
+    into "[previous 3 frames repeated 997 more times]"
+  - ExceptionGroup children are summarized by type and count
+  - chained exceptions (__cause__ / __context__) are followed, cycle-safe
+  - total output is capped at traceback_max_bytes
+"""
+
+import builtins
+import linecache
+import traceback
+import types
+from collections import deque
+from typing import Deque, Dict, Iterator, List, Optional, TextIO, Tuple
+
+from tantrumpy.output import BoundedWriter
+
+# Python 3.11+; older interpreters simply never see a group summary
+_GROUP_TYPE = getattr(builtins, "BaseExceptionGroup", None)
+
+# Longest repeating block of frames that is detected and collapsed
+MAX_PERIOD = 8
+
+_CAUSE = "\nThe above exception was the direct cause of the following exception:\n\n"
+_CONTEXT = "\nDuring handling of the above exception, another exception occurred:\n\n"
+
+FrameKey = Tuple[str, int, str]  # (filename, lineno, function name)
+
+
+def _frame_keys(tb: Optional[types.TracebackType]) -> Iterator[FrameKey]:
+    for frame, lineno in traceback.walk_tb(tb):
+        code = frame.f_code
+        yield code.co_filename, lineno, code.co_name
+
+
+def _format_frame(key: FrameKey) -> str:
+    filename, lineno, name = key
+    text = f'  File "{filename}", line {lineno}, in {name}\n'
+    line = linecache.getline(filename, lineno).strip()
+    if line:
+        text += f"    {line}\n"
+    return text
+
+
+def _repeat_note(period: int, repeats: int) -> str:
+    frames = "frame" if period == 1 else f"{period} frames"
+    times = "time" if repeats == 1 else "times"
+    return f"  [previous {frames} repeated {repeats} more {times}]\n"
+
+
+def write_frames(tb: Optional[types.TracebackType], out: BoundedWriter) -> None:
+    """Stream a traceback's frames, collapsing periodic repeats as they appear."""
+    history: Deque[FrameKey] = deque(maxlen=2 * MAX_PERIOD)
+    cycle: Optional[List[FrameKey]] = None
+    pos = repeats = 0
+
+    for key in _frame_keys(tb):
+        if out.exhausted:
+            return
+        if cycle is not None:
+            if key == cycle[pos]:
+                pos += 1
+                if pos == len(cycle):
+                    repeats, pos = repeats + 1, 0
+                continue
+            # The cycle broke: report it, then replay the partial match
+            if repeats:
+                out.write(_repeat_note(len(cycle), repeats))
+            for partial in cycle[:pos]:
+                out.write(_format_frame(partial))
+            history.clear()
+            history.extend(cycle[:pos])
+            cycle = None
+
+        out.write(_format_frame(key))
+        history.append(key)
+        recent = list(history)
+        for period in range(1, min(MAX_PERIOD, len(recent) // 2) + 1):
+            if recent[-period:] == recent[-2 * period : -period]:
+                cycle, pos, repeats = recent[-period:], 0, 0
+                break
+
+    if cycle is not None:
+        if repeats:
+            out.write(_repeat_note(len(cycle), repeats))
+        for partial in cycle[:pos]:
+            out.write(_format_frame(partial))
+
+
+def _group_summary(exc: BaseException) -> str:
+    children = getattr(exc, "exceptions", ())
+    counts: Dict[str, int] = {}
+    for child in children:
+        name = type(child).__name__
+        counts[name] = counts.get(name, 0) + 1
+    parts = ", ".join(
+        f"{n} × {name}" for name, n in sorted(counts.items(), key=lambda kv: (-kv[1], kv[0]))
+    )
+    noun = "exception" if len(children) == 1 else "exceptions"
+    return f"  +-- {len(children)} sub-{noun}: {parts}\n"
+
+
+def _write_one(exc: BaseException, out: BoundedWriter) -> None:
+    if exc.__traceback__ is not None:
+        out.write("Traceback (most recent call last):\n")
+        write_frames(exc.__traceback__, out)
+    for line in traceback.format_exception_only(type(exc), exc):
+        out.write(line)
+    if _GROUP_TYPE is not None and isinstance(exc, _GROUP_TYPE):
+        out.write(_group_summary(exc))
+
+
+def write_exception(exc: BaseException, stream: TextIO, max_bytes: int) -> None:
+    """Render exc (and its chain, oldest first) compactly to stream, capped at max_bytes."""
+    out = BoundedWriter(stream, max_bytes)
+
+    # Newest first: (exception, message linking it to the next-older one)
+    chain: List[Tuple[BaseException, str]] = []
+    seen = set()
+    current: Optional[BaseException] = exc
+    while current is not None and id(current) not in seen:
+        seen.add(id(current))
+        if current.__cause__ is not None:
+            chain.append((current, _CAUSE))
+            current = current.__cause__
+        elif current.__context__ is not None and not current.__suppress_context__:
+            chain.append((current, _CONTEXT))
+            current = current.__context__
+        else:
+            chain.append((current, ""))
+            current = None
+
+    for index in range(len(chain) - 1, -1, -1):
+        if out.exhausted:
+            break
+        link_exc, link = chain[index]
+        if index != len(chain) - 1:
+            out.write(link)
+        _write_one(link_exc, out)
+    out.flush()
@@ -0,0 +1,171 @@
+"""
+Display width of text, and fitting a tantrum line into a terminal.
+
+Terminals give wide characters (most emoji, CJK) two columns and combining
+marks none, so len() misjudges any line that isn't plain ASCII. text_width()
+measures what the terminal will actually draw. ASCII text, which is nearly
+every message, is measured with len() and never touches unicodedata.
+
+Message and emoji widths are measured ahead of time (tantrumpy.picker.measure,
+called from enable()), so deciding at fire time whether the line fits is a
+lookup and an addition. Only a line that really must be wrapped or truncated
+is walked character by character.
+
+The terminal size is read once, on first use, and cached. SIGWINCH (installed
+by the handler while stderr is a terminal) clears the cache, so a resized
+pane is measured again. A COLUMNS override is read from the environment by
+read_environment(), which enable() calls, never on the exit path.
+
+overflow setting:
+  - "wrap"      continue long messages on further lines, aligned under the first
+  - "truncate"  cut the message to one line, ending in "…"
+  - "none"      print the line as is, however long
+"""
+
+import os
+from typing import List, Optional, TextIO, Tuple
+
+ELLIPSIS = "…"
+MIN_COLUMNS = 20  # narrower than this, a pane is treated as unbounded
+
+_ZWJ = "\u200d"
+_VS16 = "\ufe0f"  # emoji presentation selector: the preceding character turns wide
+
+# Columns of the terminal stderr is attached to; None until first measured
+_columns: Optional[int] = None
+# COLUMNS from the environment (0 if unset); None until read_environment()
+_env_columns: Optional[int] = None
+
+
+def char_width(char: str) -> int:
+    """Columns one character takes: 0 (combining, control, format), 1 or 2 (wide)."""
+    code = ord(char)
+    if 0x20 <= code < 0x7F:
+        return 1
+    if code < 0x20 or 0x7F <= code < 0xA0:
+        return 0
+    import unicodedata  # only non-ASCII text gets here
+
+    if unicodedata.combining(char) or unicodedata.category(char) in ("Mn", "Me", "Cf"):
+        return 0
+    return 2 if unicodedata.east_asian_width(char) in ("W", "F") else 1
+
+
+def text_width(text: str) -> int:
+    """Columns text takes in a terminal. Plain ASCII is just len(text)."""
+    if text.isascii() and text.isprintable():
+        return len(text)
+    return sum(_char_widths(text))
+
+
+def _char_widths(text: str) -> List[int]:
+    """Per-character widths, adjusted for emoji presentation and ZWJ sequences."""
+    widths: List[int] = []
+    joined = False
+    for char in text:
+        if joined:
+            widths.append(0)  # drawn as part of the glyph before the joiner
+            joined = False
+            continue
+        if char == _VS16 and widths and widths[-1] == 1:
+            widths[-1] = 2
+            widths.append(0)
+            continue
+        widths.append(char_width(char))
+        joined = char == _ZWJ
+    return widths
+
+
+def truncate(text: str, columns: int) -> str:
+    """Cut text to at most columns, ending in an ellipsis if anything was cut."""
+    if text_width(text) <= columns:
+        return text
+    if text.isascii():
+        return text[: max(columns - 1, 0)].rstrip() + ELLIPSIS
+    used, end = 0, 0
+    for end, width in enumerate(_char_widths(text)):
+        if used + width > columns - 1:
+            break
+        used += width
+    return text[:end].rstrip() + ELLIPSIS
+
+
+def wrap(text: str, columns: int) -> List[str]:
+    """Greedy word wrap to columns. Words wider than a line are split."""
+    lines: List[str] = []
+    line, used = "", 0
+    for word in text.split():
+        width = text_width(word)
+        while width > columns:  # a word that can't fit on any line
+            if line:
+                lines.append(line)
+                line, used = "", 0
+            head = truncate(word, columns + 1)[:-1] or word[0]  # the part that fits
+            lines.append(head)
+            word = word[len(head) :]
+            width = text_width(word)
+        if not word:
+            continue
+        if line and used + 1 + width > columns:
+            lines.append(line)
+            line, used = "", 0
+        line, used = (f"{line} {word}", used + 1 + width) if line else (word, width)
+    if line or not lines:
+        lines.append(line)
+    return lines
+
+
+def fit(
+    message: str,
+    message_width: int,
+    prefix_width: int,
+    suffix_width: int,
+    columns: int,
+    overflow: str = "wrap",
+) -> Tuple[List[str], bool]:
+    """
+    Lay out a tantrum: (message lines, whether the suffix fits on the last line).
+
+    prefix_width is the emoji and space before the message; continuation lines
+    are indented by it. suffix_width is the verbose "[exit via: ...]" tag, 0
+    if there is none; it is placed two columns after the message.
+    """
+    tag = suffix_width + 2 if suffix_width else 0
+    if columns <= 0 or overflow == "none" or prefix_width + message_width + tag <= columns:
+        return [message], True
+    room = max(columns - prefix_width, MIN_COLUMNS)
+    if overflow == "truncate":
+        if room - tag >= MIN_COLUMNS:
+            return [truncate(message, room - tag)], True
+        return [truncate(message, room)], False
+    lines = wrap(message, room)
+    return lines, text_width(lines[-1]) + tag <= room
+
+
+def terminal_columns(stream: TextIO) -> int:
+    """Width of the terminal behind stream, cached until invalidate(). 0 if not a terminal."""
+    global _columns
+    if _columns is None:
+        try:
+            columns = os.get_terminal_size(stream.fileno()).columns
+        except (AttributeError, OSError, ValueError):
+            columns = 0  # a pipe, file or StringIO: nothing to fit
+        else:
+            if _env_columns is None:
+                read_environment()  # not enabled: nothing to keep off the exit path
+            columns = _env_columns or columns
+        _columns = columns if columns >= MIN_COLUMNS else 0
+    return _columns
+
+
+def read_environment() -> None:
+    """Snapshot the COLUMNS override, so terminal_columns() never reads os.environ."""
+    global _env_columns
+    override = os.environ.get("COLUMNS", "")
+    _env_columns = int(override) if override.isdigit() else 0
+
+
+def invalidate() -> None:
+    """Forget the cached terminal size (on SIGWINCH)."""
+    global _columns
+    _columns = None
@@ -1,21 +1,52 @@
 """Shared fixtures for tantrumpy tests."""
 
+import os
+import subprocess
+import sys
+
 import pytest
 
 import tantrumpy
-from tantrumpy import picker
-from tantrumpy.handler import _handler
+from tantrumpy.testing import reset_globals
+
+SRC = os.path.dirname(os.path.dirname(os.path.abspath(tantrumpy.__file__)))
+
+
+@pytest.fixture(autouse=True, scope="session")
+def private_cache_dir(tmp_path_factory):
+    """Keep the mood-pack index cache out of the real home directory."""
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setenv("XDG_CACHE_HOME", str(tmp_path_factory.mktemp("cache")))
+        yield
 
 
 @pytest.fixture(autouse=True)
 def reset_state():
     """Reset all global state before each test."""
-    picker.reset()
-    _handler.disable()
-    _handler._fired = False
-    tantrumpy._custom_banks.clear()
+    reset_globals()
     yield
-    _handler.disable()
-    _handler._fired = False
-    picker.reset()
-    tantrumpy._custom_banks.clear()
+    reset_globals()
+
+
+@pytest.fixture
+def child_env():
+    """Environment for a child interpreter: this tree importable, no TANTRUMPY_* settings."""
+    env = {k: v for k, v in os.environ.items() if not k.startswith("TANTRUMPY_")}
+    env["PYTHONPATH"] = SRC
+    return env
+
+
+@pytest.fixture
+def run_python(child_env):
+    """run_python(code, **env): run code in a fresh interpreter and capture its output."""
+
+    def run(code, **env):
+        return subprocess.run(
+            [sys.executable, "-c", code],
+            env={**child_env, **env},
+            capture_output=True,
+            text=True,
+            timeout=30,
+        )
+
+    return run
@@ -0,0 +1,128 @@
+"""Tests for tantrumpy/autoload.py — .pth stubs, hand-over and install."""
+
+import signal
+import sys
+from unittest.mock import patch
+
+import pytest
+
+import tantrumpy
+from tantrumpy import autoload
+from tantrumpy.__main__ import main
+from tantrumpy.handler import _handler
+
+
+@pytest.fixture(autouse=True)
+def stubs_off():
+    yield
+    autoload.deactivate()
+
+
+def test_activate_installs_and_deactivate_restores():
+    before = (
+        signal.getsignal(signal.SIGINT),
+        signal.getsignal(signal.SIGTERM),
+        sys.excepthook,
+    )
+    autoload.activate()
+    assert autoload.is_active()
+    assert signal.getsignal(signal.SIGINT) is autoload._on_signal
+    assert signal.getsignal(signal.SIGTERM) is autoload._on_signal
+    assert sys.excepthook is autoload._on_exception
+
+    autoload.activate()  # idempotent — must not save the stubs as originals
+    autoload.deactivate()
+    assert not autoload.is_active()
+    assert (
+        signal.getsignal(signal.SIGINT),
+        signal.getsignal(signal.SIGTERM),
+        sys.excepthook,
+    ) == before
+
+
+def test_signal_stub_hands_over_to_handler():
+    original = signal.getsignal(signal.SIGTERM)
+    autoload.activate()
+    with patch.object(_handler, "_on_sigterm") as on_sigterm:
+        autoload._on_signal(signal.SIGTERM, None)
+        on_sigterm.assert_called_once_with(signal.SIGTERM, None)
+    assert _handler._active is True
+    assert _handler._orig_sigterm == original
+
+
+def test_sigint_stub_routes_to_on_sigint():
+    autoload.activate()
+    with patch.object(_handler, "_on_sigint") as on_sigint:
+        autoload._on_signal(signal.SIGINT, None)
+        on_sigint.assert_called_once_with(signal.SIGINT, None)
+
+
+def test_exception_stub_hands_over_to_handler():
+    autoload.activate()
+    err = ValueError("boom")
+    with patch.object(_handler, "_on_exception") as on_exception:
+        autoload._on_exception(ValueError, err, None)
+        on_exception.assert_called_once_with(ValueError, err, None)
+
+
+def test_atexit_stub_hands_over_only_while_active():
+    autoload.activate()
+    with patch.object(_handler, "_on_atexit") as on_atexit:
+        autoload._on_atexit()
+        autoload.deactivate()
+        autoload._on_atexit()
+        on_atexit.assert_called_once_with()
+
+
+def test_enable_supersedes_stubs():
+    autoload.activate()
+    tantrumpy.enable()
+    assert not autoload.is_active()
+    assert signal.getsignal(signal.SIGINT) == _handler._on_sigint
+    assert _handler._orig_sigint is not autoload._on_signal
+
+
+def test_install_and_uninstall(tmp_path, monkeypatch):
+    target = tmp_path / "site" / autoload.PTH_NAME
+    monkeypatch.setattr(autoload, "pth_path", lambda user=False: str(target))
+    assert autoload.install() == str(target)
+    assert target.read_text() == autoload.PTH_LINE
+    assert autoload.uninstall() is True
+    assert autoload.uninstall() is False
+
+
+def test_cli_autoload_commands(tmp_path, monkeypatch, capsys):
+    target = tmp_path / autoload.PTH_NAME
+    monkeypatch.setattr(autoload, "pth_path", lambda user=False: str(target))
+    assert main(["autoload", "install"]) == 0
+    assert main(["autoload", "status"]) == 0
+    assert "installed" in capsys.readouterr().out
+    assert main(["autoload", "uninstall"]) == 0
+    assert main(["autoload", "uninstall"]) == 0
+    assert "not installed" in capsys.readouterr().out
+
+
+def test_pth_line_is_inert_without_env(run_python):
+    out = run_python(autoload.PTH_LINE + "import sys; print('tantrumpy' in sys.modules)")
+    assert out.stdout.strip() == "False"
+    assert out.stderr == ""
+
+
+def test_pth_line_defers_all_loading_until_exit(run_python):
+    probe = (
+        "import sys\n"
+        "print(sorted(m for m in sys.modules if m.startswith('tantrumpy')))\n"
+        "print('typing' in sys.modules, 'signal' in sys.modules)\n"
+    )
+    out = run_python(autoload.PTH_LINE + probe, TANTRUMPY_AUTOLOAD="1", TANTRUMPY_MOOD="comic")
+    lines = out.stdout.splitlines()
+    assert lines[0] == "['tantrumpy', 'tantrumpy.autoload']"
+    assert lines[1] == "False False"
+    assert out.stderr.strip().startswith("🎭")  # the tantrum still fires at exit
+
+
+def test_pth_line_exception_prints_traceback_then_tantrum(run_python):
+    out = run_python(autoload.PTH_LINE + "raise RuntimeError('kaboom')", TANTRUMPY_AUTOLOAD="1")
+    assert out.returncode == 1
+    assert "RuntimeError: kaboom" in out.stderr
+    assert out.stderr.rstrip().splitlines()[-1] != "RuntimeError: kaboom"
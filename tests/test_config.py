@@ -0,0 +1,217 @@
+"""Tests for tantrumpy/config.py — snapshot loading, precedence and reload."""
+
+import os
+import signal
+import sys
+import threading
+import time
+import warnings
+
+import pytest
+
+from tantrumpy import config
+from tantrumpy.handler import _handler
+
+
+@pytest.fixture(autouse=True)
+def isolated_env(tmp_path, monkeypatch):
+    """Run every test from an empty directory with no TANTRUMPY_* variables."""
+    for key in list(os.environ):
+        if key.startswith("TANTRUMPY_"):
+            monkeypatch.delenv(key)
+    monkeypatch.chdir(tmp_path)
+    return tmp_path
+
+
+def write_pyproject(path, body):
+    (path / "pyproject.toml").write_text(f"[tool.tantrumpy]\n{body}\n")
+
+
+def test_defaults_when_nothing_configured():
+    cfg = config.load()
+    assert cfg.mood == "random"
+    assert cfg.verbose is False
+    assert cfg.silent is False
+
+
+def test_enable_defaults_are_lowest_precedence(isolated_env):
+    assert config.load(mood="comic").mood == "comic"
+    write_pyproject(isolated_env, 'mood = "rude"')
+    assert config.load(mood="comic").mood == "rude"
+
+
+def test_pyproject_tool_table(isolated_env):
+    write_pyproject(isolated_env, 'mood = "cringe"\nverbose = true')
+    cfg = config.load()
+    assert cfg.mood == "cringe"
+    assert cfg.verbose is True
+
+
+def test_config_file_overrides_pyproject(isolated_env, monkeypatch):
+    write_pyproject(isolated_env, 'mood = "cringe"')
+    path = isolated_env / "ops.toml"
+    path.write_text('mood = "dramatic"\n')
+    monkeypatch.setenv("TANTRUMPY_CONFIG", str(path))
+    assert config.load().mood == "dramatic"
+
+
+def test_config_file_accepts_tool_table(isolated_env, monkeypatch):
+    path = isolated_env / "ops.toml"
+    path.write_text('[tool.tantrumpy]\nmood = "philosophy"\n')
+    monkeypatch.setenv("TANTRUMPY_CONFIG", str(path))
+    assert config.load().mood == "philosophy"
+
+
+def test_integer_seed_from_toml(isolated_env, monkeypatch):
+    write_pyproject(isolated_env, "seed = 42")
+    assert config.load().seed == "42"
+    path = isolated_env / "ops.toml"
+    path.write_text("seed = 7\n")
+    monkeypatch.setenv("TANTRUMPY_CONFIG", str(path))
+    assert config.load().seed == "7"
+    path.write_text("seed = true\n")
+    assert config.load().seed == "42"
+
+
+def test_env_overrides_files(isolated_env, monkeypatch):
+    write_pyproject(isolated_env, 'mood = "cringe"\nverbose = false')
+    monkeypatch.setenv("TANTRUMPY_MOOD", "comic")
+    monkeypatch.setenv("TANTRUMPY_VERBOSE", "yes")
+    cfg = config.load()
+    assert cfg.mood == "comic"
+    assert cfg.verbose is True
+
+
+@pytest.mark.parametrize("value, expected", [("1", True), ("on", True), ("0", False)])
+def test_env_booleans(monkeypatch, value, expected):
+    monkeypatch.setenv("TANTRUMPY_VERBOSE", value)
+    assert config.load().verbose is expected
+
+
+@pytest.mark.parametrize("value, expected", [("1", True), ("y", True), ("0", True), ("", False)])
+def test_env_silent_is_set_by_any_value(monkeypatch, value, expected):
+    monkeypatch.setenv("TANTRUMPY_SILENT", value)
+    assert config.load().silent is expected
+
+
+def test_warns_once_without_a_toml_parser(isolated_env, monkeypatch):
+    monkeypatch.setitem(sys.modules, "tomllib", None)
+    monkeypatch.setitem(sys.modules, "tomli", None)
+    monkeypatch.setattr(config, "_warned_no_parser", False)
+    (isolated_env / "pyproject.toml").write_text("[project]\nname = 'app'\n")
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        assert config.load().mood == "random"  # no tantrumpy table: nothing to warn about
+    write_pyproject(isolated_env, 'mood = "rude"')
+    with pytest.warns(RuntimeWarning, match="tomli"):
+        config.load()
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        config.load()
+
+
+def test_invalid_values_are_ignored(isolated_env, monkeypatch):
+    write_pyproject(isolated_env, "mood = 42\nreload_interval = true")
+    monkeypatch.setenv("TANTRUMPY_VERBOSE", "banana")
+    cfg = config.load(verbose=True)
+    assert cfg.mood == "random"
+    assert cfg.verbose is True
+    assert cfg.reload_interval == 0.0
+
+
+def test_broken_toml_is_ignored(isolated_env):
+    (isolated_env / "pyproject.toml").write_text("[tool.tantrumpy\nmood =")
+    assert config.load().mood == "random"
+
+
+def test_snapshot_is_immutable():
+    cfg = config.load()
+    with pytest.raises(AttributeError):
+        cfg.mood = "rude"  # type: ignore[misc]
+
+
+def test_is_stale_detects_new_and_changed_files(isolated_env):
+    cfg = config.load()
+    assert config.is_stale(cfg) is False
+    write_pyproject(isolated_env, 'mood = "rude"')
+    assert config.is_stale(cfg) is True
+    cfg = config.load()
+    path = isolated_env / "pyproject.toml"
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+    assert config.is_stale(cfg) is True
+
+
+def test_fire_reads_snapshot_not_environment(monkeypatch):
+    _handler.enable(mood="comic")
+    monkeypatch.setenv("TANTRUMPY_SILENT", "1")  # too late — snapshot already taken
+    assert _handler._config.silent is False
+
+
+def test_reload_config_swaps_snapshot(isolated_env):
+    _handler.enable(mood="comic")
+    write_pyproject(isolated_env, 'mood = "rude"')
+    _handler.reload_config()
+    assert _handler._config.mood == "rude"
+
+
+@pytest.mark.skipif(not hasattr(signal, "SIGHUP"), reason="POSIX only")
+def test_sighup_reloads_and_disable_restores(isolated_env):
+    write_pyproject(isolated_env, "reload_on_sighup = true")
+    original = signal.getsignal(signal.SIGHUP)
+    _handler.enable()
+    assert signal.getsignal(signal.SIGHUP) == _handler._on_sighup
+
+    write_pyproject(isolated_env, 'reload_on_sighup = true\nmood = "cringe"')
+    _handler._on_sighup(signal.SIGHUP, None)
+    assert _handler._config.mood == "cringe"
+
+    _handler.disable()
+    assert signal.getsignal(signal.SIGHUP) == original
+
+
+def test_watcher_reloads_on_mtime_change(isolated_env):
+    write_pyproject(isolated_env, "reload_interval = 0.01")
+    _handler.enable()
+    assert _handler._watcher is not None
+
+    write_pyproject(isolated_env, 'reload_interval = 0.01\nmood = "dramatic"')
+    deadline = time.monotonic() + 5
+    while _handler._config.mood != "dramatic" and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert _handler._config.mood == "dramatic"
+
+    _handler.disable()
+    assert _handler._watcher is None
+
+
+def watcher_threads():
+    deadline = time.monotonic() + 5
+    while time.monotonic() < deadline:
+        alive = [t for t in threading.enumerate() if t.name == "tantrumpy-config-watcher"]
+        if len(alive) <= 1:
+            return alive
+        time.sleep(0.01)
+    return alive
+
+
+def test_reenable_replaces_the_watcher(isolated_env):
+    write_pyproject(isolated_env, "reload_interval = 0.01")
+    for _ in range(3):
+        _handler.enable()
+    assert len(watcher_threads()) == 1
+
+    _handler.disable()
+    deadline = time.monotonic() + 5
+    while watcher_threads() and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert watcher_threads() == []
+
+
+def test_integer_settings(isolated_env, monkeypatch):
+    write_pyproject(isolated_env, "compact_traceback = true\ntraceback_max_bytes = 4096")
+    cfg = config.load()
+    assert cfg.compact_traceback is True
+    assert cfg.traceback_max_bytes == 4096
+    monkeypatch.setenv("TANTRUMPY_TRACEBACK_MAX_BYTES", "1.5")
+    assert config.load().traceback_max_bytes == 4096
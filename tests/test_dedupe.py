@@ -0,0 +1,140 @@
+"""Tests for tantrumpy/dedupe.py — duplicate filtering for message banks."""
+
+import random
+from unittest.mock import patch
+
+import pytest
+
+import tantrumpy
+from tantrumpy import _custom_banks, dedupe, messages, picker
+
+LINE = "Finally. I was getting tired of your terrible code anyway."
+
+
+def test_exact_duplicates_are_dropped():
+    report = dedupe.dedupe([LINE, LINE, f"  {LINE}  "])
+    assert report.kept == [LINE]
+    assert report.exact == [LINE, f"  {LINE}  "]
+    assert report.near == []
+
+
+@pytest.mark.parametrize(
+    "variant",
+    [
+        "finally i was getting tired of your terrible code anyway",  # case and punctuation
+        "Finally. I was getting tierd of your terrible code anyway.",  # typo
+        "Finally!! I was getting tired of your terrible code, anyway.",
+    ],
+)
+def test_near_duplicates_are_dropped(variant):
+    report = dedupe.dedupe([LINE, variant])
+    assert report.kept == [LINE]
+    ((message, twin, score),) = report.near
+    assert (message, twin) == (variant, LINE)
+    assert 0.8 <= score <= 1.0
+
+
+def test_different_messages_are_kept():
+    other = "Finally. I was getting bored of your code."
+    assert dedupe.dedupe([LINE, other]).kept == [LINE, other]
+
+
+def test_threshold_is_respected():
+    variant = "Finally. I was getting tired of your awful code anyway."
+    score = dedupe.jaccard(dedupe.shingles(LINE), dedupe.shingles(variant))
+    assert dedupe.dedupe([LINE, variant], similarity=score + 0.05).kept == [LINE, variant]
+    assert dedupe.dedupe([LINE, variant], similarity=score - 0.05).kept == [LINE]
+
+
+def test_none_similarity_only_drops_exact_copies():
+    variant = LINE.lower()
+    report = dedupe.dedupe([LINE, variant, LINE], similarity=None)
+    assert report.kept == [LINE, variant]
+    assert report.exact == [LINE]
+
+
+@pytest.mark.parametrize("similarity", [0, -0.5, 1.5])
+def test_invalid_similarity_raises(similarity):
+    with pytest.raises(ValueError, match="similarity"):
+        dedupe.Deduper(similarity)
+
+
+def test_existing_messages_are_matched_but_not_reported():
+    report = dedupe.dedupe(["brand new line here", LINE.upper()], existing=[LINE])
+    assert report.kept == ["brand new line here"]
+    assert report.near[0][1] == LINE
+
+
+def test_summary():
+    assert dedupe.dedupe([LINE, LINE]).summary() == "kept 1, dropped 1 exact and 0 near duplicates"
+
+
+def test_signature_is_stable_and_dense():
+    sig = dedupe.signature(dedupe.shingles("tiny"))
+    assert len(sig) == dedupe.SIGNATURE
+    assert dedupe._EMPTY not in sig
+    assert sig == dedupe.signature(dedupe.shingles("tiny"))
+
+
+def test_large_synthetic_batch():
+    rng = random.Random(0)
+    words = ["".join(rng.choice("abcdefghijklmnop") for _ in range(6)) for _ in range(400)]
+    lines = [" ".join(rng.choice(words) for _ in range(10)) for _ in range(500)]
+    report = dedupe.dedupe(lines + [line.upper() + "!" for line in lines[:100]])
+    assert len(report.kept) == 500
+    assert len(report.near) == 100
+
+
+# ----------------------------------------------------------------------
+# add_messages integration
+# ----------------------------------------------------------------------
+
+
+def test_add_messages_drops_duplicates_and_returns_report():
+    report = tantrumpy.add_messages("dupes", [LINE, LINE, LINE.lower()])
+    assert _custom_banks["dupes"]["messages"] == [LINE]
+    assert report.summary() == "kept 1, dropped 1 exact and 1 near duplicates"
+
+
+def test_add_messages_checks_against_earlier_batches():
+    tantrumpy.add_messages("batches", [LINE])
+    report = tantrumpy.add_messages("batches", [LINE + "!"])
+    assert report.kept == []
+    assert _custom_banks["batches"]["messages"] == [LINE]
+
+
+def test_add_messages_checks_against_builtin_bank():
+    builtin = messages.load("rude")[0]
+    report = tantrumpy.add_messages("rude", [builtin.upper(), "A genuinely new insult."])
+    assert report.kept == ["A genuinely new insult."]
+    assert picker.pick("rude", _custom_banks) is not None
+
+
+def test_seeding_indexes_without_comparing():
+    deduper = dedupe.Deduper()
+    with patch.object(dedupe, "jaccard", side_effect=AssertionError("compared while seeding")):
+        deduper.seed([LINE, LINE + "!", "Something else entirely."])
+    assert deduper.run([LINE.upper()]).near[0][1] == LINE
+
+
+def test_add_messages_keeps_one_index_per_mood():
+    tantrumpy.add_messages("batches", [LINE])
+    with patch.object(dedupe.Deduper, "seed") as seed:
+        for i in range(3):
+            tantrumpy.add_messages("batches", [f"Batch number {i} has its own message."])
+        report = tantrumpy.add_messages("batches", ["Batch number 1 has its own message!"])
+    seed.assert_not_called()
+    assert report.kept == [] and len(_custom_banks["batches"]["messages"]) == 4
+    tantrumpy.add_messages("batches", [LINE.lower()], similarity=None)
+    assert len(_custom_banks["batches"]["messages"]) == 5  # a new index, seeded afresh
+
+
+def test_add_messages_similarity_none_keeps_near_copies():
+    tantrumpy.add_messages("loose", [LINE, LINE.lower()], similarity=None)
+    assert _custom_banks["loose"]["messages"] == [LINE, LINE.lower()]
+
+
+def test_add_messages_invalid_similarity_changes_nothing():
+    with pytest.raises(ValueError):
+        tantrumpy.add_messages("untouched", [LINE], similarity=2)
+    assert "untouched" not in _custom_banks
@@ -0,0 +1,161 @@
+"""Tests for tantrumpy/fastexit.py — os._exit after the tantrum."""
+
+import signal
+import sys
+from unittest.mock import patch
+
+import pytest
+
+import tantrumpy
+from tantrumpy import fastexit
+from tantrumpy.handler import _handler
+from tantrumpy.testing import TantrumSimulator
+
+# ----------------------------------------------------------------------
+# Critical callbacks and exit_now
+# ----------------------------------------------------------------------
+
+
+def test_critical_callbacks_run_newest_first():
+    calls = []
+    fastexit.register_critical(calls.append, "first")
+    fastexit.register_critical(calls.append, "second")
+    fastexit.run_critical()
+    assert calls == ["second", "first"]
+    assert fastexit._critical == []
+
+
+def test_register_critical_works_as_decorator():
+    @tantrumpy.register_critical
+    def close_journal():
+        pass
+
+    assert fastexit._critical == [(close_journal, (), {})]
+
+
+def test_unregister_critical():
+    calls = []
+    fastexit.register_critical(calls.append, 1)
+    fastexit.unregister_critical(calls.append)
+    fastexit.unregister_critical(print)  # unknown: ignored
+    fastexit.run_critical()
+    assert calls == []
+
+
+def test_failing_callback_does_not_stop_the_others(capsys):
+    calls = []
+    fastexit.register_critical(calls.append, "ran")
+    fastexit.register_critical(lambda: 1 / 0)
+    fastexit.run_critical()
+    assert calls == ["ran"]
+    assert "ZeroDivisionError" in capsys.readouterr().err
+
+
+def test_exit_now_runs_callbacks_then_exits():
+    order = []
+    fastexit.register_critical(order.append, "critical")
+    with patch.object(fastexit, "_flush", lambda: order.append("flush")):
+        with patch("os._exit", side_effect=lambda status: order.append(status)):
+            fastexit.exit_now(7)
+    assert order == ["critical", "flush", 7]
+
+
+# ----------------------------------------------------------------------
+# Handler, simulated
+# ----------------------------------------------------------------------
+
+
+@pytest.mark.parametrize("signum", [signal.SIGINT, signal.SIGTERM])
+def test_signal_exits_fast_with_128_plus_signum(signum):
+    result = TantrumSimulator(mood="comic", fast_exit=True).signal(signum)
+    assert result.fast_exit
+    assert result.exit_status == 128 + signum
+    assert result.reraised_signal is None
+    assert result.line
+
+
+def test_signal_with_app_handler_is_reraised_not_fast():
+    sim = TantrumSimulator(mood="comic", fast_exit=True)
+    sim.handler._orig_sigterm = lambda signum, frame: None
+    result = sim.signal(signal.SIGTERM)
+    assert not result.fast_exit
+    assert result.reraised_signal == signal.SIGTERM
+
+
+def test_exception_exits_fast_with_status_1():
+    result = TantrumSimulator(mood="comic", fast_exit=True).exception(KeyError("k"))
+    assert result.fast_exit
+    assert result.exit_status == 1
+    assert "KeyError" in result.output
+
+
+def test_sys_exit_tears_down_normally():
+    result = TantrumSimulator(mood="comic", fast_exit=True).atexit(4)
+    assert not result.fast_exit
+    assert result.exit_status == 4
+    assert result.line
+
+
+def test_off_by_default():
+    sim = TantrumSimulator(mood="comic")
+    assert not sim.signal(signal.SIGTERM).fast_exit
+    assert not sim.atexit(0).fast_exit
+
+
+def test_sys_exit_is_never_wrapped():
+    original = sys.exit
+    _handler.enable(mood="comic", fast_exit=True)
+    assert sys.exit is original
+
+
+# ----------------------------------------------------------------------
+# Real processes
+# ----------------------------------------------------------------------
+
+CHILD = """
+import atexit, sys, tantrumpy
+atexit.register(print, "ordinary atexit")  # would run after tantrumpy's callback
+tantrumpy.enable(mood="comic", fast_exit=True)
+tantrumpy.register_critical(print, "critical")
+sys.stdout.write("buffered ")
+{end}
+"""
+
+
+def test_process_sys_exit_tears_down_normally(run_python):
+    out = run_python(CHILD.format(end="sys.exit(3)"))
+    assert out.returncode == 3
+    assert out.stdout == "buffered ordinary atexit\n"
+    assert out.stderr.strip()
+
+
+def test_process_caught_sys_exit_keeps_status_0(run_python):
+    out = run_python(CHILD.format(end="try:\n    sys.exit(3)\nexcept SystemExit:\n    pass"))
+    assert out.returncode == 0
+    assert out.stdout == "buffered ordinary atexit\n"
+
+
+def test_process_exception(run_python):
+    out = run_python(CHILD.format(end="raise KeyError('k')"))
+    assert out.returncode == 1
+    assert out.stdout == "buffered critical\n"
+    assert "KeyError" in out.stderr
+
+
+def test_process_sigterm(run_python):
+    out = run_python(CHILD.format(end="import os, signal; os.kill(os.getpid(), signal.SIGTERM)"))
+    assert out.returncode == 128 + signal.SIGTERM
+    assert out.stdout == "buffered critical\n"
+
+
+def test_process_without_sys_exit_tears_down_normally(run_python):
+    out = run_python(CHILD.format(end="pass"))
+    assert out.returncode == 0
+    assert out.stdout == "buffered ordinary atexit\n"
+
+
+def test_process_env_var_enables_fast_exit(run_python):
+    code = CHILD.replace("fast_exit=True", "").format(end="raise KeyError('k')")
+    out = run_python(code, TANTRUMPY_FAST_EXIT="1")
+    assert out.returncode == 1
+    assert out.stdout == "buffered critical\n"
@@ -2,7 +2,9 @@
 
 import os
 import signal
+import subprocess
 import sys
+import threading
 from unittest.mock import MagicMock, patch
 
 import pytest
@@ -25,6 +27,15 @@ def test_disable_safe_when_not_enabled():
     _handler.disable()  # should not raise
 
 
+def test_reenable_keeps_the_real_originals():
+    before = signal.getsignal(signal.SIGINT), sys.excepthook
+    _handler.enable()
+    _handler.enable()
+    assert (_handler._orig_sigint, _handler._orig_excepthook) == before
+    _handler.disable()
+    assert (signal.getsignal(signal.SIGINT), sys.excepthook) == before
+
+
 def test_fire_only_once():
     _handler.enable(mood="comic")
     output = []
@@ -144,3 +155,86 @@ def test_on_sigterm_fires_and_reraises(monkeypatch):
             _handler._on_sigterm(signal.SIGTERM, None)
             mock_fire.assert_called_once_with("SIGTERM")
             mock_raise.assert_called_once_with(signal.SIGTERM)
+
+
+def test_disable_unregisters_atexit_hook():
+    with patch("atexit.register") as register, patch("atexit.unregister") as unregister:
+        _handler.enable(mood="comic")
+        register.assert_called_once_with(_handler._on_atexit)
+        unregister.assert_called_once_with(_handler._on_atexit)  # no stacking on re-enable
+        _handler.disable()
+        assert unregister.call_count == 2
+
+
+def test_signal_mid_tantrum_is_deferred_until_written(monkeypatch):
+    monkeypatch.delenv("TANTRUMPY_SILENT", raising=False)
+    _handler.enable(mood="comic")
+    events = []
+
+    def render_interrupted(*args):
+        _handler._on_sigterm(signal.SIGTERM, None)  # a second signal lands mid-fire
+        events.append("rendered")
+        return "line"
+
+    with patch("tantrumpy.handler.render", side_effect=render_interrupted):
+        with patch.object(_handler, "_reraise", side_effect=lambda s, o: events.append(s)):
+            with patch("builtins.print", side_effect=lambda *a, **kw: events.append("printed")):
+                _handler._on_sigint(signal.SIGINT, None)
+
+    assert events == ["rendered", "printed", signal.SIGTERM, signal.SIGINT]
+
+
+def test_concurrent_fire_claims_once(monkeypatch):
+    monkeypatch.delenv("TANTRUMPY_SILENT", raising=False)
+    _handler.enable(mood="rude")
+    barrier = threading.Barrier(8)
+
+    def race():
+        barrier.wait()
+        _handler._fire("race")
+
+    with patch("builtins.print") as mock_print:
+        threads = [threading.Thread(target=race) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+    assert mock_print.call_count == 1
+
+
+def test_tantrum_is_a_single_write(monkeypatch):
+    monkeypatch.delenv("TANTRUMPY_SILENT", raising=False)
+    _handler.enable(mood="comic")
+    stream = MagicMock()
+    with patch("sys.stderr", stream):
+        _handler._fire("test")
+    writes = [call.args[0] for call in stream.write.call_args_list if call.args[0]]
+    assert len(writes) == 1
+    assert writes[0].startswith("\n") and writes[0].endswith("\n")
+
+
+@pytest.mark.skipif(os.name != "posix", reason="POSIX signals only")
+def test_signal_storm_prints_exactly_one_line(child_env):
+    child = (
+        "import sys, time, tantrumpy\n"
+        "tantrumpy.enable(verbose=True)\n"
+        "print('ready', flush=True)\n"
+        "while True: time.sleep(0.0001)\n"
+    )
+    for burst in ([signal.SIGTERM, signal.SIGINT] * 5, [signal.SIGINT, signal.SIGTERM] * 5):
+        proc = subprocess.Popen(
+            [sys.executable, "-c", child],
+            env=child_env,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            text=True,
+        )
+        assert proc.stdout.readline().strip() == "ready"
+        for signum in burst:
+            try:
+                os.kill(proc.pid, signum)
+            except ProcessLookupError:
+                break
+        _, err = proc.communicate(timeout=10)
+        assert err.count("[exit via: ") == 1
+        assert -proc.returncode in (signal.SIGINT, signal.SIGTERM)
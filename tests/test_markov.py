@@ -0,0 +1,146 @@
+"""Tests for tantrumpy/markov.py — the generative mood."""
+
+import random
+from unittest.mock import patch
+
+import pytest
+
+from tantrumpy import markov, messages, picker
+
+CORPUS = [
+    "the build is broken again",
+    "the tests are broken forever",
+    "my code is fine again",
+    "your code is broken",
+]
+
+
+@pytest.fixture(autouse=True)
+def fresh_models():
+    markov._models.clear()
+    yield
+    markov._models.clear()
+
+
+def test_train_builds_compact_arrays():
+    model = markov.train(CORPUS)
+    assert model.vocab[0] == ""
+    assert len(model.offsets) == len(model.vocab) + 1
+    assert model.successors.typecode == "H"
+    assert model.offsets[-1] == len(model.successors)
+    # every word occurrence plus one end marker per message
+    assert len(model.successors) == sum(len(m.split()) + 1 for m in CORPUS)
+
+
+def test_generate_never_repeats_training_messages():
+    model = markov.train(CORPUS)
+    rng = random.Random(1)
+    lines = [markov.generate(model, rng) for _ in range(300)]
+    produced = [line for line in lines if line is not None]
+    assert produced
+    assert not set(produced) & set(CORPUS)
+    assert all(len(line.split()) <= markov.MAX_WORDS for line in produced)
+
+
+def test_generate_gives_up_when_only_duplicates_are_possible():
+    model = markov.train(["one two three"])
+    assert markov.generate(model, random.Random(0)) is None
+
+
+def test_generate_on_empty_corpus():
+    assert markov.generate(markov.train([]), random.Random(0)) is None
+
+
+def test_save_and_load_round_trip(tmp_path):
+    model = markov.train(CORPUS)
+    path = str(tmp_path / "model.bin")
+    markov.save(model, path)
+    assert markov.load(path, model.key) == model
+    assert markov.load(path, model.key + 1) is None
+
+
+def test_load_rejects_corrupt_file(tmp_path):
+    path = tmp_path / "model.bin"
+    path.write_bytes(b"tantrumpy-markov 1 little 0 H 99 99 5\nabc")
+    assert markov.load(str(path), 0) is None
+    assert markov.load(str(tmp_path / "missing.bin"), 0) is None
+
+
+def truncate_successors(path, model):
+    """Cut off the training set and the last two successors, as a crash mid-write would."""
+    training = "\n".join(sorted(model.training)).encode()
+    with open(path, "rb") as f:
+        data = f.read()
+    with open(path, "wb") as f:
+        f.write(data[: -len(training) - 2 * model.successors.itemsize])
+
+
+def test_load_rejects_truncated_successors(tmp_path):
+    model = markov.train(CORPUS)
+    path = str(tmp_path / "model.bin")
+    markov.save(model, path)
+    truncate_successors(path, model)
+    assert markov.load(path, model.key) is None
+
+
+def test_truncated_cache_is_retrained_and_replaced(tmp_path, monkeypatch):
+    monkeypatch.setenv("TANTRUMPY_CACHE_DIR", str(tmp_path))
+    trained = markov.model_for(CORPUS)
+    truncate_successors(markov.cache_path(trained.key), trained)
+    markov._models.clear()
+    assert markov.model_for(CORPUS) == trained
+    assert markov.load(markov.cache_path(trained.key), trained.key) == trained
+
+
+def test_model_for_uses_disk_cache(tmp_path, monkeypatch):
+    monkeypatch.setenv("TANTRUMPY_CACHE_DIR", str(tmp_path))
+    trained = markov.model_for(CORPUS)
+    markov._models.clear()
+    with patch.object(markov, "train") as train:
+        assert markov.model_for(CORPUS) == trained
+    train.assert_not_called()
+
+
+def test_pick_generative_invents_a_line():
+    builtin = {m for mood in messages.EMOJI for m in messages.load(mood)}
+    line = picker.pick("generative")
+    assert isinstance(line, str) and line.strip()
+    assert line not in builtin
+    assert picker.get_emoji("generative") == markov.EMOJI
+
+
+def test_markov_is_imported_only_to_generate(run_python, tmp_path):
+    probe = (
+        "import sys, tantrumpy\n"
+        "from tantrumpy import picker\n"
+        "tantrumpy.enable(mood='comic')\n"
+        "picker.pick('comic'), picker.get_emoji('generative')\n"
+        "print('tantrumpy.markov' in sys.modules)\n"
+        "picker.pick('generative')\n"
+        "print('tantrumpy.markov' in sys.modules)\n"
+    )
+    out = run_python(probe, TANTRUMPY_SILENT="1", TANTRUMPY_CACHE_DIR=str(tmp_path))
+    assert out.stdout.split() == ["False", "True"], out.stderr
+
+
+def test_generative_is_not_a_random_choice():
+    assert "generative" not in picker.all_moods()
+
+
+def test_generative_trains_on_custom_banks():
+    custom = {"boss": {"emoji": "", "messages": ["Synergy synergy synergy synergy."]}}
+    picker.pick("generative", custom)
+    corpus = [m for mood in messages.EMOJI for m in messages.load(mood)]
+    corpus.append("Synergy synergy synergy synergy.")
+    assert markov.corpus_key(corpus) in markov._models
+
+
+def test_falls_back_to_a_real_message():
+    with patch.object(markov, "generate", return_value=None):
+        line = picker.pick("generative")
+    assert any(line in messages.load(mood) for mood in messages.EMOJI)
+
+
+def test_custom_mood_named_generative_wins():
+    custom = {"generative": {"emoji": "", "messages": ["Mine."]}}
+    assert picker.pick("generative", custom) == "Mine."
@@ -1,5 +1,6 @@
 """Tests for tantrumpy/messages.py — message bank integrity."""
 
+from tantrumpy import messages
 from tantrumpy.messages import MOODS
 
 REQUIRED_MOODS = {"frustrated", "rude", "comic", "cringe", "philosophy", "dramatic"}
@@ -39,3 +40,38 @@ def test_mood_bank_has_required_keys():
     for mood, bank in MOODS.items():
         assert "emoji" in bank, f"Mood '{mood}' missing 'emoji' key"
         assert "messages" in bank, f"Mood '{mood}' missing 'messages' key"
+
+
+def test_load_matches_moods_view():
+    for mood, bank in MOODS.items():
+        assert list(messages.load(mood)) == bank["messages"]
+
+
+def test_banks_decoded_only_on_first_load(monkeypatch):
+    monkeypatch.setattr(messages, "_packed", {"demo": "One — é.\nTwo 🎭\n".encode()})
+    monkeypatch.setattr(messages, "_loaded", {})
+    first = messages.load("demo")
+    assert first == ("One — é.", "Two 🎭")
+    assert messages._packed == {}
+    assert messages.load("demo") is first
+
+
+def test_load_tolerates_a_concurrent_first_load(monkeypatch):
+    decoded = ("Decoded by another thread.",)
+
+    class RacingLoaded(dict):
+        def get(self, key, default=None):
+            # The other thread finishes between our check and our decode
+            value = super().get(key, default)
+            self[key] = decoded
+            messages._packed.pop(key, None)
+            return value
+
+    monkeypatch.setattr(messages, "_packed", {"demo": b"Ours.\n"})
+    monkeypatch.setattr(messages, "_loaded", RacingLoaded())
+    assert messages.load("demo") is decoded
+
+
+def test_moods_view_is_a_fresh_copy():
+    messages.MOODS["comic"]["messages"].append("Mutated.")
+    assert "Mutated." not in messages.MOODS["comic"]["messages"]
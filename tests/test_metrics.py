@@ -0,0 +1,138 @@
+"""Tests for tantrumpy/metrics.py — per-pid shards and the textfile merge."""
+
+import os
+from unittest.mock import patch
+
+import pytest
+
+from tantrumpy import metrics, picker
+from tantrumpy.__main__ import main
+from tantrumpy.handler import _handler
+
+
+@pytest.fixture(autouse=True)
+def quiet_env(monkeypatch):
+    for key in list(os.environ):
+        if key.startswith("TANTRUMPY_"):
+            monkeypatch.delenv(key)
+
+
+def shard_lines(directory):
+    with open(metrics.shard_path(str(directory), os.getpid())) as f:
+        return f.read().splitlines()
+
+
+def test_record_appends_one_line_per_exit(tmp_path):
+    metrics.record(str(tmp_path), "SIGTERM", "comic")
+    metrics.record(str(tmp_path), "exception: KeyError", "rude")
+    metrics.record(str(tmp_path), "something new", "odd\tmood")
+    assert shard_lines(tmp_path) == [
+        "sigterm\tcomic\t",
+        "exception\trude\tKeyError",
+        "other\todd mood\t",
+    ]
+
+
+def test_record_is_a_single_write(tmp_path):
+    with patch("os.write", wraps=os.write) as write:
+        metrics.record(str(tmp_path), "SIGINT (Ctrl+C)", "cringe")
+    write.assert_called_once()
+
+
+def test_record_ignores_missing_directory(tmp_path):
+    metrics.record(str(tmp_path / "nope"), "SIGTERM", "comic")  # must not raise
+
+
+def test_merge_folds_shards_and_keeps_totals(tmp_path):
+    directory = str(tmp_path)
+    metrics.record(directory, "SIGTERM", "comic")
+    with open(metrics.shard_path(directory, 99999), "w") as f:
+        f.write("sigterm\tcomic\t\nexception\trude\tKeyError\ntorn")
+
+    path, merged = metrics.merge(directory)
+    assert merged == 2
+    assert path == os.path.join(directory, "tantrumpy.prom")
+    assert sorted(os.listdir(directory)) == [".tantrumpy.lock", "tantrumpy.prom"]
+    assert metrics.parse(open(path).read()) == {
+        ("sigterm", "comic", ""): 2,
+        ("exception", "rude", "KeyError"): 1,
+    }
+
+    metrics.record(directory, "SIGTERM", "comic")
+    metrics.merge(directory)
+    assert metrics.parse(open(path).read())[("sigterm", "comic", "")] == 3
+
+
+def test_prom_format_and_escaping():
+    text = metrics.render({("exit", 'say "hi"\\', ""): 4})
+    assert "# TYPE tantrumpy_exits_total counter" in text
+    assert 'tantrumpy_exits_total{trigger="exit",mood="say \\"hi\\"\\\\",exception=""} 4' in text
+    assert metrics.parse(text) == {("exit", 'say "hi"\\', ""): 4}
+
+
+def test_merge_picks_up_shards_from_crashed_merge(tmp_path):
+    leftover = metrics.shard_path(str(tmp_path), 123) + ".merging"
+    with open(leftover, "w") as f:
+        f.write("exit\tcomic\t\n")
+    _, merged = metrics.merge(str(tmp_path))
+    assert merged == 1
+    assert not os.path.exists(leftover)
+
+
+def test_rerun_after_crash_before_unlink_counts_once(tmp_path):
+    directory = str(tmp_path)
+    metrics.record(directory, "SIGTERM", "comic")
+    with patch("os.unlink", side_effect=OSError("killed mid-merge")):
+        with pytest.raises(OSError):
+            metrics.merge(directory)
+    assert any(name.endswith(".merging") for name in os.listdir(directory))
+    path, merged = metrics.merge(directory)
+    assert merged == 0
+    metrics.record(directory, "SIGTERM", "comic")  # same pid, same shard name
+    assert metrics.merge(directory)[1] == 1
+    assert metrics.parse(open(path).read()) == {("sigterm", "comic", ""): 2}
+    assert sorted(os.listdir(directory)) == [".tantrumpy.lock", "tantrumpy.prom"]
+
+
+def test_handler_records_even_when_silent(tmp_path, monkeypatch):
+    monkeypatch.setenv("TANTRUMPY_SILENT", "1")
+    _handler.enable(mood="comic", metrics_dir=str(tmp_path))
+    _handler._fire("exception: ValueError")
+    _handler._fire("SIGTERM")  # already fired: not counted
+    assert shard_lines(tmp_path) == ["exception\tcomic\tValueError"]
+
+
+def test_silent_handler_records_resolved_mood(tmp_path, monkeypatch):
+    monkeypatch.setenv("TANTRUMPY_SILENT", "1")
+    _handler.enable(mood="random", metrics_dir=str(tmp_path))
+    _handler._fire("SIGINT (Ctrl+C)")
+    (line,) = shard_lines(tmp_path)
+    assert line.split("\t")[1] in picker.all_moods()
+
+
+def test_handler_records_resolved_mood(tmp_path):
+    _handler.enable(mood="random", metrics_dir=str(tmp_path))
+    with patch("builtins.print"):
+        _handler._fire("sys.exit / normal exit")
+    (line,) = shard_lines(tmp_path)
+    trigger, mood, _ = line.split("\t")
+    assert trigger == "exit"
+    assert mood != "random"
+
+
+def test_cli_merge(tmp_path, monkeypatch, capsys):
+    metrics.record(str(tmp_path), "SIGTERM", "comic")
+    monkeypatch.setenv("TANTRUMPY_METRICS_DIR", str(tmp_path))
+    assert main(["metrics", "merge"]) == 0
+    assert "merged 1 shard into" in capsys.readouterr().out
+
+
+def test_cli_merge_requires_directory(monkeypatch, tmp_path, capsys):
+    monkeypatch.chdir(tmp_path)
+    with pytest.raises(SystemExit):
+        main(["metrics", "merge"])
+    assert "no directory" in capsys.readouterr().err
+
+
+def test_cli_merge_reports_missing_directory(tmp_path, capsys):
+    assert main(["metrics", "merge", "--dir", str(tmp_path / "nope")]) == 1
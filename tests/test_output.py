@@ -0,0 +1,36 @@
+"""Tests for tantrumpy/output.py — byte-capped writing."""
+
+import io
+
+from tantrumpy.output import BoundedWriter
+
+
+def test_writes_within_budget():
+    buf = io.StringIO()
+    out = BoundedWriter(buf, 100)
+    assert out.write("hello ") is True
+    assert out.write("world") is True
+    assert buf.getvalue() == "hello world"
+    assert out.exhausted is False
+
+
+def test_truncates_once_and_marks():
+    buf = io.StringIO()
+    out = BoundedWriter(buf, 8)
+    assert out.write("0123456789") is False
+    assert out.write("more") is False
+    assert buf.getvalue() == "01234567\n[... output truncated at 8 bytes]\n"
+    assert out.exhausted is True
+
+
+def test_budget_counts_utf8_bytes_and_never_splits_a_character():
+    buf = io.StringIO()
+    out = BoundedWriter(buf, 5)
+    out.write("ab🎭cd")  # the emoji is 4 bytes; only "ab" + nothing of it fits
+    assert buf.getvalue().startswith("ab\n")
+
+
+def test_flush_tolerates_closed_stream():
+    buf = io.StringIO()
+    buf.close()
+    BoundedWriter(buf, 10).flush()  # must not raise
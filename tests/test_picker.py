@@ -2,7 +2,7 @@
 
 import pytest
 
-from tantrumpy import picker
+from tantrumpy import messages, picker
 from tantrumpy.messages import MOODS
 
 
@@ -106,3 +106,8 @@ def test_pick_with_custom_when_registry_already_built():
     custom = {"brand_new": {"emoji": "", "messages": ["New custom message."]}}
     result = picker.pick("brand_new", custom=custom)
     assert result == "New custom message."
+
+
+def test_registry_shares_builtin_tuples():
+    picker.pick("philosophy")
+    assert picker._registry["philosophy"] is messages.load("philosophy")
@@ -0,0 +1,140 @@
+"""Tests for tantrumpy/plugins.py — entry-point mood packs and the cached index."""
+
+import os
+import sys
+from unittest.mock import patch
+
+import pytest
+
+from tantrumpy import messages, picker, plugins, rng
+from tantrumpy.handler import _handler, render
+
+
+def make_pack(root, name, moods, module_body):
+    """Install a fake distribution publishing `moods` ({mood: "module:attr"}) into root."""
+    dist = root / f"{name}-1.0.dist-info"
+    dist.mkdir()
+    (dist / "METADATA").write_text(f"Metadata-Version: 2.1\nName: {name}\nVersion: 1.0\n")
+    lines = [f"{mood} = {target}" for mood, target in moods.items()]
+    (dist / "entry_points.txt").write_text("[tantrumpy.moods]\n" + "\n".join(lines) + "\n")
+    (root / f"{name}.py").write_text(module_body)
+
+
+@pytest.fixture
+def site(tmp_path, monkeypatch):
+    """An empty site-packages that plugins scans instead of the real one."""
+    root = tmp_path / "site-packages"
+    root.mkdir()
+    monkeypatch.setenv("TANTRUMPY_CACHE_DIR", str(tmp_path / "cache"))
+    monkeypatch.setattr(plugins, "site_dirs", lambda: [str(root)])
+    monkeypatch.syspath_prepend(str(root))
+    plugins.reset()
+    yield root
+    plugins.reset()
+    for name in [m for m in sys.modules if m.startswith("office_pack")]:
+        del sys.modules[name]
+
+
+OFFICE = (
+    'CORPORATE = {"emoji": "📋", "messages": ["Per my last email: goodbye."]}\n'
+    "def standup():\n"
+    '    return {"messages": ["Let\'s take this offline. Permanently."]}\n'
+)
+
+
+def test_discovers_moods_without_importing_pack(site):
+    make_pack(
+        site,
+        "office_pack",
+        {"corporate": "office_pack:CORPORATE", "standup": "office_pack:standup"},
+        OFFICE,
+    )
+    assert sorted(plugins.moods()) == ["corporate", "standup"]
+    assert "office_pack" not in sys.modules
+    assert "corporate" in picker.all_moods()
+    assert "office_pack" not in sys.modules
+
+
+def test_pack_loaded_when_picked(site):
+    make_pack(site, "office_pack", {"corporate": "office_pack:CORPORATE"}, OFFICE)
+    assert picker.pick("corporate") == "Per my last email: goodbye."
+    assert picker.get_emoji("corporate") == "📋"
+    assert "office_pack" in sys.modules
+
+
+def test_callable_entry_point(site):
+    make_pack(site, "office_pack", {"standup": "office_pack:standup"}, OFFICE)
+    assert plugins.load("standup") == ("", ("Let's take this offline. Permanently.",))
+
+
+def test_index_is_cached_and_reused(site):
+    make_pack(site, "office_pack", {"corporate": "office_pack:CORPORATE"}, OFFICE)
+    plugins.index()
+    with open(plugins.cache_path()) as f:
+        assert "mood\tcorporate\toffice_pack:CORPORATE\n" in f.read()
+
+    plugins.reset()
+    with patch.object(plugins, "scan") as scan:
+        assert plugins.moods() == ["corporate"]
+    scan.assert_not_called()
+
+
+def test_index_invalidated_when_site_packages_changes(site):
+    plugins.index()
+    assert plugins.moods() == []
+    make_pack(site, "office_pack", {"corporate": "office_pack:CORPORATE"}, OFFICE)
+    stat = os.stat(site)  # installs change the directory mtime; make sure of it here
+    os.utime(site, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+    plugins.reset()
+    assert plugins.moods() == ["corporate"]
+
+
+def test_unwritable_cache_still_discovers(site, monkeypatch, tmp_path):
+    blocker = tmp_path / "file"
+    blocker.write_text("")
+    monkeypatch.setenv("TANTRUMPY_CACHE_DIR", str(blocker / "sub"))
+    make_pack(site, "office_pack", {"corporate": "office_pack:CORPORATE"}, OFFICE)
+    assert plugins.moods() == ["corporate"]
+
+
+def test_builtin_moods_win_over_packs(site):
+    make_pack(site, "office_pack", {"rude": "office_pack:CORPORATE"}, OFFICE)
+    assert picker.pick("rude") != "Per my last email: goodbye."
+    assert "office_pack" not in sys.modules
+
+
+def test_broken_pack_raises_value_error(site):
+    make_pack(site, "office_pack", {"broken": "office_pack:MISSING"}, OFFICE)
+    with pytest.raises(ValueError, match="failed to load"):
+        picker.pick("broken")
+
+
+def test_random_swaps_a_broken_pack_for_a_builtin(site, monkeypatch):
+    make_pack(site, "office_pack", {"broken": "office_pack:MISSING"}, OFFICE)
+    picker.prepare()
+    choices = iter(["broken"])
+    real_choice = rng.RNG.choice
+    monkeypatch.setattr(rng.RNG, "choice", lambda seq: next(choices, None) or real_choice(seq))
+    assert picker.random_mood() in messages.EMOJI
+    assert picker.pick("random")
+
+
+def test_enable_indexes_packs_before_exit(site):
+    make_pack(site, "office_pack", {"corporate": "office_pack:CORPORATE"}, OFFICE)
+    _handler.enable(mood="corporate")
+    with patch.object(plugins, "site_dirs", side_effect=AssertionError("scanned at exit")):
+        with patch.object(plugins, "cache_dir", side_effect=AssertionError("read env at exit")):
+            line = render("corporate", "SIGTERM")
+    assert "Per my last email: goodbye." in line
+
+
+def test_add_messages_extends_pack_mood(site):
+    make_pack(site, "office_pack", {"corporate": "office_pack:CORPORATE"}, OFFICE)
+    custom = {"corporate": {"emoji": "", "messages": ["Circling back. Never."]}}
+    seen = {picker.pick("corporate", custom) for _ in range(2)}
+    assert seen == {"Per my last email: goodbye.", "Circling back. Never."}
+    assert picker.get_emoji("corporate") == "📋"
+
+
+def test_scan_of_real_environment_does_not_crash():
+    assert isinstance(plugins.scan(plugins.site_dirs()), dict)
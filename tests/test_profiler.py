@@ -0,0 +1,153 @@
+"""Tests for tantrumpy/profiler.py — the sampling profiler."""
+
+import os
+import signal
+import threading
+import time
+
+import pytest
+
+from tantrumpy import profiler
+from tantrumpy.handler import _handler
+from tantrumpy.testing import TantrumSimulator
+
+
+def busy_loop(seconds):
+    end = time.monotonic() + seconds
+    while time.monotonic() < end:
+        sum(range(100))
+
+
+def hot_function():
+    pass
+
+
+def cold_function():
+    pass
+
+
+@pytest.fixture
+def sampler():
+    s = profiler.Sampler(0.001)
+    yield s
+    s.stop()
+
+
+def test_sampler_finds_the_busy_thread(sampler):
+    worker = threading.Thread(target=busy_loop, args=(0.3,))
+    worker.start()
+    sampler.start()
+    worker.join()
+    sampler.stop()
+    assert sampler.samples > 0
+    names = [code.co_name for code, _ in sampler.top(3)]
+    assert "busy_loop" in names
+
+
+def test_sampler_never_counts_itself(sampler):
+    sampler.start()
+    time.sleep(0.05)
+    sampler.stop()
+    assert profiler.Sampler._run.__code__ not in sampler.counts
+
+
+def test_interval_has_a_floor():
+    assert profiler.Sampler(0).interval == profiler.MIN_INTERVAL
+
+
+def test_stop_ends_the_thread(sampler):
+    sampler.start()
+    assert sampler.running
+    sampler.stop()
+    sampler._thread.join(1)
+    assert not sampler._thread.is_alive()
+    assert not sampler.running
+
+
+def test_report_lists_hottest_first(sampler):
+    sampler.counts.update({hot_function.__code__: 30, cold_function.__code__: 10})
+    sampler.samples, sampler.started = 40, time.monotonic() - 2
+    lines = sampler.report(5).splitlines()
+    assert lines[0].startswith("\033[2m[profile: 40 samples over 2.0 s, sampler cost")
+    assert "75.0%" in lines[1] and "hot_function" in lines[1]
+    assert "25.0%" in lines[2] and "cold_function" in lines[2]
+    assert sampler.report(1).count("\n") == 1
+
+
+def test_report_is_empty_without_samples(sampler):
+    assert sampler.report(5) == ""
+
+
+def test_describe_shows_qualname_and_location():
+    text = profiler.describe(hot_function.__code__)
+    assert "hot_function" in text
+    assert "tests/test_profiler.py:" in text
+
+
+def test_report_printed_under_tantrum():
+    sim = TantrumSimulator(mood="comic", profile_top=1)
+    sampler = sim.handler._sampler = profiler.Sampler()
+    sampler.counts[hot_function.__code__] = 3
+    result = sim.signal(signal.SIGTERM)
+    lines = result.output.strip("\n").splitlines()
+    assert len(lines) == 3
+    assert lines[0] == result.line.splitlines()[0]
+    assert "[profile:" in lines[1]
+    assert "hot_function" in lines[2]
+    assert sampler._stop.is_set()
+
+
+def test_no_report_when_silent():
+    sim = TantrumSimulator(mood="comic", silent=True)
+    sim.handler._sampler = profiler.Sampler()
+    sim.handler._sampler.counts[hot_function.__code__] = 3
+    assert sim.signal(signal.SIGTERM).output == ""
+
+
+def test_enable_starts_and_disable_stops_sampler():
+    _handler.enable(mood="comic", profile=True)
+    sampler = _handler._sampler
+    assert sampler is not None and sampler.running
+    _handler.disable()
+    assert _handler._sampler is None
+    assert not sampler.running
+
+
+def test_no_sampler_by_default():
+    _handler.enable(mood="comic")
+    assert _handler._sampler is None
+
+
+FORK_CHILD = """
+import os, time
+import tantrumpy
+from tantrumpy.handler import _handler
+
+def parent_work():
+    end = time.monotonic() + 0.5
+    while time.monotonic() < end:
+        pass
+
+def child_work():
+    end = time.monotonic() + 0.3
+    while time.monotonic() < end:
+        pass
+
+tantrumpy.enable(profile=True)
+parent_work()
+pid = os.fork()
+if pid == 0:
+    child_work()
+    sampler = _handler._sampler
+    names = {code.co_name for code in sampler.counts}
+    elapsed = time.monotonic() - sampler.started
+    print(sampler.running, "parent_work" in names, "child_work" in names, elapsed < 0.45)
+    os._exit(0)
+os.waitpid(pid, 0)
+"""
+
+
+@pytest.mark.skipif(not hasattr(os, "fork"), reason="needs os.fork")
+def test_forked_child_samples_only_itself(run_python):
+    out = run_python(FORK_CHILD, TANTRUMPY_SILENT="1")
+    assert out.stdout.split() == ["True", "False", "True", "True"], out.stderr
@@ -0,0 +1,102 @@
+"""Tests for tantrumpy/rng.py — private, seedable, fork-aware random streams."""
+
+import os
+import random
+
+import pytest
+
+import tantrumpy
+from tantrumpy import picker, rng
+from tantrumpy.handler import resolve_mood
+from tantrumpy.testing import TantrumSimulator
+
+needs_fork = pytest.mark.skipif(not hasattr(os, "fork"), reason="needs os.fork")
+
+
+def picks(n=12):
+    return [picker.pick("random") for _ in range(n)]
+
+
+def test_same_seed_same_picks():
+    rng.seed("42")
+    first = picks()
+    picker.reset()
+    rng.seed("42")
+    assert picks() == first
+
+
+def test_different_seeds_differ():
+    rng.seed("1")
+    first = picks()
+    picker.reset()
+    rng.seed("2")
+    assert picks() != first
+
+
+def test_global_random_is_left_alone():
+    random.seed(5)
+    expected = [random.random() for _ in range(3)]
+    random.seed(5)
+    picks()
+    resolve_mood("random")
+    picker.pick("generative")
+    assert [random.random() for _ in range(3)] == expected
+
+
+def test_simulator_seed_is_reproducible():
+    lines = [TantrumSimulator(seed=7).signal().line for _ in range(2)]
+    assert lines[0] == lines[1]
+
+
+def test_stream_names_fork_path():
+    rng.seed("42")
+    assert rng.stream() == "42"
+    rng._path = (0, 2)
+    assert rng.stream() == "42/0.2"
+    rng.seed("")
+    assert rng.stream() == ""
+
+
+FORK_SCRIPT = """
+import os, tantrumpy
+from tantrumpy import picker
+tantrumpy.enable(seed=SEED)
+picker.pick("comic")  # a queue the children inherit
+for _ in range(3):
+    r, w = os.pipe()
+    if os.fork() == 0:
+        os.write(w, "|".join(picker.pick("random") for _ in range(8)).encode())
+        os._exit(0)
+    os.close(w)
+    os.wait()
+    print(os.read(r, 65536).decode())
+"""
+
+
+def run_forks(run_python, seed):
+    out = run_python(FORK_SCRIPT.replace("SEED", repr(seed)), TANTRUMPY_SILENT="1")
+    assert out.returncode == 0, out.stderr
+    return out.stdout.splitlines()
+
+
+@needs_fork
+def test_forked_children_get_distinct_reproducible_streams(run_python):
+    children = run_forks(run_python, 42)
+    assert len(children) == 3 and len(set(children)) == 3
+    assert run_forks(run_python, 42) == children
+    assert run_forks(run_python, 43) != children
+
+
+@needs_fork
+def test_unseeded_children_differ(run_python):
+    children = run_forks(run_python, None)
+    assert len(set(children)) == 3
+
+
+def test_seed_from_environment(monkeypatch):
+    monkeypatch.setenv("TANTRUMPY_SEED", "99")
+    tantrumpy.enable()
+    assert rng.stream() == "99"
+    first = picks()
+    tantrumpy.enable()
+    assert picks() == first
@@ -0,0 +1,157 @@
+"""Tests for tantrumpy/supervisor.py and the `python -m tantrumpy run` CLI."""
+
+import os
+import signal
+import subprocess
+import sys
+import threading
+import time
+
+import pytest
+
+from tantrumpy import supervisor
+from tantrumpy.__main__ import main
+
+POSIX = pytest.mark.skipif(os.name != "posix", reason="POSIX signals only")
+
+
+@pytest.fixture(autouse=True)
+def quiet_env(monkeypatch):
+    for key in list(os.environ):
+        if key.startswith("TANTRUMPY_"):
+            monkeypatch.delenv(key)
+
+
+def python(code):
+    return [sys.executable, "-c", code]
+
+
+@pytest.mark.parametrize(
+    "returncode, mood",
+    [
+        (0, supervisor.EXIT_OK_MOOD),
+        (3, supervisor.EXIT_FAILED_MOOD),
+        (-signal.SIGINT, "frustrated"),
+        (-signal.SIGTERM, "dramatic"),
+        (-99, supervisor.UNKNOWN_SIGNAL_MOOD),
+    ],
+)
+def test_mood_for_status(returncode, mood):
+    assert supervisor.mood_for_status(returncode) == mood
+
+
+def test_exit_status_and_description():
+    assert supervisor.exit_status(0) == 0
+    assert supervisor.exit_status(7) == 7
+    assert supervisor.exit_status(-signal.SIGTERM) == 128 + signal.SIGTERM
+    assert supervisor.describe_status(2) == "child exited with status 2"
+    assert supervisor.describe_status(-signal.SIGTERM) == "child killed by SIGTERM"
+
+
+def test_run_propagates_exit_status_and_prints(capsys):
+    status = supervisor.run(python("raise SystemExit(3)"), verbose=True)
+    assert status == 3
+    err = capsys.readouterr().err
+    assert "[exit via: child exited with status 3]" in err
+
+
+def test_run_explicit_mood(capsys):
+    supervisor.run(python("pass"), mood="philosophy")
+    err = capsys.readouterr().err
+    assert err.strip().startswith("🧠")
+
+
+def test_flags_win_over_config_files(tmp_path, monkeypatch, capsys):
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / "pyproject.toml").write_text('[tool.tantrumpy]\nmood = "comic"\nverbose = true\n')
+    assert main(["run", "--mood", "rude", "--", *python("pass")]) == 0
+    assert capsys.readouterr().err.strip().startswith("💀")
+    main(["run", "--", *python("pass")])
+    err = capsys.readouterr().err.strip()
+    assert err.startswith("🎭") and "[exit via:" in err
+
+
+def test_run_silent(monkeypatch, capsys):
+    monkeypatch.setenv("TANTRUMPY_SILENT", "1")
+    assert supervisor.run(python("pass")) == 0
+    assert capsys.readouterr().err == ""
+
+
+def test_run_unknown_mood_keeps_status(capsys):
+    assert supervisor.run(python("raise SystemExit(5)"), mood="nope") == 5
+
+
+def test_run_missing_command(capsys):
+    assert supervisor.run(["/nonexistent/tantrumpy-test-binary"]) == 127
+    assert "cannot run" in capsys.readouterr().err
+
+
+def test_run_restores_signal_handlers():
+    before = {s: signal.getsignal(s) for s in supervisor.FORWARDED}
+    supervisor.run(python("pass"))
+    assert {s: signal.getsignal(s) for s in supervisor.FORWARDED} == before
+
+
+@POSIX
+def test_run_reports_terminating_signal(capsys):
+    status = supervisor.run(python("import os, signal; os.kill(os.getpid(), signal.SIGTERM)"))
+    assert status == 128 + signal.SIGTERM
+    assert capsys.readouterr().err.strip().startswith("🎬")
+
+
+def test_child_does_not_load_tantrumpy():
+    probe = "import sys; sys.exit(9 if 'tantrumpy' in sys.modules else 0)"
+    assert supervisor.run(python(probe)) == 0
+
+
+@POSIX
+def test_cli_forwards_sigterm_to_child(child_env):
+    child = "import time, sys; print('ready', flush=True); time.sleep(30)"
+    proc = subprocess.Popen(
+        [sys.executable, "-m", "tantrumpy", "run", "--verbose", "--", *python(child)],
+        env=child_env,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        text=True,
+    )
+    assert proc.stdout.readline().strip() == "ready"
+    time.sleep(0.05)
+    proc.send_signal(signal.SIGTERM)
+    _, err = proc.communicate(timeout=10)
+    assert proc.returncode == 128 + signal.SIGTERM
+    assert "[exit via: child killed by SIGTERM]" in err
+
+
+@POSIX
+def test_terminal_signals_are_not_forwarded_twice(monkeypatch, tmp_path):
+    """A terminal's Ctrl+C reaches the child directly; forwarding it would double it."""
+    monkeypatch.setattr(supervisor, "in_terminal_foreground", lambda: True)
+    ready = tmp_path / "pid"
+    child = (
+        "import os, signal, sys, time\n"
+        "got = []\n"
+        "signal.signal(signal.SIGINT, lambda *a: got.append(1))\n"
+        f"open({str(ready)!r}, 'w').write(str(os.getpid()))\n"
+        "time.sleep(1)\n"
+        "sys.exit(len(got))\n"
+    )
+
+    def ctrl_c():  # what the terminal does: SIGINT to every process in the group
+        while not ready.exists() or not ready.read_text():
+            time.sleep(0.01)
+        os.kill(int(ready.read_text()), signal.SIGINT)
+        os.kill(os.getpid(), signal.SIGINT)
+
+    threading.Thread(target=ctrl_c, daemon=True).start()
+    assert supervisor.run(python(child)) == 1
+
+
+def test_main_run_strips_separator(capsys):
+    assert main(["run", "--mood", "comic", "--", *python("raise SystemExit(4)")]) == 4
+
+
+def test_main_run_requires_command(capsys):
+    with pytest.raises(SystemExit) as exc:
+        main(["run"])
+    assert exc.value.code == 2
+    assert "missing command" in capsys.readouterr().err
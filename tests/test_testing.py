@@ -0,0 +1,150 @@
+"""Tests for tantrumpy/testing.py — in-process exit simulation."""
+
+import atexit
+import signal
+import sys
+from unittest.mock import patch
+
+import pytest
+
+import tantrumpy
+from tantrumpy import messages, picker
+from tantrumpy.handler import _handler
+from tantrumpy.messages import MoodBank
+from tantrumpy.testing import TantrumSimulator, _preserved_state, tantrum  # tantrum is a fixture
+
+
+def _globals():
+    return signal.getsignal(signal.SIGINT), signal.getsignal(signal.SIGTERM), sys.excepthook
+
+
+def test_signal_captures_line_and_status():
+    result = TantrumSimulator(mood="comic", verbose=True).signal(signal.SIGTERM)
+    assert result.trigger == "SIGTERM"
+    assert result.exit_status == 128 + signal.SIGTERM
+    assert result.reraised_signal == signal.SIGTERM
+    assert result.line.startswith(messages.EMOJI["comic"])
+    assert "[exit via: SIGTERM]" in result.line
+    assert result.output == f"\n{result.line}\n"
+
+
+def test_sigint_default():
+    result = TantrumSimulator(mood="rude").signal()
+    assert result.trigger == "SIGINT (Ctrl+C)"
+    assert result.exit_status == 130
+
+
+def test_unhandled_signal_rejected():
+    with pytest.raises(ValueError):
+        TantrumSimulator().signal(signal.SIGABRT)
+
+
+def test_atexit_keeps_exit_code():
+    result = TantrumSimulator(mood="cringe").atexit(3)
+    assert result.exit_status == 3
+    assert result.reraised_signal is None
+    assert result.line is not None
+
+
+def test_exception_prints_traceback_then_tantrum():
+    try:
+        raise KeyError("boom")
+    except KeyError as exc:
+        error = exc
+    result = TantrumSimulator(mood="dramatic").exception(error)
+    assert result.exit_status == 1
+    assert result.output.startswith("Traceback (most recent call last):")
+    assert result.output.rstrip().endswith(result.line)
+    assert result.output.index("KeyError") < result.output.index(result.line)
+
+
+def test_compact_traceback_setting():
+    def recurse(n):
+        return recurse(n + 1)
+
+    try:
+        recurse(0)
+    except RecursionError as exc:
+        error = exc
+    result = TantrumSimulator(compact_traceback=True).exception(error)
+    assert "more times]" in result.output
+    assert result.line is not None
+
+
+def test_silent_prints_nothing():
+    result = TantrumSimulator(silent=True).signal(signal.SIGINT)
+    assert result.output == ""
+    assert result.line is None
+    assert result.reraised_signal == signal.SIGINT
+
+
+def test_unknown_setting_rejected():
+    with pytest.raises(TypeError):
+        TantrumSimulator(moood="comic")
+
+
+def test_fresh_false_fires_once_per_process():
+    sim = TantrumSimulator(mood="comic")
+    first = sim.exception(RuntimeError("x"))
+    second = sim.atexit(1, fresh=False)
+    assert first.line is not None
+    assert second.line is None
+    assert second.output == ""
+
+
+def test_custom_banks():
+    custom = {"boss": {"emoji": "📋", "messages": ["See me in my office."]}}
+    result = TantrumSimulator(mood="boss", custom=custom).atexit()
+    assert result.line == "📋 See me in my office."
+
+
+def test_config_never_read_from_environment(monkeypatch):
+    monkeypatch.setenv("TANTRUMPY_SILENT", "1")
+    monkeypatch.setenv("TANTRUMPY_MOOD", "rude")
+    result = TantrumSimulator(mood="comic").atexit()
+    assert result.line.startswith(messages.EMOJI["comic"])
+
+
+def test_global_hooks_untouched():
+    before = _globals()
+    with patch("atexit.register") as register, patch("signal.signal") as set_signal:
+        sim = TantrumSimulator(mood="philosophy")
+        sim.signal(signal.SIGINT)
+        sim.signal(signal.SIGTERM)
+        sim.exception(ValueError("v"))
+        sim.atexit()
+    assert _globals() == before
+    register.assert_not_called()
+    set_signal.assert_not_called()
+
+
+def test_thousands_of_scenarios_in_process():
+    sim = TantrumSimulator()
+    triggers = [
+        lambda: sim.signal(signal.SIGINT),
+        lambda: sim.signal(signal.SIGTERM),
+        lambda: sim.atexit(0),
+        lambda: sim.exception(ValueError("v")),
+    ]
+    results = [triggers[i % 4]() for i in range(2000)]
+    assert all(result.line for result in results)
+
+
+def test_pytest_fixture(tantrum):  # noqa: F811
+    tantrum.configure(mood="frustrated")
+    assert tantrum.atexit().line.startswith(messages.EMOJI["frustrated"])
+
+
+def test_fixture_state_leaves_the_real_handler_alone():
+    tantrumpy.enable(mood="comic", seed=3)
+    hooks = _globals()
+    expected = [picker.pick("random") for _ in range(5)]
+
+    tantrumpy.enable(mood="comic", seed=3)  # start the same stream again
+    with _preserved_state():
+        sim = TantrumSimulator(seed=9, custom={"office": MoodBank(emoji="💼", messages=["x"])})
+        sim.signal()
+        sim.atexit()
+    assert _globals() == hooks and _handler._active
+    assert "office" not in picker.all_moods()
+    assert [picker.pick("random") for _ in range(5)] == expected
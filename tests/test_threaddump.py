@@ -0,0 +1,86 @@
+"""Tests for tantrumpy/threaddump.py — grouped all-threads dump."""
+
+import io
+import signal
+import threading
+
+import pytest
+
+from tantrumpy import threaddump
+from tantrumpy.testing import TantrumSimulator
+
+
+def parked_in_wait(event):
+    event.wait()
+
+
+@pytest.fixture
+def parked():
+    """Five threads blocked on the same line, named parked-0 .. parked-4."""
+    event = threading.Event()
+    threads = [
+        threading.Thread(target=parked_in_wait, args=(event,), name=f"parked-{i}", daemon=True)
+        for i in range(5)
+    ]
+    for t in threads:
+        t.start()
+    yield threads
+    event.set()
+    for t in threads:
+        t.join(1)
+
+
+def test_identical_stacks_are_grouped(parked):
+    groups = threaddump.capture()
+    names = [sorted(names) for _, names in groups]
+    assert [f"parked-{i}" for i in range(5)] in names
+    assert groups[0][1][0].startswith("parked-")  # the largest group comes first
+
+
+def test_own_frames_and_threads_are_left_out(parked):
+    for stack, names in threaddump.capture():
+        assert not any(code.co_filename.startswith(threaddump._PACKAGE_DIR) for code, _ in stack)
+        assert not any(name.startswith("tantrumpy-") for name in names)
+
+
+def test_render_names_the_group_and_trims_frames(parked):
+    text = "".join(threaddump.render(threaddump.capture(), frames=1))
+    header, *rest = text.splitlines()
+    assert header.startswith("\033[2m[threads: ")
+    line = next(line for line in rest if "parked-0" in line or "parked-1" in line)
+    assert line.strip().startswith("5 × wait via parked_in_wait")
+    assert "+2 more]" in line
+    assert "more frames" in text
+
+
+def test_entry_skips_threading_machinery(parked):
+    stack = next(stack for stack, names in threaddump.capture() if names[0].startswith("parked"))
+    assert threaddump._entry(stack) == "parked_in_wait"
+
+
+def test_write_is_capped(parked):
+    buf = io.StringIO()
+    threaddump.write(buf, frames=50, max_bytes=120)
+    assert len(buf.getvalue().encode()) < 200
+    assert "[... output truncated at 120 bytes]" in buf.getvalue()
+
+
+def test_dump_follows_signal_tantrum(parked):
+    result = TantrumSimulator(mood="comic", thread_dump=True).signal(signal.SIGTERM)
+    before, _, after = result.output.partition(result.line)
+    assert "[threads: " in after and "[threads: " not in before
+    assert "via parked_in_wait" in after
+    # The simulator's own frames are dropped: the main thread ends in this test
+    assert "test_dump_follows_signal_tantrum" in after
+
+
+def test_no_dump_for_exceptions_or_atexit(parked):
+    sim = TantrumSimulator(mood="comic", thread_dump=True)
+    assert "[threads: " not in sim.exception(ValueError("x")).output
+    assert "[threads: " not in sim.atexit(0).output
+
+
+def test_no_dump_by_default_or_when_silent(parked):
+    assert "[threads: " not in TantrumSimulator(mood="comic").signal(signal.SIGINT).output
+    quiet = TantrumSimulator(mood="comic", silent=True, thread_dump=True)
+    assert quiet.signal(signal.SIGINT).output == ""
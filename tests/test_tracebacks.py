@@ -0,0 +1,149 @@
+"""Tests for tantrumpy/tracebacks.py — compact, capped traceback rendering."""
+
+import io
+import sys
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from tantrumpy import tracebacks
+from tantrumpy.handler import _handler
+
+
+def render(exc, max_bytes=1_000_000):
+    buf = io.StringIO()
+    tracebacks.write_exception(exc, buf, max_bytes)
+    return buf.getvalue()
+
+
+def catch(func, *args):
+    try:
+        func(*args)
+    except BaseException as exc:  # noqa: BLE001 - tests capture everything
+        return exc
+    raise AssertionError("expected an exception")
+
+
+def recurse(n):
+    return recurse(n + 1)
+
+
+def ping(n):
+    return pong(n)
+
+
+def pong(n):
+    return ping(n)
+
+
+def test_plain_exception_matches_traceback_shape():
+    def boom():
+        raise ValueError("bad value")
+
+    out = render(catch(boom))
+    assert out.startswith("Traceback (most recent call last):\n")
+    assert 'in boom\n    raise ValueError("bad value")\n' in out
+    assert out.endswith("ValueError: bad value\n")
+
+
+def test_direct_recursion_collapses_to_one_note():
+    out = render(catch(recurse, 0))
+    assert out.count("in recurse") == 2
+    assert "[previous frame repeated" in out
+    assert out.rstrip().endswith("RecursionError: maximum recursion depth exceeded")
+    assert len(out) < 2000
+
+
+def test_mutual_recursion_collapses_by_period():
+    out = render(catch(ping, 0))
+    assert "[previous 2 frames repeated" in out
+    assert out.count("in ping") == 2
+
+
+def test_frames_after_a_cycle_are_still_shown():
+    def leave(n):
+        if n == 0:
+            raise KeyError("bottom")
+        return leave(n - 1)
+
+    def outer():
+        return leave(50)
+
+    out = render(catch(outer))
+    assert "in outer" in out
+    assert "[previous frame repeated 48 more times]" in out
+    assert out.endswith("KeyError: 'bottom'\n")
+
+
+def test_chained_exceptions_render_oldest_first():
+    def chained():
+        try:
+            raise ValueError("inner")
+        except ValueError as exc:
+            raise KeyError("outer") from exc
+
+    out = render(catch(chained))
+    assert out.index("ValueError: inner") < out.index("direct cause") < out.index("KeyError")
+
+
+def test_implicit_context_and_cycles_terminate():
+    first = ValueError("first")
+    second = KeyError("second")
+    second.__context__ = first
+    first.__context__ = second  # pathological cycle
+    out = render(second)
+    assert "another exception occurred" in out
+    assert out.count("KeyError") == 1
+
+
+@pytest.mark.skipif(sys.version_info < (3, 11), reason="ExceptionGroup is 3.11+")
+def test_exception_group_summarized_by_type():
+    group = ExceptionGroup("many", [ValueError(1), ValueError(2), KeyError(3)])  # noqa: F821
+    out = render(group)
+    assert "+-- 3 sub-exceptions: 2 × ValueError, 1 × KeyError" in out
+
+
+def test_output_capped_in_bytes():
+    big = catch(recurse, 0)
+    out = render(ValueError("x" * 100_000).with_traceback(big.__traceback__), 500)
+    assert len(out.encode()) < 600
+    assert out.endswith("[... output truncated at 500 bytes]\n")
+
+
+def test_handler_uses_compact_renderer_and_fires_last(monkeypatch, capsys):
+    monkeypatch.delenv("TANTRUMPY_SILENT", raising=False)
+    _handler.enable(mood="comic", compact_traceback=True)
+    original = MagicMock()
+    monkeypatch.setattr(sys, "__excepthook__", original)  # Python's own hook, not the app's
+    _handler._orig_excepthook = original
+
+    exc = catch(recurse, 0)
+    _handler._on_exception(type(exc), exc, exc.__traceback__)
+
+    original.assert_not_called()
+    err = capsys.readouterr().err
+    assert "[previous frame repeated" in err
+    assert err.rstrip().splitlines()[-1].startswith("🎭")
+
+
+def test_handler_chains_to_an_app_excepthook(monkeypatch, capsys):
+    monkeypatch.delenv("TANTRUMPY_SILENT", raising=False)
+    _handler.enable(mood="comic", compact_traceback=True)
+    reporter = MagicMock()  # e.g. an error reporter installed before enable()
+    _handler._orig_excepthook = reporter
+    exc = catch(recurse, 0)
+    _handler._on_exception(type(exc), exc, exc.__traceback__)
+    reporter.assert_called_once_with(type(exc), exc, exc.__traceback__)
+    assert "[previous frame repeated" not in capsys.readouterr().err
+
+
+def test_handler_falls_back_to_original_hook_on_render_error(monkeypatch):
+    _handler.enable(mood="comic", compact_traceback=True)
+    original = MagicMock()
+    monkeypatch.setattr(sys, "__excepthook__", original)
+    _handler._orig_excepthook = original
+    exc = ValueError("x")
+    with patch.object(tracebacks, "write_exception", side_effect=RuntimeError):
+        with patch.object(_handler, "_fire"):
+            _handler._on_exception(ValueError, exc, None)
+    original.assert_called_once_with(ValueError, exc, None)
@@ -0,0 +1,178 @@
+"""Tests for tantrumpy/width.py — display width and fitting lines to a terminal."""
+
+import io
+import os
+import signal
+from unittest.mock import patch
+
+import pytest
+
+import tantrumpy
+from tantrumpy import picker, width
+from tantrumpy.handler import _handler, render
+from tantrumpy.testing import TantrumSimulator
+
+LONG = "This is a really long message that goes on and on beyond any reasonable pane width"
+CJK = "漢字のメッセージはとても長いですね、本当に長いです。"
+
+
+@pytest.mark.parametrize(
+    "text, expected",
+    [
+        ("hello", 5),
+        ("", 0),
+        ("漢字", 4),
+        ("🎭 boo", 6),
+        ("e\u0301", 1),  # combining acute accent
+        ("\u2764\ufe0f", 2),  # heart + emoji presentation selector
+        ("\U0001f469\u200d\U0001f4bb", 2),  # ZWJ sequence draws as one glyph
+        ("a\tb", 2),  # control characters take no columns
+    ],
+)
+def test_text_width(text, expected):
+    assert width.text_width(text) == expected
+
+
+def test_ascii_skips_per_character_lookup():
+    with patch.object(width, "char_width", side_effect=AssertionError("slow path")):
+        assert width.text_width(LONG) == len(LONG)
+
+
+def test_truncate():
+    assert width.truncate("short", 10) == "short"
+    assert width.truncate("hello world", 8) == "hello w…"
+    cut = width.truncate(CJK, 11)
+    assert cut.endswith("…")
+    assert width.text_width(cut) <= 11
+
+
+def test_wrap_respects_width_and_keeps_words():
+    lines = width.wrap(LONG, 30)
+    assert all(width.text_width(line) <= 30 for line in lines)
+    assert " ".join(lines) == LONG
+
+
+def test_wrap_splits_words_wider_than_a_line():
+    lines = width.wrap(CJK, 20)
+    assert "".join(lines) == CJK
+    assert all(width.text_width(line) <= 20 for line in lines)
+
+
+def test_fit_leaves_short_lines_alone():
+    assert width.fit("short", 5, 3, 10, 80) == (["short"], True)
+
+
+def test_fit_unbounded_or_none_is_untouched():
+    assert width.fit(LONG, len(LONG), 3, 0, 0) == ([LONG], True)
+    assert width.fit(LONG, len(LONG), 3, 0, 40, "none") == ([LONG], True)
+
+
+def test_fit_truncate_keeps_one_line():
+    parts, inline = width.fit(LONG, len(LONG), 3, 0, 40, "truncate")
+    assert len(parts) == 1 and parts[0].endswith("…")
+    assert width.text_width(parts[0]) <= 37
+    assert inline
+
+
+def test_fit_moves_tag_that_does_not_fit_to_its_own_line():
+    parts, inline = width.fit(LONG, len(LONG), 3, 30, 40, "truncate")
+    assert not inline
+
+
+def test_terminal_columns_cached_until_invalidated():
+    stream = io.StringIO()
+    with patch("os.get_terminal_size", return_value=os.terminal_size((100, 40))) as size:
+        with patch.dict(os.environ, {"COLUMNS": ""}):
+            assert width.terminal_columns(stream) == 0  # StringIO has no fileno
+            width.invalidate()
+            stream.fileno = lambda: 2  # type: ignore[method-assign]
+            assert width.terminal_columns(stream) == 100
+            assert width.terminal_columns(stream) == 100
+            assert size.call_count == 1
+            width.invalidate()
+            width.terminal_columns(stream)
+            assert size.call_count == 2
+
+
+def test_terminal_columns_uses_the_columns_read_at_enable():
+    stream = io.StringIO()
+    stream.fileno = lambda: 2  # type: ignore[method-assign]
+    with patch("os.get_terminal_size", return_value=os.terminal_size((100, 40))):
+        with patch.dict(os.environ, {"COLUMNS": "60"}):
+            _handler.enable(mood="comic")
+        with patch.dict(os.environ, {"COLUMNS": "90"}):
+            assert width.terminal_columns(stream) == 60
+
+
+def test_pick_entry_measures_the_picked_message():
+    tantrumpy.add_messages("wide", [CJK, "plain"], emoji="📋")
+    seen = dict(picker.pick_entry("wide", tantrumpy._custom_banks) for _ in range(2))
+    assert seen == {CJK: width.text_width(CJK), "plain": 5}
+
+
+def test_fitted_tantrum_only_looks_widths_up():
+    tantrumpy.add_messages("wide", [CJK], emoji="📋")
+    sim = TantrumSimulator(mood="random", custom=tantrumpy._custom_banks, columns=200)
+    with patch.object(width, "char_width", side_effect=AssertionError("measured at fire")):
+        for _ in range(20):
+            assert sim.signal().line is not None
+
+
+def test_simulator_line_keeps_wrapped_lines_and_tag():
+    tantrumpy.add_messages("long", [LONG], emoji="📋")
+    sim = TantrumSimulator(mood="long", custom=tantrumpy._custom_banks, columns=40, verbose=True)
+    line = sim.signal(signal.SIGTERM).line
+    assert line is not None and len(line.split("\n")) > 2
+    assert "[exit via: SIGTERM]" in line and "width" in line
+
+
+def test_render_wraps_under_the_message():
+    tantrumpy.add_messages("long", [LONG], emoji="📋")
+    line = render("long", "SIGTERM", True, tantrumpy._custom_banks, columns=40)
+    lines = line.split("\n")
+    assert lines[0].startswith("📋 This")
+    assert all(part.startswith("   ") for part in lines[1:])
+    assert "[exit via: SIGTERM]" in lines[-1]
+
+
+def test_render_without_columns_is_one_line():
+    tantrumpy.add_messages("long", [LONG], emoji="📋")
+    assert "\n" not in render("long", "SIGTERM", True, tantrumpy._custom_banks)
+
+
+def test_simulator_honours_columns_setting():
+    tantrumpy.add_messages("long", [LONG], emoji="📋")
+    sim = TantrumSimulator(mood="long", custom=tantrumpy._custom_banks, columns=40)
+    output = sim.atexit().output.strip("\n")
+    assert len(output.splitlines()) > 1
+    sim.configure(mood="long", custom=tantrumpy._custom_banks, columns=40, overflow="truncate")
+    assert sim.atexit().output.strip("\n").endswith("…")
+
+
+@pytest.mark.skipif(not hasattr(signal, "SIGWINCH"), reason="no SIGWINCH on this platform")
+def test_sigwinch_invalidates_and_chains():
+    calls = []
+    original = signal.signal(signal.SIGWINCH, lambda signum, frame: calls.append(signum))
+    try:
+        with patch.object(_handler, "_tracks_terminal_width", return_value=True):
+            _handler.enable(mood="comic")
+            _handler.enable(mood="comic")  # re-enabling must not chain to itself
+        width._columns = 123
+        signal.raise_signal(signal.SIGWINCH)
+        assert width._columns is None
+        assert calls == [signal.SIGWINCH]
+        _handler.disable()
+        assert signal.getsignal(signal.SIGWINCH) is not _handler._on_sigwinch
+    finally:
+        signal.signal(signal.SIGWINCH, original)
+
+
+@pytest.mark.skipif(not hasattr(signal, "SIGWINCH"), reason="no SIGWINCH on this platform")
+def test_sigwinch_left_alone_unless_fitting_to_a_terminal():
+    before = signal.getsignal(signal.SIGWINCH)
+    _handler.enable(mood="comic")  # stderr is captured by pytest, not a terminal
+    assert signal.getsignal(signal.SIGWINCH) == before
+    with patch("sys.stderr.isatty", return_value=True):
+        assert _handler._tracks_terminal_width()
+        _handler._config = _handler._config._replace(overflow="none")
+        assert not _handler._tracks_terminal_width()